@@ -0,0 +1,275 @@
+"""
+Scenario benchmarks for the space shooter
+Runs Game headless through fixed scenarios and reports throughput, frame-time percentiles
+and peak memory as JSON; --compare flags regressions against a stored baseline.
+Each scenario is run --repeat times and every metric is the median over those runs.
+"""
+
+import os
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+import numpy as np
+
+# Keep stdout pure JSON
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import pygame
+
+from main import Config, Game, KeyState, MeteorSize
+
+# Relative change per metric that counts as a regression, and absolute changes below which
+# a metric is never flagged whatever the relative change. Throughput drifts by 10-15% between
+# runs of identical code on a busy machine, and tail latencies by more
+TOLERANCES = {"ticks_per_sec": 0.20, "frame_ms.p95": 0.35, "frame_ms.p99": 0.50, "peak_alloc_kb": 0.10}
+NOISE_FLOORS = {"ticks_per_sec": 0.0, "frame_ms.p95": 1.0, "frame_ms.p99": 2.0, "peak_alloc_kb": 64.0}
+
+
+# ==================== SCENARIOS ====================
+def _keep_alive(game):
+    # A fresh shield every step absorbs collisions so the run never ends mid-benchmark
+    game.has_shield = True
+    game.shield_active = True
+    game.shield_timer = 5.0
+
+
+def _fill_meteors(game):
+    game._spawn_meteors(game.max_meteors - len(game.meteors))
+
+
+def setup_menu(game):
+    game.state = "menu"
+    game.player = None
+    game.meteor_pool.clear()
+    game.particles.clear()
+
+
+def tick_menu(game, tick):
+    pass
+
+
+def setup_playing(game):
+    game.start_game()
+
+
+def tick_meteors(game, tick):
+    _keep_alive(game)
+    _fill_meteors(game)
+
+
+def setup_meteor_storm(game):
+    game.set_meteor_storm(True)
+    game.start_game()
+
+
+def tick_meteor_storm(game, tick):
+    # No shield survives hundreds of meteors, so a crash just resumes the same run
+    _keep_alive(game)
+    game.state = "playing"
+    _fill_meteors(game)
+
+
+def setup_bullet_storm(game):
+    game.start_game()
+    game.weapon_level = 3
+
+
+def tick_bullet_storm(game, tick):
+    _keep_alive(game)
+    _fill_meteors(game)
+    if tick % 4 == 0:
+        game.player.shoot(game.weapon_level, game.bullet_pool)
+
+
+def setup_magnet(game):
+    game.start_game()
+    game.has_magnet = True
+
+
+def tick_magnet(game, tick):
+    _keep_alive(game)
+    game.has_magnet = True
+    while len(game.coins) < 200:
+        x = game.rng.randint(0, Config.WINDOW_WIDTH)
+        y = game.rng.randint(0, Config.WINDOW_HEIGHT // 2)
+        game.coin_pool.spawn(x, y, value=1, is_score=game.rng.random() < 0.3, rng=game.rng)
+
+
+def tick_explosions(game, tick):
+    _keep_alive(game)
+    for _ in range(3):
+        x = game.rng.randint(0, Config.WINDOW_WIDTH)
+        y = game.rng.randint(0, Config.WINDOW_HEIGHT)
+        game._create_explosion(x, y, MeteorSize.LARGE, is_large=True)
+
+
+def setup_paused(game):
+    game.start_game()
+    _fill_meteors(game)
+    game.state = "paused"
+
+
+SCENARIOS = {
+    "menu_idle": (setup_menu, tick_menu),
+    "meteors_12": (setup_playing, tick_meteors),
+    "meteor_storm": (setup_meteor_storm, tick_meteor_storm),
+    "bullet_storm": (setup_bullet_storm, tick_bullet_storm),
+    "magnet_200_coins": (setup_magnet, tick_magnet),
+    "explosion_chain": (setup_playing, tick_explosions),
+    "pause_overlay": (setup_paused, tick_menu),
+}
+
+
+# ==================== RUNNER ====================
+def _run_ticks(game, tick_fn, ticks, frame_times=None):
+    step = 1.0 / Config.SIMULATION_HZ
+    keys = KeyState()
+    for tick in range(ticks):
+        start = time.perf_counter()
+        tick_fn(game, tick)
+        game._store_previous_positions()
+        game.update(step, keys)
+        game.render_alpha = 1.0
+        game.draw(keys)
+        if frame_times is not None:
+            frame_times.append(time.perf_counter() - start)
+
+
+def _finish_loading(game):
+    """Let the asset preloader finish, so its worker thread does not overlap a timed run"""
+    game._poll_assets()  # Starts the worker
+    while not game.preloader.finished:
+        time.sleep(0.005)
+        game._poll_assets()
+
+
+def run_scenario(game, name, ticks, warmup, seed):
+    setup, tick_fn = SCENARIOS[name]
+    game.session_rng.seed(seed)
+    game.set_meteor_storm(False)  # Only the meteor_storm setup lifts the gameplay limits
+    setup(game)
+    _run_ticks(game, tick_fn, warmup)
+
+    frame_times = []
+    start = time.perf_counter()
+    _run_ticks(game, tick_fn, ticks, frame_times)
+    elapsed = time.perf_counter() - start
+    frame_ms = np.array(frame_times) * 1000.0
+    p50, p95, p99 = np.percentile(frame_ms, (50, 95, 99))
+
+    # Memory is measured on a separate, shorter pass so tracing does not skew the timings
+    setup(game)
+    tracemalloc.start()
+    _run_ticks(game, tick_fn, max(ticks // 4, 1))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "ticks": ticks,
+        "ticks_per_sec": ticks / elapsed if elapsed > 0 else 0.0,
+        "frame_ms": {"mean": float(frame_ms.mean()), "p50": float(p50), "p95": float(p95),
+                     "p99": float(p99), "max": float(frame_ms.max())},
+        "peak_alloc_kb": peak / 1024.0,
+        "particles": len(game.particles),
+        "meteors": len(game.meteors),
+        "bullets": len(game.bullets),
+        "coins": len(game.coins)
+    }
+
+
+def _median(values):
+    if isinstance(values[0], dict):
+        return {key: _median([value[key] for value in values]) for key in values[0]}
+    return float(np.median(values)) if isinstance(values[0], float) else values[0]
+
+
+def run_repeated(game, name, ticks, warmup, seed, repeat):
+    """run_scenario `repeat` times; every metric is the median over the runs"""
+    runs = [run_scenario(game, name, ticks, warmup, seed) for _ in range(repeat)]
+    result = _median(runs)
+    result["repeat"] = repeat
+    return result
+
+
+def compare(results, baseline, tolerance=None):
+    """Regressions of `results` against `baseline`
+
+    A metric regresses when it got worse by more than its tolerance (a fraction; `tolerance`
+    overrides TOLERANCES for every metric) and by more than its NOISE_FLOORS amount.
+    """
+    regressions = []
+    for name, current in results["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if base is None:
+            continue
+        checks = (
+            ("ticks_per_sec", current["ticks_per_sec"], base["ticks_per_sec"], False),
+            ("frame_ms.p95", current["frame_ms"]["p95"], base["frame_ms"]["p95"], True),
+            ("frame_ms.p99", current["frame_ms"]["p99"], base["frame_ms"]["p99"], True),
+            ("peak_alloc_kb", current["peak_alloc_kb"], base["peak_alloc_kb"], True),
+        )
+        for metric, value, reference, higher_is_worse in checks:
+            if reference <= 0:
+                continue
+            worse_by = (value - reference) if higher_is_worse else (reference - value)
+            change = (value - reference) / reference
+            limit = TOLERANCES[metric] if tolerance is None else tolerance
+            if worse_by / reference > limit and worse_by > NOISE_FLOORS[metric]:
+                regressions.append({"scenario": name, "metric": metric, "baseline": reference,
+                                    "current": value, "change": change})
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless scenario benchmarks for Infinite Orbit")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="scenario to run (repeatable, default: all)")
+    parser.add_argument("--ticks", type=int, default=600, help="timed simulation steps per scenario")
+    parser.add_argument("--warmup", type=int, default=120, help="untimed steps before each scenario")
+    parser.add_argument("--seed", type=int, default=1234, help="seed for every scenario")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per scenario; the reported metrics are medians")
+    parser.add_argument("--out", metavar="PATH", help="also write the results to PATH")
+    parser.add_argument("--compare", metavar="BASELINE", help="flag regressions against a baseline JSON")
+    parser.add_argument("--tolerance", type=float, default=None,
+                        help="allowed relative slowdown for every metric (default: per-metric TOLERANCES)")
+    args = parser.parse_args()
+
+    game = Game(headless=True, seed=args.seed)
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "ticks": args.ticks,
+            "warmup": args.warmup,
+            "repeat": args.repeat,
+            "seed": args.seed
+        },
+        "scenarios": {}
+    }
+    _finish_loading(game)
+    for name in args.scenario or SCENARIOS:
+        results["scenarios"][name] = run_repeated(game, name, args.ticks, args.warmup, args.seed,
+                                                  max(args.repeat, 1))
+    pygame.quit()
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(results, f, indent=2)
+
+    status = 0
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        results["regressions"] = compare(results, baseline, args.tolerance)
+        status = 1 if results["regressions"] else 0
+    print(json.dumps(results, indent=2))
+    sys.exit(status)
+
+
+if __name__ == "__main__":
+    main()
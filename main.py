@@ -4,21 +4,36 @@ Modern Space Shooter Game - Professional Architecture
 """
 
 import os
+import argparse
+import json
 import random
 import math
+import time
+import queue
+import threading
+import struct
+import zlib
+import hashlib
+import itertools
+import sqlite3
+import numpy as np
 import pygame
 from pygame import Vector2
 from enum import Enum
+from collections import OrderedDict, namedtuple
 
 # ==================== GLOBAL CONSTANTS ====================
 WINDOW_WIDTH = 1280
 WINDOW_HEIGHT = 720
+GAME_DIR = os.path.dirname(os.path.abspath(__file__))
 
 # ==================== CONSTANTS ====================
 class Config:
     WINDOW_WIDTH = WINDOW_WIDTH
     WINDOW_HEIGHT = WINDOW_HEIGHT
-    FPS = 60
+    FPS = 60  # Render rate cap (can be lowered, e.g. 30 on weak kiosks, without changing gameplay)
+    SIMULATION_HZ = 120  # Fixed simulation step rate
+    MAX_SIM_STEPS_PER_FRAME = 8  # Drop simulation backlog beyond this (avoids the spiral of death)
     
     # Player
     PLAYER_WIDTH = 56
@@ -31,9 +46,12 @@ class Config:
     
     # Meteor
     MAX_METEORS_ON_SCREEN = 12
+    METEOR_STORM_MAX_METEORS = 400  # On-screen limit in meteor-storm mode (--meteor-storm)
+    METEOR_STORM_SPAWN_BATCH = 25  # Meteor-storm spawns are this many times larger
     SPAWN_INTERVAL_BASE = 1500  # ms
     SPAWN_INTERVAL_MIN = 300
     TARGETED_METEOR_CHANCE = 0.3  # 30% tracking meteors
+    METEOR_CAPACITY = 1024  # Fixed capacity of the meteor arrays (meteor storms included)
     
     # Bullet
     BULLET_SPEED = 10
@@ -56,6 +74,53 @@ class Config:
     CYBERPUNK_DARK = (0, 0, 0)  # Deep black
     NEON_ORANGE = (255, 100, 0)  # Brighter orange
 
+    # Bloom
+    BLOOM_SCALE = 0.5  # Glow buffer resolution relative to the screen (lower = cheaper, softer)
+    BLOOM_STRENGTH = 1.0  # Glow intensity, 0 disables bloom
+    
+    # Presentation
+    DIRTY_RECTS = False  # Present only the changed screen regions instead of flipping the whole frame
+    DIRTY_RECT_MAX_COVERAGE = 0.5  # Flip anyway once the changed regions cover this fraction of the screen
+    
+    # World layer
+    WORLD_MARGIN = 32  # Offscreen border around the world layer; screen shake is clamped to it
+    
+    # Background
+    STAR_LAYER_COUNTS = (80, 40, 20)  # Stars per screen height in each parallax layer (near to far)
+
+    # Render caches
+    TEXT_CACHE_MAX_BYTES = 8 * 1024 * 1024  # Rendered text surface budget
+
+    # Particles
+    MAX_PARTICLES = 16384  # Fixed capacity of the particle arrays
+    PARTICLE_ALPHA_STEPS = 16  # Fade levels baked per particle sprite (memory vs. fade smoothness)
+    
+    # Rocket sprites (quality vs. memory; odd angle counts include the upright frame)
+    ROCKET_ANGLE_STEPS = 31  # Pre-rotated rocket frames over ±MAX_ROTATION (1° apart)
+    FLAME_ANGLE_STEPS = 11  # Flame rotation frames over ±MAX_ROTATION
+    FLAME_SPEED_STEPS = 16  # Flame size/alpha buckets over the speed ratio
+
+    # Assets
+    ASSET_DIRS = (".", GAME_DIR)  # Image search path: working directory first, then the game folder
+    ASSET_CACHE_DIR = os.path.join(GAME_DIR, ".asset_cache")  # Pre-scaled pixels, keyed by content hash
+
+    # Audio
+    AUDIO_FREQUENCY = 44100
+    AUDIO_BUFFER = 512  # Mixer buffer in samples (smaller = lower output latency, too small crackles)
+    AUDIO_VOICES = {"sfx": 6, "ui": 2}  # Mixer channels reserved per sound category
+    AUDIO_BUS_VOLUMES = {"music": 1.0, "sfx": 1.0, "ui": 1.0}  # Scaled by the master volume
+
+    # Persistence
+    SAVE_PATH = os.path.join(GAME_DIR, "save.json")  # Profile snapshot; its journal sits next to it
+    SAVE_COALESCE_SECONDS = 0.25  # Changes this soon after the first one share a single write
+    SAVE_JOURNAL_LIMIT = 64  # Journal entries before they are folded into the snapshot
+    HISTORY_PATH = os.path.join(GAME_DIR, "runs.sqlite3")  # Every finished run, for the leaderboard
+    LEADERBOARD_SIZE = 10  # Runs on the death screen board
+
+    # Profiler
+    PROFILER_HISTORY = 240  # Frames kept in the timing ring buffer
+    PROFILER_REFRESH_FRAMES = 15  # Overlay panel is re-rendered this often
+
 
 class MeteorSize(Enum):
     SMALL = 0
@@ -68,6 +133,21 @@ METEOR_CONFIGS = {
     MeteorSize.MEDIUM: {"size": 48, "speed_mult": 1.0, "score": 5, "color": (100, 100, 100)},  # Dark gray
     MeteorSize.LARGE: {"size": 64, "speed_mult": 0.6, "score": 10, "color": (80, 80, 80)}  # Darker gray
 }
+METEOR_SIZES = tuple(MeteorSize)  # Index -> size, as stored in the meteor arrays
+
+
+# Explosion debris colors followed by the white hit spark
+PARTICLE_PALETTE = [
+    (180, 100, 220),  # Purple debris
+    (200, 60, 240),   # Bright purple
+    (255, 150, 0),    # Orange sparks
+    (255, 200, 100),  # Bright orange
+    (150, 150, 200),  # Blue-gray debris
+    (100, 100, 150),  # Dark debris
+    (255, 255, 255)   # Hit spark
+]
+EXPLOSION_COLORS = range(6)
+HIT_SPARK_COLOR = 6
 
 
 class Language(Enum):
@@ -102,7 +182,9 @@ TRANSLATIONS = {
         "decrease_volume": "-",
         "triple_shot": "Üçlü Ateş",
         "continue_game": "Oyuna Devam Et",
-        "paused": "DURAKLATILDI"
+        "paused": "DURAKLATILDI",
+        "loading": "Yükleniyor",
+        "leaderboard": "EN İYİ 10"
     },
     Language.ENGLISH: {
         "shop": "SHOP",
@@ -130,14 +212,25 @@ TRANSLATIONS = {
         "decrease_volume": "-",
         "triple_shot": "Triple Shot",
         "continue_game": "Continue Game",
-        "paused": "PAUSED"
+        "paused": "PAUSED",
+        "loading": "Loading",
+        "leaderboard": "TOP 10"
     }
 }
 
+# Equipment shop prices, in display order
+SHOP_ITEMS = {
+    "shield": 300,
+    "magnet": 80,
+    "speed": 150,
+    "triple": 500
+}
+
 
 # ==================== UTILITY CLASSES ====================
 class ScreenShake:
-    def __init__(self):
+    def __init__(self, rng=None):
+        self.rng = rng or random
         self.intensity = 0.0
         self.x = 0.0
         self.y = 0.0
@@ -147,9 +240,9 @@ class ScreenShake:
     
     def update(self, dt):
         if self.intensity > 0:
-            self.x = random.uniform(-self.intensity, self.intensity)
-            self.y = random.uniform(-self.intensity, self.intensity)
-            self.intensity *= 0.9
+            self.x = self.rng.uniform(-self.intensity, self.intensity)
+            self.y = self.rng.uniform(-self.intensity, self.intensity)
+            self.intensity *= 0.9 ** (dt * 60)
             if self.intensity < 0.1:
                 self.intensity = 0
                 self.x = 0
@@ -158,343 +251,2330 @@ class ScreenShake:
             self.x = 0
             self.y = 0
     
-    def get_offset(self):
-        return (int(self.x), int(self.y))
+    def get_offset(self, limit=None):
+        """Current shake in whole pixels, optionally clamped to ±limit"""
+        if limit is None:
+            return (int(self.x), int(self.y))
+        return (max(-limit, min(limit, int(self.x))), max(-limit, min(limit, int(self.y))))
 
 
 class ParallaxBackground:
-    def __init__(self, width, height):
+    """Three starfield layers, each pre-rendered into a pair of wrapping strips
+
+    A layer scrolls its two screen-sized strips down (two colorkeyed blits per layer) and
+    only redraws a strip, with fresh random stars, when it has scrolled off the bottom.
+    The cost per frame does not depend on the star count.
+    """
+    STAR_COLORKEY = (0, 0, 0)
+
+    def __init__(self, width, height, rng=None, star_counts=Config.STAR_LAYER_COUNTS):
         self.width = width
         self.height = height
+        # Cosmetic randomness gets its own stream so it never shifts gameplay randomness
+        self.rng = random.Random((rng or random).getrandbits(32))
+        self.star_counts = star_counts
         self.layers = []
         self._create_layers()
     
     def _create_layers(self):
-        for layer_idx in range(3):
-            layer_stars = []
-            star_count = 80 if layer_idx == 0 else (40 if layer_idx == 1 else 20)
-            for _ in range(star_count):
-                layer_stars.append({
-                    "x": random.randint(0, self.width - 1),
-                    "y": random.randint(0, self.height - 1),
-                    "speed": (0.3 + layer_idx * 0.2) * (1.0 + layer_idx * 0.5),
-                    "size": max(1, 3 - layer_idx),
-                    "brightness": 200 - layer_idx * 50
-                })
-            self.layers.append(layer_stars)
+        for layer_idx, star_count in enumerate(self.star_counts):
+            brightness = 200 - layer_idx * 50
+            if layer_idx == 0:
+                color = (brightness, brightness, 255)
+            elif layer_idx == 1:
+                color = (brightness, brightness, brightness)
+            else:
+                color = (brightness // 2, brightness // 2, brightness // 2)
+            layer = {
+                "speed": (0.3 + layer_idx * 0.2) * (1.0 + layer_idx * 0.5),
+                "size": max(1, 3 - layer_idx),
+                "color": color,
+                "count": star_count,
+                "offset": 0.0,  # Y position of the lower strip
+                "strips": []  # [lower, upper]
+            }
+            for _ in range(2):
+                strip = pygame.Surface((self.width, self.height))
+                strip.set_colorkey(self.STAR_COLORKEY, pygame.RLEACCEL)  # RLE skips the empty sky
+                self._scatter_stars(strip, layer)
+                layer["strips"].append(strip)
+            self.layers.append(layer)
+    
+    def _scatter_stars(self, strip, layer):
+        strip.fill(self.STAR_COLORKEY)
+        size = layer["size"]
+        for _ in range(layer["count"]):
+            # Keep whole stars inside the strip so they do not get cut at the seam
+            x = self.rng.randint(0, self.width - 1)
+            y = self.rng.randint(size, self.height - 1 - size)
+            pygame.draw.circle(strip, layer["color"], (x, y), size)
     
     def update(self, dt):
         for layer in self.layers:
-            for star in layer:
-                star["y"] += star["speed"] * dt * 60
-                if star["y"] > self.height:
-                    star["y"] = 0
-                    star["x"] = random.randint(0, self.width - 1)
+            layer["offset"] += layer["speed"] * dt * 60
+            if layer["offset"] >= self.height:
+                # The lower strip left the screen: refill it and move it on top
+                layer["offset"] -= self.height
+                lower, upper = layer["strips"]
+                self._scatter_stars(lower, layer)
+                layer["strips"] = [upper, lower]
     
-    def draw(self, surface):
-        for layer_idx, layer in enumerate(self.layers):
-            for star in layer:
-                brightness = star["brightness"]
-                if layer_idx == 0:
-                    color = (brightness, brightness, 255)
-                elif layer_idx == 1:
-                    color = (brightness, brightness, brightness)
-                else:
-                    color = (brightness // 2, brightness // 2, brightness // 2)
-                pygame.draw.circle(
-                    surface,
-                    color,
-                    (int(star["x"]), int(star["y"])),
-                    star["size"]
-                )
+    def draw(self, surface, origin=(0, 0)):
+        """Draw the strips with their top-left corner at origin on surface"""
+        x, y = origin
+        for layer in self.layers:
+            offset = y + int(layer["offset"])
+            lower, upper = layer["strips"]
+            surface.blit(lower, (x, offset))
+            surface.blit(upper, (x, offset - self.height))
 
 
-# ==================== GAME OBJECTS ====================
-class Particle:
-    def __init__(self, x, y, vx, vy, color, life=0.8, size=None):
-        """Particle for explosion effects with enhanced visuals"""
-        self.x = x
-        self.y = y
-        self.vx = vx
-        self.vy = vy
-        self.color = color
-        self.life = life
-        self.max_life = life
-        self.size = size or random.randint(3, 8)
-    
-    def update(self, dt):
-        self.x += self.vx * dt * 60
-        self.y += self.vy * dt * 60
-        self.vy += 50 * dt  # Gravity
-        self.life -= dt
-    
-    def is_alive(self):
-        return self.life > 0
-    
-    def draw(self, surface, offset=(0, 0)):
-        """Draw particle with glow effect and smooth fade"""
-        alpha = int(255 * (self.life / self.max_life))
-        
-        # Glow effect for particles
-        glow_size = self.size + 2
-        glow_surf = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
-        glow_alpha = int(alpha * 0.4)
-        glow_color = (*self.color, glow_alpha)
-        pygame.draw.circle(glow_surf, glow_color, (glow_size, glow_size), glow_size)
-        surface.blit(glow_surf, (int(self.x - glow_size + offset[0]), int(self.y - glow_size + offset[1])))
-        
-        # Main particle
-        color_with_alpha = (*self.color, alpha)
-        particle_surf = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-        pygame.draw.circle(particle_surf, color_with_alpha, (self.size, self.size), self.size)
-        surface.blit(particle_surf, (int(self.x - self.size + offset[0]), int(self.y - self.size + offset[1])))
+class SweepAndPrune:
+    """Sort-and-sweep broadphase over entity rects for rect-overlap and radius queries
 
+    Results come back in the order the entities were indexed, so they match a linear scan of
+    the source list exactly. rebuild() only takes the list; nothing is sorted until a query
+    needs it. Batches of fewer than MIN_PAIRS rect x entity pairs are scanned in C
+    (Rect.collidelistall). Larger batches sort the boxes by their left edge once, and each
+    query rect only gets the full AABB test against the run of boxes whose left edge can
+    reach it, so the work grows with the near pairs instead of rects x entities.
+    """
+    MIN_PAIRS = 6144  # Rect x entity pairs from which a query sweeps instead of scanning
 
-class Coin:
-    def __init__(self, x, y, value=1, is_score=False):
-        # Boyut puanın değerine göre değişir
-        if is_score:
-            if value == 3:
-                size = 28  # 3 puan - büyük
-            elif value == 2:
-                size = 22  # 2 puan - orta
-            else:  # 1 puan
-                size = 16  # 1 puan - küçük
+    def __init__(self):
+        self.rebuild(())
+
+    def rebuild(self, entities, rects=None, boxes=None):
+        """Index `entities` in the given order
+
+        `rects` defaults to each entity's rect. Callers that keep positions in arrays can
+        pass `boxes`: (x, y, width, height) rows as an int64 array, or a function returning
+        them, used instead of reading the rects for a sweep.
+        """
+        self.entities = list(entities)
+        self.rects = rects
+        self.boxes = boxes
+        self.sorted = None  # Entities as an object array, box order by left edge and sorted box edges
+        self.removed = set()  # id() of removed entities
+
+    def clear(self):
+        self.rebuild(())
+
+    def remove(self, entity):
+        """Leave `entity` out of all later query results"""
+        self.removed.add(id(entity))
+
+    def _rects(self):
+        if self.rects is None:
+            self.rects = [entity.rect for entity in self.entities]
+        return self.rects
+
+    def _sorted_boxes(self):
+        if self.sorted is None:
+            boxes = self.boxes() if callable(self.boxes) else self.boxes
+            if boxes is None:
+                boxes = np.fromiter(itertools.chain.from_iterable(self._rects()), dtype=np.int64,
+                                    count=4 * len(self.entities)).reshape(-1, 4)
+            self.boxes = boxes
+            left, top, width, height = boxes.T
+            # Empty boxes never collide, so they stay out of the sweep
+            order = np.flatnonzero((width > 0) & (height > 0))
+            order = order[np.argsort(left[order], kind="stable")]
+            objects = np.fromiter(self.entities, dtype=object, count=len(self.entities))
+            self.sorted = (objects, order, left[order], top[order], (left + width)[order],
+                           (top + height)[order], int(width.max(initial=0)))
+        return self.sorted
+
+    def _sweep(self, rects):
+        """Rect rows and entity indices of the overlapping pairs, sorted by row, then index"""
+        _, order, left, top, right, bottom, widest = self._sorted_boxes()
+        x, y, w, h = np.fromiter(itertools.chain.from_iterable(rects), dtype=np.int64,
+                                 count=4 * len(rects)).reshape(-1, 4).T
+        # A box can only reach a rect if its left edge lies in (rect.left - widest, rect.right)
+        start = np.searchsorted(left, x - widest, side="right")
+        counts = np.searchsorted(left, x + w, side="left") - start
+        # Same rule as Rect.colliderect, which never lets an empty rect collide
+        counts[(counts < 0) | (w <= 0) | (h <= 0)] = 0
+        total = int(counts.sum())
+        rows = np.repeat(np.arange(len(rects)), counts)
+        pos = np.repeat(start - (np.cumsum(counts) - counts), counts) + np.arange(total)  # Sorted positions
+        overlap = ((np.repeat(x, counts) < right[pos]) & (np.repeat(y, counts) < bottom[pos])
+                   & (np.repeat(y + h, counts) > top[pos]))
+        rows, found = rows[overlap], order[pos[overlap]]
+        ranked = np.lexsort((found, rows))
+        return rows[ranked], found[ranked]
+
+    def query_rects(self, rects):
+        """Entities overlapping each of `rects` (one list per rect, in index order)"""
+        if not rects:
+            return []
+        entities = self.entities
+        if len(entities) * len(rects) < self.MIN_PAIRS:
+            own = self._rects()
+            hits = [[entities[i] for i in rect.collidelistall(own)] for rect in rects]
         else:
-            size = 20  # Altın - normal boyut
-        
-        self.rect = pygame.Rect(0, 0, size, size)
-        self.rect.center = (x, y)
-        self.value = value
-        self.is_score = is_score  # True = puan, False = altın
-        
-        # Puanlar için hareket yok (sadece aşağı düşer), Altınlar için random hareket
-        if is_score:
-            self.vx = 0  # Puanlar yatay hareket etmez
-            self.vy = 3.0  # Puanlar sadece aşağı düşer (başlangıç hızı artırıldı)
+            rows, found = self._sweep(rects)
+            flat = self.sorted[0][found].tolist()
+            ends = np.cumsum(np.bincount(rows, minlength=len(rects))).tolist()
+            hits = [flat[start:end] for start, end in zip([0] + ends[:-1], ends)]
+        removed = self.removed
+        if removed:
+            hits = [[entity for entity in found if id(entity) not in removed] for found in hits]
+        return hits
+
+    def query_rect(self, rect):
+        """Entities overlapping `rect`, in index order"""
+        return self.query_rects((rect,))[0]
+
+    def query_radius(self, x, y, radius):
+        """Entities whose rect center lies strictly within `radius` of (x, y), in index order
+
+        Like the rect queries, entities with an empty rect never match.
+        """
+        # Such a center lies inside the circle's bounding square, so its rect overlaps the square
+        square = pygame.Rect(x - radius, y - radius, 2 * radius + 1, 2 * radius + 1)
+        entities, removed = self.entities, self.removed
+        radius_sq = radius * radius
+        if len(entities) < self.MIN_PAIRS:
+            rects = self._rects()
+            found = [i for i in square.collidelistall(rects)
+                     if (rects[i].centerx - x) ** 2 + (rects[i].centery - y) ** 2 < radius_sq]
         else:
-            self.vx = random.uniform(-2.0, 2.0)  # Altınlar sağa-sola hareket eder
-            self.vy = random.uniform(-2.0, 2.0)
-        
-        self.spawn_time = pygame.time.get_ticks()
-        self.sparkle = 0.0
-    
-    def update(self, dt, player_pos=None, magnet_active=False):
-        age = (pygame.time.get_ticks() - self.spawn_time) / 1000.0
-        
-        # Puanlar için farklı hareket - sadece aşağı düşer (sağ-sol sallanma yok)
-        if self.is_score:
-            # Mıknatıs aktifse puanları rokete çek
-            if magnet_active and player_pos:
-                dx = player_pos[0] - self.rect.centerx
-                dy = player_pos[1] - self.rect.centery
-                distance = math.sqrt(dx**2 + dy**2)
-                if distance > 0:
-                    magnet_force = 5.0 / max(distance / 100, 1.0)  # Puanlar için daha güçlü çekim
-                    self.rect.centerx += (dx / distance) * magnet_force * dt * 60
-                    self.rect.centery += (dy / distance) * magnet_force * dt * 60
+            _, candidates = self._sweep((square,))
+            box = self.boxes[candidates]
+            dx = box[:, 0] + box[:, 2] // 2 - x
+            dy = box[:, 1] + box[:, 3] // 2 - y
+            found = candidates[dx * dx + dy * dy < radius_sq].tolist()
+        return [entities[i] for i in found if id(entities[i]) not in removed]
+
+
+class EntityPool:
+    """Recycling storage for one entity type with generational handles
+
+    Live entities sit in `active` in spawn order. kill() only flags an entity; flush() drops
+    the flagged ones in a single pass at the end of the tick and keeps them on a free list,
+    so spawn() re-initialises an old instance (via its reset()) instead of allocating.
+    A handle is (slot, generation) and stops resolving once its entity is recycled.
+    """
+    def __init__(self, entity_type):
+        self.entity_type = entity_type
+        self.active = []
+        self.slots = []  # Every instance ever created, indexed by entity.slot
+        self.free = []
+        self.dead = 0  # Entities killed since the last flush
+
+    def __len__(self):
+        return len(self.active)
+
+    def __iter__(self):
+        return iter(self.active)
+
+    def spawn(self, *args, **kwargs):
+        if self.free:
+            entity = self.free.pop()
+            entity.reset(*args, **kwargs)
+        else:
+            entity = self.entity_type(*args, **kwargs)
+            entity.slot = len(self.slots)
+            entity.generation = 0
+            self.slots.append(entity)
+        entity.generation += 1
+        entity.alive = True
+        self.active.append(entity)
+        return entity
+
+    def kill(self, entity):
+        """Flag `entity` for removal at the next flush (safe to call twice)"""
+        if entity.alive:
+            entity.alive = False
+            self.dead += 1
+
+    def flush(self):
+        if not self.dead:
+            return
+        survivors = []
+        for entity in self.active:
+            if entity.alive:
+                survivors.append(entity)
             else:
-                # Puanlar: Sadece aşağı düşer, yerçekimi etkisi
-                self.vy += 0.3 * dt * 60  # Yerçekimi ivmesi
-                self.rect.centerx += self.vx * dt * 60
-                self.rect.centery += self.vy * dt * 60
-                self.vx *= 0.98  # Hafif yatay yavaşlama
+                self.free.append(entity)
+        self.active[:] = survivors  # In place, so references to `active` stay valid
+        self.dead = 0
+
+    def clear(self):
+        for entity in self.active:
+            entity.alive = False
+            self.free.append(entity)
+        self.active.clear()
+        self.dead = 0
+
+    def handle(self, entity):
+        return (entity.slot, entity.generation)
+
+    def get(self, handle):
+        """The live entity behind `handle`, or None if it has been killed or recycled"""
+        slot, generation = handle
+        entity = self.slots[slot]
+        if entity.alive and entity.generation == generation:
+            return entity
+        return None
+
+
+# ==================== RENDER CACHES ====================
+# Logical image name -> (file names to search for, size the image is pre-scaled to)
+ASSET_MANIFEST = {
+    "rocket": (("newrocket.png",), (Config.PLAYER_WIDTH, Config.PLAYER_HEIGHT)),
+    # Covers the largest thrust frame (0.7 x 2.0 of the player), so frames are only ever scaled down
+    "flame": (("alev.png",), (Config.PLAYER_WIDTH, Config.PLAYER_HEIGHT * 2)),
+    "flag_tr": (("turk_bayragi.png",), (40, 40)),
+    "flag_en": (("ingilizce_bayragi.png",), (40, 40)),
+    "settings_icon": (("settings.png",), (60, 60)),
+}
+# Logical sound name -> (file names to search for, category, priority); see SoundBank
+SOUND_MANIFEST = {
+    "hit": (("hit.wav",), "sfx", 10),
+    "start": (("start.wav",), "ui", 5),
+}
+MUSIC_FILES = ("music.mp3", "music.ogg")  # Streamed by pygame.mixer.music, nothing to decode up front
+
+
+class AssetManager:
+    """Images and sounds by logical name, loaded on first use or handed over by a preloader
+
+    Decoded and scaled images are kept in a disk cache of raw RGBA pixels named after a hash
+    of the source file and target size, so warm starts skip PNG decoding and smoothscale;
+    editing an image simply produces a new key. A missing cache directory or an unwritable
+    one only costs the cold path. decode() and decode_sound() do not touch the display and
+    may run on a worker thread; adopt() (display-format conversion) belongs to the main thread.
+    """
+    MAGIC = b"ORBA"
+    VERSION = 1
+    HEADER = struct.Struct("<4sBHH")  # magic, version, width, height
+
+    def __init__(self, manifest=ASSET_MANIFEST, sound_manifest=SOUND_MANIFEST, search_dirs=Config.ASSET_DIRS,
+                 cache_dir=Config.ASSET_CACHE_DIR):
+        self.manifest = manifest
+        self.sound_manifest = sound_manifest
+        self.search_dirs = search_dirs
+        self.cache_dir = cache_dir
+        self.images = {}  # name -> surface, or None when the image is missing or unreadable
+        self.sounds = {}  # name -> pygame Sound, or None
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def find(self, filenames):
+        """Path of the first of `filenames` that exists along the search path, or None"""
+        for filename in filenames:
+            for directory in self.search_dirs:
+                path = os.path.join(directory, filename)
+                if os.path.isfile(path):
+                    return path
+        return None
+
+    def image(self, name):
+        """Display-format surface for `name`, or None if it cannot be loaded"""
+        if name not in self.images:
+            self.adopt(name, self.decode(name))
+        return self.images[name]
+
+    def peek(self, name):
+        """Image `name` if it has been loaded already, without loading it"""
+        return self.images.get(name)
+
+    def adopt(self, name, surface):
+        """Store a decoded image in display format (an image loaded meanwhile is kept)"""
+        if name not in self.images:
+            self.images[name] = surface.convert_alpha() if surface is not None else None
+        return self.images[name]
+
+    def sound(self, name):
+        if name not in self.sounds:
+            self.sounds[name] = self.decode_sound(name)
+        return self.sounds[name]
+
+    def decode_sound(self, name):
+        """Sound for `name`, or None without the file or an audio device"""
+        path = self.find(self.sound_manifest[name][0])
+        if path is None or not pygame.mixer.get_init():
+            return None
+        try:
+            return pygame.mixer.Sound(path)
+        except pygame.error:
+            return None
+
+    def _cache_path(self, name, data, size):
+        key = hashlib.sha1(data + self.HEADER.pack(self.MAGIC, self.VERSION, size[0], size[1])).hexdigest()
+        return os.path.join(self.cache_dir, f"{name}-{key[:16]}.px")
+
+    def decode(self, name):
+        """Scaled RGBA surface for image `name` (not yet in display format), or None"""
+        path = self.find(self.manifest[name][0])
+        if path is None:
+            return None
+        size = self.manifest[name][1]
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        cache_path = self._cache_path(name, data, size)
+        surface = self._read_cache(cache_path, size)
+        if surface is not None:
+            self.cache_hits += 1
         else:
-            # Altınlar: Sallanarak hareket eder (eski davranış)
-            swing_amount = math.sin(age * 3) * 2.0
-            
-            if magnet_active and player_pos:
-                dx = player_pos[0] - self.rect.centerx
-                dy = player_pos[1] - self.rect.centery
-                distance = math.sqrt(dx**2 + dy**2)
-                if distance > 0:
-                    magnet_force = 3.0 / max(distance / 100, 1.0)
-                    self.rect.centerx += (dx / distance) * magnet_force * dt * 60
-                    self.rect.centery += (dy / distance) * magnet_force * dt * 60
+            self.cache_misses += 1
+            try:
+                surface = pygame.image.load(path)  # From the path, so SDL reads it without the GIL
+            except pygame.error:
+                return None
+            # 32-bit RGBA without asking the display for its format (smoothscale needs 32 bits)
+            surface = pygame.image.frombytes(pygame.image.tobytes(surface, "RGBA"), surface.get_size(),
+                                             "RGBA")
+            surface = pygame.transform.smoothscale(surface, size)
+            self._write_cache(name, cache_path, surface)
+        return surface
+
+    def _read_cache(self, cache_path, size):
+        try:
+            with open(cache_path, "rb") as f:
+                data = f.read()
+            magic, version, width, height = self.HEADER.unpack_from(data)
+        except (OSError, struct.error):
+            return None
+        if magic != self.MAGIC or version != self.VERSION or (width, height) != tuple(size):
+            return None
+        pixels = data[self.HEADER.size:]
+        if len(pixels) != width * height * 4:
+            return None
+        return pygame.image.frombytes(pixels, (width, height), "RGBA")
+
+    def _write_cache(self, name, cache_path, surface):
+        width, height = surface.get_size()
+        data = (self.HEADER.pack(self.MAGIC, self.VERSION, width, height)
+                + pygame.image.tobytes(surface, "RGBA"))
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Entries for older versions of the same image are dropped
+            for entry in os.listdir(self.cache_dir):
+                if entry.startswith(name + "-") and entry.endswith(".px"):
+                    os.remove(os.path.join(self.cache_dir, entry))
+            temp_path = cache_path + ".tmp"
+            with open(temp_path, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, cache_path)  # Readers never see a half-written entry
+        except OSError:
+            pass
+
+    def stats(self):
+        return {
+            "images": sum(1 for image in self.images.values() if image is not None),
+            "sounds": sum(1 for sound in self.sounds.values() if sound is not None),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses
+        }
+
+
+class AssetPreloader:
+    """Decodes every manifest image (and the given sounds) on a daemon worker thread
+
+    The worker only decodes; poll() runs on the main thread and hands the finished assets
+    to the AssetManager, so the display is never touched from the worker. Anything the
+    game needs before the worker got to it is simply loaded on demand.
+    """
+    def __init__(self, assets, sound_names=()):
+        self.assets = assets
+        self.jobs = [("image", name) for name in assets.manifest] + [("sound", name) for name in sound_names]
+        self.results = queue.Queue()
+        self.done = 0
+        self.started = False
+        self.thread = threading.Thread(target=self._work, name="asset-preloader", daemon=True)
+
+    def start(self):
+        if not self.started:
+            self.started = True
+            self.thread.start()
+
+    def _work(self):
+        for kind, name in self.jobs:
+            try:
+                if kind == "image":
+                    value = self.assets.decode(name)
                 else:
-                    self.rect.centerx += swing_amount * dt * 60
-                    self.rect.centerx += self.vx * dt * 60
-                    self.rect.centery += self.vy * dt * 60
-                    self.vx *= 0.95
-                    self.vy *= 0.95
+                    value = self.assets.decode_sound(name)
+            except Exception:
+                value = None  # A broken asset must not stall the rest of the queue
+            self.results.put((kind, name, value))
+
+    @property
+    def progress(self):
+        return self.done / len(self.jobs) if self.jobs else 1.0
+
+    @property
+    def finished(self):
+        return self.done >= len(self.jobs)
+
+    def poll(self):
+        """Hand the assets finished so far to the manager; returns their (kind, name) pairs"""
+        adopted = []
+        while True:
+            try:
+                kind, name, value = self.results.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "image":
+                self.assets.adopt(name, value)
             else:
-                self.rect.centerx += swing_amount * dt * 60
-                self.rect.centerx += self.vx * dt * 60
-                self.rect.centery += self.vy * dt * 60
-                self.vx *= 0.95
-                self.vy *= 0.95
-        
-        self.sparkle = (math.sin(age * 8) + 1) / 2
-    
-    def draw(self, surface, offset=(0, 0)):
-        coin_size = self.rect.width // 2
-        glow_size = int(coin_size * (1.0 + self.sparkle * 0.5))
-        glow_alpha = int(150 * self.sparkle)
-        
-        # Farklı renk: Altın için sarı, Puan için değere göre farklı renkler
-        if self.is_score:
-            # Puan renkleri value'ya göre
-            if self.value == 3:
-                main_color = (200, 100, 255)  # Mor - 3 puan
-                inner_color = (230, 180, 255)
-            elif self.value == 2:
-                main_color = (100, 200, 255)  # Mavi - 2 puan
-                inner_color = (180, 230, 255)
-            else:  # 1 puan
-                main_color = (255, 220, 100)  # Sarı - 1 puan
-                inner_color = (255, 240, 180)
-        else:
-            main_color = Config.GOLD_COLOR  # Sarı - altın
-            inner_color = (255, 255, 200)
-        
-        glow_surf = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surf, (main_color[0], main_color[1], main_color[2], glow_alpha),
-                          (glow_size, glow_size), glow_size)
-        surface.blit(glow_surf, (self.rect.centerx - glow_size + offset[0], self.rect.centery - glow_size + offset[1]))
-        
-        pygame.draw.circle(surface, main_color,
-                          (self.rect.centerx + offset[0], self.rect.centery + offset[1]), coin_size)
-        pygame.draw.circle(surface, inner_color,
-                          (self.rect.centerx + offset[0], self.rect.centery + offset[1]), coin_size - 2)
-        
-        value_font = pygame.font.SysFont("consolas", 12, bold=True)
-        value_text = value_font.render(str(self.value), True, (0, 0, 0))
-        value_rect = value_text.get_rect(center=(self.rect.centerx + offset[0], self.rect.centery + offset[1]))
-        surface.blit(value_text, value_rect)
+                self.assets.sounds.setdefault(name, value)
+            adopted.append((kind, name))
+            self.done += 1
+        return adopted
 
 
-class Bullet:
-    def __init__(self, x, y):
-        self.rect = pygame.Rect(x - Config.BULLET_WIDTH // 2, y, Config.BULLET_WIDTH, Config.BULLET_HEIGHT)
-    
-    def update(self, dt):
-        self.rect.y -= Config.BULLET_SPEED * dt * 60
-    
-    def is_off_screen(self):
-        return self.rect.y < -Config.BULLET_HEIGHT
-    
-    def draw(self, surface, offset=(0, 0)):
-        glow_surf = pygame.Surface((self.rect.width + 6, self.rect.height + 6), pygame.SRCALPHA)
-        pygame.draw.ellipse(glow_surf, (Config.NEON_CYAN[0], Config.NEON_CYAN[1], Config.NEON_CYAN[2], 100),
-                           glow_surf.get_rect())
-        surface.blit(glow_surf, (self.rect.x - 3 + offset[0], self.rect.y - 3 + offset[1]))
-        pygame.draw.ellipse(surface, Config.NEON_CYAN,
-                          (self.rect.x + offset[0], self.rect.y + offset[1], self.rect.width, self.rect.height))
+class SoundBank:
+    """Preloaded sound cues on reserved mixer voices per category, with voice stealing
 
+    Each category owns a fixed range of mixer channels, so a burst of one kind of sound can
+    never starve another. A cue that finds all of its category's voices busy takes over the
+    one playing the lowest-priority (then oldest) cue, or is dropped when every busy voice
+    outranks it. Volume is master x bus, with the music stream on its own "music" bus.
+    pygame.mixer.Sound decodes the whole file and converts it to the mixer format when it is
+    loaded, so triggering a cue never decodes or resamples.
+    """
+    def __init__(self, manifest=SOUND_MANIFEST, voices=Config.AUDIO_VOICES,
+                 bus_volumes=Config.AUDIO_BUS_VOLUMES):
+        self.manifest = manifest
+        self.voices = dict(voices)
+        self.bus_volumes = dict(bus_volumes)
+        self.master = 1.0
+        self.buffer = Config.AUDIO_BUFFER
+        self.cues = {}  # name -> (Sound, category, priority)
+        self.channels = {}  # category -> [Channel], filled by open()
+        self.voice_cues = {}  # category -> [(priority, trigger serial) of the cue last started per voice]
+        self.serial = 0
+        self.played = dict.fromkeys(self.voices, 0)
+        self.stolen = dict.fromkeys(self.voices, 0)
+        self.dropped = dict.fromkeys(self.voices, 0)
+        self.trigger_total = 0.0  # Seconds spent in play(), for the trigger latency stats
+        self.trigger_max = 0.0
 
-class Meteor:
-    def __init__(self, x, y, size_type, target_pos=None):
-        config = METEOR_CONFIGS[size_type]
-        self.size_type = size_type
-        self.rect = pygame.Rect(x, y, config["size"], config["size"])
-        self.score_value = config["score"]
-        self.color = config["color"]
-        
-        # Health system based on size
+    def pre_init(self, buffer=Config.AUDIO_BUFFER):
+        """Mixer settings for the next pygame.init; must be called before it"""
+        self.buffer = buffer
+        pygame.mixer.pre_init(Config.AUDIO_FREQUENCY, -16, 2, buffer)
+
+    def open(self):
+        """Reserve the category voices once the mixer is up; False without an audio device"""
+        if not pygame.mixer.get_init():
+            return False
+        total = sum(self.voices.values())
+        pygame.mixer.set_num_channels(total)
+        pygame.mixer.set_reserved(total)  # Plain Sound.play() can never take a category voice
+        first = 0
+        for category, count in self.voices.items():
+            self.channels[category] = [pygame.mixer.Channel(index) for index in range(first, first + count)]
+            self.voice_cues[category] = [(0, 0)] * count
+            first += count
+        self._apply_volumes()
+        return True
+
+    def add(self, name, sound):
+        """Register a decoded sound under its manifest category and priority"""
+        if sound is not None:
+            _, category, priority = self.manifest[name]
+            sound.set_volume(1.0)  # Loudness comes from the channel (master x bus) only
+            self.cues[name] = (sound, category, priority)
+
+    def play(self, name):
+        """Trigger cue `name`; the channel it plays on, or None if it is missing or dropped"""
+        cue = self.cues.get(name)
+        if cue is None or not self.channels:
+            return None
+        start = time.perf_counter()
+        sound, category, priority = cue
+        channels = self.channels[category]
+        voice_cues = self.voice_cues[category]
+        index = self._free_voice(channels)
+        if index is None:
+            index = min(range(len(channels)), key=voice_cues.__getitem__)
+            if voice_cues[index][0] > priority:
+                self.dropped[category] += 1
+                return None
+            self.stolen[category] += 1
+        channel = channels[index]
+        channel.play(sound)  # Replaces whatever the voice was playing
+        channel.set_volume(self.volume(category))
+        self.serial += 1
+        voice_cues[index] = (priority, self.serial)
+        self.played[category] += 1
+        elapsed = time.perf_counter() - start
+        self.trigger_total += elapsed
+        self.trigger_max = max(self.trigger_max, elapsed)
+        return channel
+
+    @staticmethod
+    def _free_voice(channels):
+        for index, channel in enumerate(channels):
+            if not channel.get_busy():
+                return index
+        return None
+
+    def play_music(self, path):
+        """Stream `path` in a loop on the music bus"""
+        if not pygame.mixer.get_init():
+            return
+        try:
+            pygame.mixer.music.load(path)
+            pygame.mixer.music.set_volume(self.volume("music"))
+            pygame.mixer.music.play(-1)
+        except pygame.error:
+            pass
+
+    def volume(self, bus):
+        return self.master * self.bus_volumes.get(bus, 1.0)
+
+    def set_master(self, volume):
+        self.master = min(1.0, max(0.0, volume))
+        self._apply_volumes()
+
+    def set_bus(self, bus, volume):
+        self.bus_volumes[bus] = min(1.0, max(0.0, volume))
+        self._apply_volumes()
+
+    def _apply_volumes(self):
+        for category, channels in self.channels.items():
+            for channel in channels:
+                channel.set_volume(self.volume(category))
+        if pygame.mixer.get_init():
+            pygame.mixer.music.set_volume(self.volume("music"))
+
+    def stats(self):
+        """Voice usage per category and latency: time spent triggering, plus the mixer buffer"""
+        mixer = pygame.mixer.get_init()
+        played = sum(self.played.values())
+        return {
+            "open": bool(self.channels),
+            "buffer_ms": self.buffer * 1000.0 / mixer[0] if mixer else None,
+            "trigger_ms": {"mean": self.trigger_total * 1000.0 / played if played else 0.0,
+                           "max": self.trigger_max * 1000.0},
+            "played": self.played,
+            "stolen": self.stolen,
+            "dropped": self.dropped
+        }
+
+
+class FontRegistry:
+    """Resolves each (face, size, bold) font once and keeps it for the whole run"""
+    def __init__(self, face="consolas"):
+        self.face = face
+        self.fonts = {}
+
+    def get(self, size, bold=True, face=None):
+        key = (face or self.face, int(size), bold)
+        font = self.fonts.get(key)
+        if font is None:
+            font = pygame.font.SysFont(key[0], key[1], bold=bold)
+            self.fonts[key] = font
+        return font
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces with a bounded memory budget"""
+    def __init__(self, fonts, max_bytes=Config.TEXT_CACHE_MAX_BYTES):
+        self.fonts = fonts
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # key -> (surface, bytes)
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, text, size, color, language=None, bold=True):
+        key = (text, int(size), tuple(color), language, bold)
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        surf = self.fonts.get(size, bold).render(text, True, color)
+        surf_bytes = surf.get_width() * surf.get_height() * surf.get_bytesize()
+        self.entries[key] = (surf, surf_bytes)
+        self.bytes_used += surf_bytes
+
+        # Evict least recently used surfaces until we are back under budget
+        while self.bytes_used > self.max_bytes and len(self.entries) > 1:
+            _, (_, old_bytes) = self.entries.popitem(last=False)
+            self.bytes_used -= old_bytes
+            self.evictions += 1
+        return surf
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes_used = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": len(self.entries),
+            "bytes": self.bytes_used,
+            "max_bytes": self.max_bytes
+        }
+
+
+class MeteorAtlas:
+    """All meteor looks (every size and damage level) pre-rendered into one sprite sheet"""
+    PADDING = 2  # Glow extends this far past the meteor radius
+
+    def __init__(self):
+        self.surface = None
+        self.cells = {}  # (size_type, health, max_health) -> area rect in the atlas
+
+    @staticmethod
+    def _max_health(size_type):
         if size_type == MeteorSize.LARGE:
-            self.health = 4  # Büyük: 4 vuruş
-            self.max_health = 4
+            return 4
         elif size_type == MeteorSize.MEDIUM:
-            self.health = 2  # Orta: 2 vuruş
-            self.max_health = 2
-        else:  # SMALL
-            self.health = 1  # Küçük: 1 vuruş
-            self.max_health = 1
-        
-        base_speed = (2.5 + random.uniform(0, 1.5)) * config["speed_mult"]
-        
-        if target_pos and random.random() < Config.TARGETED_METEOR_CHANCE:
-            target_vector = Vector2(target_pos[0] - x, target_pos[1] - y)
-            if target_vector.length() > 0:
-                target_vector.normalize_ip()
-                self.velocity_x = target_vector.x * base_speed
-                self.velocity_y = target_vector.y * base_speed
-            else:
-                self.velocity_x = random.uniform(-1.0, 1.0) * base_speed * 0.3
-                self.velocity_y = base_speed
-        else:
-            self.velocity_x = random.uniform(-1.0, 1.0) * base_speed * 0.3
-            self.velocity_y = base_speed
-    
-    def update(self, dt):
-        self.rect.x += self.velocity_x * dt * 60
-        self.rect.y += self.velocity_y * dt * 60
-    
-    def is_off_screen(self):
-        return self.rect.y > Config.WINDOW_HEIGHT + self.rect.height
-    
-    def draw(self, surface, offset=(0, 0)):
-        """Draw meteor with realistic gray stone texture and shading"""
-        center = (self.rect.centerx + offset[0], self.rect.centery + offset[1])
-        radius = self.rect.width // 2
-        
+            return 2
+        return 1
+
+    def build(self):
+        if self.surface is not None:
+            return
+        cell = max(config["size"] for config in METEOR_CONFIGS.values()) + self.PADDING * 2
+        columns = max(self._max_health(size_type) for size_type in MeteorSize)
+        self.surface = pygame.Surface((cell * columns, cell * len(MeteorSize)), pygame.SRCALPHA)
+
+        for row, size_type in enumerate(MeteorSize):
+            max_health = self._max_health(size_type)
+            for column, health in enumerate(range(max_health, 0, -1)):
+                area = pygame.Rect(column * cell, row * cell, cell, cell)
+                self._render_meteor(self.surface.subsurface(area), size_type, health, max_health)
+                self.cells[(size_type, health, max_health)] = area
+        # RLE skips the transparent corners of every cell when blitting
+        self.surface.set_alpha(255, pygame.RLEACCEL)
+
+    def _render_meteor(self, target, size_type, health, max_health):
+        """Realistic gray stone texture and shading, drawn once per variant"""
+        config = METEOR_CONFIGS[size_type]
+        radius = config["size"] // 2
+        center = (radius + self.PADDING, radius + self.PADDING)
+
         # Realistic gray stone colors with shading
-        base_color = self.color  # Already gray (120, 100, 80)
+        base_color = config["color"]
         highlight = tuple(min(255, c + 50) for c in base_color)  # Lighter gray highlight
         shadow = tuple(max(0, c - 40) for c in base_color)  # Darker gray shadow
         mid_tone = tuple((c + base_color[0]) // 2 for c in base_color)  # Mid-tone gray
-        
-        # Anti-aliased drawing with smooth edges
+
         # Subtle glow (not neon, realistic)
         glow_surf = pygame.Surface((radius * 2 + 4, radius * 2 + 4), pygame.SRCALPHA)
         pygame.draw.circle(glow_surf, (*base_color, 80), (radius + 2, radius + 2), radius + 2)
-        surface.blit(glow_surf, (center[0] - radius - 2, center[1] - radius - 2))
-        
+        target.blit(glow_surf, (center[0] - radius - 2, center[1] - radius - 2))
+
         # Main meteor body (gray stone)
-        pygame.draw.circle(surface, base_color, center, radius)
-        
+        pygame.draw.circle(target, base_color, center, radius)
+
         # Shadow for depth (realistic stone shadow)
         shadow_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
         pygame.draw.circle(shadow_surf, (*shadow, 200), (radius, radius), radius - 1)
-        surface.blit(shadow_surf, (center[0] - radius + 2, center[1] - radius + 2))
-        
+        target.blit(shadow_surf, (center[0] - radius + 2, center[1] - radius + 2))
+
         # Realistic highlights for 3D stone effect
-        pygame.draw.circle(surface, highlight, (center[0] - radius // 3, center[1] - radius // 4), radius // 3)
-        pygame.draw.circle(surface, shadow, (center[0] - radius // 3 - 1, center[1] - radius // 4 + 1), radius // 4)
-        pygame.draw.circle(surface, highlight, (center[0] + radius // 4, center[1] + radius // 6), radius // 4)
-        pygame.draw.circle(surface, mid_tone, (center[0] + radius // 5, center[1] - radius // 3), radius // 5)
-        
+        pygame.draw.circle(target, highlight, (center[0] - radius // 3, center[1] - radius // 4), radius // 3)
+        pygame.draw.circle(target, shadow, (center[0] - radius // 3 - 1, center[1] - radius // 4 + 1),
+                           radius // 4)
+        pygame.draw.circle(target, highlight, (center[0] + radius // 4, center[1] + radius // 6), radius // 4)
+        pygame.draw.circle(target, mid_tone, (center[0] + radius // 5, center[1] - radius // 3), radius // 5)
+
         # Additional stone texture details
-        pygame.draw.circle(surface, shadow, (center[0] - radius // 2, center[1] + radius // 3), radius // 6)
-        pygame.draw.circle(surface, highlight, (center[0] + radius // 3, center[1] - radius // 2), radius // 7)
+        pygame.draw.circle(target, shadow, (center[0] - radius // 2, center[1] + radius // 3), radius // 6)
+        pygame.draw.circle(target, highlight, (center[0] + radius // 3, center[1] - radius // 2), radius // 7)
 
+        # Cracks for damaged meteors (one more crack per lost hit point)
+        crack_color = tuple(max(0, c - 60) for c in base_color)
+        for crack in range(max_health - health):
+            angle = 0.7 + crack * 1.6
+            end = (center[0] + math.cos(angle) * radius * 0.85, center[1] + math.sin(angle) * radius * 0.85)
+            bend = (center[0] + math.cos(angle + 0.3) * radius * 0.45,
+                    center[1] + math.sin(angle + 0.3) * radius * 0.45)
+            pygame.draw.lines(target, crack_color, False, [center, bend, end], 2)
 
-class Player:
-    def __init__(self, x, y):
-        self.rect = pygame.Rect(x, y, Config.PLAYER_WIDTH, Config.PLAYER_HEIGHT)
-        self.velocity_x = 0.0
-        self.velocity_y = 0.0
-        self.rotation = 0.0
-        self.target_rotation = 0.0
-        self.image = None
-        self.flame_image = None
-        self.original_flame_width = None
-        self.original_flame_height = None
-        self._load_images()
-    
-    def _load_images(self):
-        try:
-            if os.path.exists("newrocket.png"):
-                self.image = pygame.image.load("newrocket.png").convert_alpha()
-                self.image = pygame.transform.smoothscale(self.image, (Config.PLAYER_WIDTH, Config.PLAYER_HEIGHT))
-        except:
-            self.image = None
-        
+    def area(self, size_type, health):
+        """Atlas rect of `size_type` at `health` (clamped to the valid damage levels)"""
+        max_health = self._max_health(size_type)
+        return self.cells[(size_type, max(1, min(health, max_health)), max_health)]
+
+    def draw(self, surface, meteor, center):
+        if self.surface is None:
+            self.build()
+        area = self.area(meteor.size_type, meteor.health)
+        radius = meteor.rect.width // 2
+        surface.blit(self.surface, (center[0] - radius - self.PADDING, center[1] - radius - self.PADDING),
+                     area)
+
+
+class ParticleSpriteCache:
+    """Glow + core particle sprites keyed by (color index, size, alpha bucket)"""
+    def __init__(self, alpha_steps=Config.PARTICLE_ALPHA_STEPS):
+        self.alpha_steps = max(1, int(alpha_steps))
+        self.sprites = {}
+
+    def set_alpha_steps(self, alpha_steps):
+        self.alpha_steps = max(1, int(alpha_steps))
+        self.sprites.clear()
+
+    def get(self, color_index, size, bucket):
+        key = (color_index, size, bucket)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = self._render_sprite(PARTICLE_PALETTE[color_index], size,
+                                         bucket * 255 // self.alpha_steps)
+            self.sprites[key] = sprite
+        return sprite
+
+    @staticmethod
+    def _render_sprite(color, size, alpha):
+        # Glow effect for particles
+        glow_size = size + 2
+        sprite = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (*color, int(alpha * 0.4)), (glow_size, glow_size), glow_size)
+
+        # Main particle on top of its glow
+        core = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(core, (*color, alpha), (size, size), size)
+        sprite.blit(core, (2, 2))
+        return sprite
+
+
+class RocketSpriteCache:
+    """Rocket and thrust flame sprites pre-rotated at quantized angles
+
+    Rocket frames cover ±MAX_ROTATION in `angle_steps` angles; flame frames are keyed by
+    (speed ratio bucket, angle) and baked with their colorkey and alpha applied. Frames are
+    built on first use, so memory is bounded by the two grids.
+    """
+    def __init__(self, angle_steps=Config.ROCKET_ANGLE_STEPS, flame_angle_steps=Config.FLAME_ANGLE_STEPS,
+                 flame_speed_steps=Config.FLAME_SPEED_STEPS):
+        self.angle_steps = angle_steps
+        self.flame_angle_steps = flame_angle_steps
+        self.flame_speed_steps = flame_speed_steps
+        self.loaded = False
+        self.image = None
+        self.flame_image = None
+        self.rockets = {}  # angle index -> surface
+        self.flames = {}  # (speed bucket, angle index) -> surface
+
+    def load(self):
+        self.loaded = True
+        self.image = ASSETS.image("rocket")
+        self.flame_image = ASSETS.image("flame")
+
+    def set_quality(self, angle_steps, flame_angle_steps, flame_speed_steps):
+        """Change the quantization (odd step counts keep an exact upright frame)"""
+        self.angle_steps = max(1, int(angle_steps))
+        self.flame_angle_steps = max(1, int(flame_angle_steps))
+        self.flame_speed_steps = max(2, int(flame_speed_steps))
+        self.rockets.clear()
+        self.flames.clear()
+
+    @staticmethod
+    def _quantize(rotation, steps):
+        if steps == 1:
+            return 0, 0.0
+        span = 2 * Config.MAX_ROTATION
+        index = round((rotation + Config.MAX_ROTATION) / span * (steps - 1))
+        index = max(0, min(steps - 1, index))
+        return index, index * span / (steps - 1) - Config.MAX_ROTATION
+
+    def rocket(self, rotation):
+        """Rocket rotated to the nearest cached angle, or None without an image"""
+        if not self.loaded:
+            self.load()
+        if self.image is None:
+            return None
+        index, angle = self._quantize(rotation, self.angle_steps)
+        sprite = self.rockets.get(index)
+        if sprite is None:
+            sprite = pygame.transform.rotate(self.image, -angle) if abs(angle) > 0.1 else self.image
+            self.rockets[index] = sprite
+        return sprite
+
+    def flame(self, speed_ratio, rotation):
+        """Thrust flame for a 0..1 speed ratio at the nearest cached angle, or None"""
+        if not self.loaded:
+            self.load()
+        if self.flame_image is None:
+            return None
+        bucket = round(min(max(speed_ratio, 0.0), 1.0) * (self.flame_speed_steps - 1))
+        index, angle = self._quantize(rotation, self.flame_angle_steps)
+        key = (bucket, index)
+        sprite = self.flames.get(key)
+        if sprite is None:
+            sprite = self._render_flame(bucket / (self.flame_speed_steps - 1), angle)
+            self.flames[key] = sprite
+        return sprite
+
+    def _render_flame(self, speed_ratio, angle):
+        flame_alpha = int(180 + (speed_ratio * 75))
+        flame_height_multiplier = 0.4 + (speed_ratio * 2.1)
+        flame_width_multiplier = 0.5 + (speed_ratio * 0.5)
+        
+        # Calculate flame size
+        target_base_width = int(Config.PLAYER_WIDTH * 0.7)
+        target_base_height = int(Config.PLAYER_HEIGHT * 0.8)
+        base_flame_width = max(int(target_base_width * flame_width_multiplier), Config.PLAYER_WIDTH // 4)
+        base_flame_height = max(int(target_base_height * flame_height_multiplier), Config.PLAYER_HEIGHT // 5)
+        flame = pygame.transform.smoothscale(self.flame_image, (base_flame_width, base_flame_height))
+        
+        # Bake the black-background colorkey and the transparency into per-pixel alpha
+        rgb = pygame.surfarray.pixels3d(flame)
+        alpha = pygame.surfarray.pixels_alpha(flame)
+        alpha[(rgb == 0).all(axis=2)] = 0
+        alpha[:] = alpha.astype(np.uint16) * flame_alpha // 255
+        del rgb, alpha  # Release the pixel locks
+        
+        # Rotate flame WITH rocket (same angle)
+        if abs(angle) > 0.1:
+            flame = pygame.transform.rotate(flame, -angle)
+        return flame
+
+    def stats(self):
+        surfaces = list(self.rockets.values()) + list(self.flames.values())
+        return {
+            "rocket_frames": len(self.rockets),
+            "flame_frames": len(self.flames),
+            "bytes": sum(s.get_width() * s.get_height() * s.get_bytesize() for s in surfaces)
+        }
+
+
+class BloomPass:
+    """Additive glow drawn into a reduced-resolution buffer and composited over dirty regions
+
+    Emissive shapes are drawn (already multiplied by their alpha) into an opaque black
+    buffer `scale` times the screen size. composite() smoothscales only the regions that
+    received shapes back up to screen size, which also softens them, and adds them to the
+    frame; with nothing emissive on screen it costs nothing.
+    """
+    def __init__(self, width, height, scale=Config.BLOOM_SCALE, strength=Config.BLOOM_STRENGTH):
+        self.width = width
+        self.height = height
+        self.configure(scale, strength)
+
+    def configure(self, scale, strength):
+        """scale: buffer resolution factor (0.125..1), strength: glow intensity (0..1)"""
+        self.scale = min(max(float(scale), 0.125), 1.0)
+        self.strength = min(max(float(strength), 0.0), 1.0)
+        self.buffer = pygame.Surface((max(1, int(self.width * self.scale)),
+                                      max(1, int(self.height * self.scale))))
+        self.buffer.fill((0, 0, 0))
+        self.dirty = []  # Buffer-space rects drawn since the last begin()
+
+    def begin(self):
+        """Clear what the previous frame drew"""
+        for rect in self.dirty:
+            self.buffer.fill((0, 0, 0), rect)
+        self.dirty.clear()
+
+    def _to_buffer(self, rect):
+        # Grow by a buffer pixel so the upsampling filter has a black border to fade into
+        scale = self.scale
+        left = int(rect.left * scale) - 1
+        top = int(rect.top * scale) - 1
+        right = int(math.ceil(rect.right * scale)) + 1
+        bottom = int(math.ceil(rect.bottom * scale)) + 1
+        return pygame.Rect(left, top, right - left, bottom - top).clip(self.buffer.get_rect())
+
+    @staticmethod
+    def _premultiply(color, alpha):
+        return (color[0] * alpha // 255, color[1] * alpha // 255, color[2] * alpha // 255)
+
+    def ellipse(self, color, rect, alpha=255):
+        region = self._to_buffer(rect)
+        if not region:
+            return
+        scale = self.scale
+        pygame.draw.ellipse(self.buffer, self._premultiply(color, alpha),
+                            (rect.x * scale, rect.y * scale, rect.width * scale, rect.height * scale))
+        self.dirty.append(region)
+
+    def circle(self, color, center, radius, alpha=255):
+        rect = pygame.Rect(center[0] - radius, center[1] - radius, radius * 2, radius * 2)
+        region = self._to_buffer(rect)
+        if not region:
+            return
+        scale = self.scale
+        pygame.draw.circle(self.buffer, self._premultiply(color, alpha),
+                           (center[0] * scale, center[1] * scale), max(1, radius * scale))
+        self.dirty.append(region)
+
+    def composite(self, surface):
+        if not self.dirty or self.strength <= 0.0:
+            return
+        inverse = 1.0 / self.scale
+        level = int(255 * self.strength)
+        # Merged so that overlapping shapes are not added twice
+        for region in merge_rects(self.dirty):
+            size = (int(region.width * inverse), int(region.height * inverse))
+            glow = pygame.transform.smoothscale(self.buffer.subsurface(region), size)
+            if level < 255:
+                glow.fill((level, level, level), special_flags=pygame.BLEND_MULT)
+            surface.blit(glow, (int(region.x * inverse), int(region.y * inverse)),
+                         special_flags=pygame.BLEND_ADD)
+
+
+class DirtyRegions:
+    """Screen regions changed this frame, presented with pygame.display.update(rects)
+
+    Drawing stages add() what they changed, or mark_full() when the whole frame changed
+    (scrolling starfield, new backdrop). present() flips instead when disabled, after a
+    full change, or once the merged regions cover more than `max_coverage` of the screen,
+    where many partial updates would cost more than one flip.
+    """
+    def __init__(self, width, height, enabled=Config.DIRTY_RECTS,
+                 max_coverage=Config.DIRTY_RECT_MAX_COVERAGE):
+        self.screen_rect = pygame.Rect(0, 0, width, height)
+        self.enabled = enabled
+        self.max_coverage = max_coverage
+        self.rects = []
+        self.full = True  # The first frame is always presented whole
+        self.flips = 0
+        self.partial_updates = 0
+        self.skipped = 0
+
+    def add(self, rect):
+        if not self.full:
+            rect = self.screen_rect.clip(rect)
+            if rect:
+                self.rects.append(rect)
+
+    def mark_full(self):
+        self.full = True
+        self.rects.clear()
+
+    def present(self):
+        if not self.enabled or self.full:
+            pygame.display.flip()
+            self.flips += 1
+        else:
+            regions = merge_rects(self.rects)
+            covered = sum(rect.width * rect.height for rect in regions)
+            if covered > self.max_coverage * self.screen_rect.width * self.screen_rect.height:
+                pygame.display.flip()
+                self.flips += 1
+            elif regions:
+                pygame.display.update(regions)
+                self.partial_updates += 1
+            else:
+                self.skipped += 1  # Nothing changed on screen
+        self.full = False
+        self.rects.clear()
+
+    def stats(self):
+        return {
+            "enabled": self.enabled,
+            "flips": self.flips,
+            "partial_updates": self.partial_updates,
+            "skipped": self.skipped
+        }
+
+
+def merge_rects(rects):
+    """Rects merged until no two overlap"""
+    regions = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        merged = True
+        while merged:
+            merged = False
+            for index in range(len(regions)):
+                if regions[index].colliderect(rect):
+                    rect.union_ip(regions.pop(index))
+                    merged = True
+                    break
+        regions.append(rect)
+    return regions
+
+
+ASSETS = AssetManager()
+FONTS = FontRegistry()
+TEXT_CACHE = TextCache(FONTS)
+METEOR_ATLAS = MeteorAtlas()
+PARTICLE_SPRITES = ParticleSpriteCache()
+ROCKET_SPRITES = RocketSpriteCache()
+
+
+# ==================== UI ====================
+class Widget:
+    """One node of a retained UI screen
+
+    `rect` is the clickable area, `bounds` the area the painter may draw into (defaults to
+    rect). The painter is called as painter(surface, local_rect, hovered, state) and its
+    result is cached until the hover flag or the value returned by `state()` changes.
+    """
+    def __init__(self, rect, painter, action=None, state=None, visible=None, bounds=None, pad=4):
+        self.rect = pygame.Rect(rect)
+        self.bounds = pygame.Rect(bounds) if bounds is not None else self.rect.copy()
+        self.painter = painter
+        self.action = action
+        self.state = state
+        self.visible = visible
+        self.pad = pad
+        self.hovered = False
+        self.surface = None
+        self.surface_key = None
+        self.drawn = None  # Surface shown by the last draw(), for dirty-region reporting
+
+    def is_visible(self):
+        return self.visible is None or self.visible()
+
+    def render(self):
+        key = (self.hovered, self.state() if self.state is not None else None)
+        if self.surface is None or key != self.surface_key:
+            area = self.area()
+            self.surface = pygame.Surface(area.size, pygame.SRCALPHA)
+            self.painter(self.surface, self.rect.move(-area.x, -area.y), key[0], key[1])
+            self.surface_key = key
+        return self.surface
+
+    def area(self):
+        return self.bounds.inflate(self.pad * 2, self.pad * 2)
+
+    def draw(self, surface, dirty=None):
+        rendered = self.render()
+        surface.blit(rendered, (self.bounds.x - self.pad, self.bounds.y - self.pad))
+        if dirty is not None and rendered is not self.drawn:
+            dirty.add(self.area())
+        self.drawn = rendered
+
+    def hide(self, dirty=None):
+        """Forget the shown surface of a widget that is no longer drawn"""
+        if dirty is not None and self.drawn is not None:
+            dirty.add(self.area())
+        self.drawn = None
+
+
+class UIScreen:
+    """Widgets of one screen in paint order, with a broadphase index over the clickable ones"""
+    def __init__(self, widgets):
+        self.widgets = widgets
+        self.index = SweepAndPrune()
+        self.index.rebuild(widget for widget in widgets if widget.action is not None)
+        self.hovered = None
+
+    def widget_at(self, pos):
+        """Topmost visible clickable widget under `pos`, or None"""
+        hits = self.index.query_rect(pygame.Rect(pos[0], pos[1], 1, 1))
+        for widget in reversed(hits):
+            if widget.is_visible():
+                return widget
+        return None
+
+    def update_hover(self, pos):
+        """Move the hover highlight; returns True when the hovered widget changed"""
+        return self._set_hovered(self.widget_at(pos))
+
+    def clear_hover(self):
+        self._set_hovered(None)
+
+    def _set_hovered(self, widget):
+        if widget is self.hovered:
+            return False
+        if self.hovered is not None:
+            self.hovered.hovered = False
+        if widget is not None:
+            widget.hovered = True
+        self.hovered = widget
+        return True
+
+    def click(self, pos):
+        """Run the action of the widget under `pos`; returns True if one was hit"""
+        widget = self.widget_at(pos)
+        if widget is None:
+            return False
+        widget.action()
+        return True
+
+    def draw(self, surface, dirty=None):
+        """Draw the visible widgets; `dirty` receives the areas that look different from last time"""
+        for widget in self.widgets:
+            if widget.is_visible():
+                widget.draw(surface, dirty)
+            else:
+                widget.hide(dirty)
+
+
+def blit_outlined(surface, text_surf, outline_surf, center, spread=1):
+    """Blit text with an outline made of offset copies (skips the center offset)"""
+    rect = text_surf.get_rect(center=center)
+    for dx in range(-spread, spread + 1):
+        for dy in range(-spread, spread + 1):
+            if dx != 0 or dy != 0:
+                surface.blit(outline_surf, (rect.x + dx, rect.y + dy))
+    surface.blit(text_surf, rect)
+
+
+# ==================== PROFILING ====================
+class FrameProfiler:
+    """Per-phase frame timings in a ring buffer, with percentiles and an on-screen overlay
+
+    Phases are closed with mark(): the time since the previous mark (or begin_frame) is
+    charged to the named phase, so marks called once per simulation step accumulate.
+    Every call returns immediately while the profiler is disabled, and marks outside a frame
+    that begin_frame() started (e.g. right after toggling on mid-frame) are ignored.
+    """
+    PHASES = ("events", "spawn", "player", "bullets", "meteors", "coins", "particles", "update_other",
+              "draw_background", "draw_particles", "draw_coins", "draw_meteors", "draw_bullets",
+              "draw_auras", "draw_player", "bloom", "draw_world", "draw_hud", "draw_other", "overlay", "flip")
+    PANEL_WIDTH = 400
+    ROW_HEIGHT = 15
+    SPARKLINE_HEIGHT = 48
+
+    def __init__(self, history=Config.PROFILER_HISTORY):
+        self.enabled = False
+        self.recording = False  # Inside a frame opened by begin_frame() while enabled
+        self.history = history
+        self.columns = {phase: index for index, phase in enumerate(self.PHASES)}
+        # One row per frame: every phase plus the frame total in the last column (seconds)
+        self.samples = np.zeros((history, len(self.PHASES) + 1), dtype=np.float64)
+        self.current = np.zeros(len(self.PHASES) + 1, dtype=np.float64)
+        self.frames = 0  # Frames recorded since the last reset
+        self.frame_start = 0.0
+        self.last_mark = 0.0
+        self.panel = None
+        self.panel_age = 0
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.recording = False  # Takes effect at the next begin_frame()
+        self.reset()
+
+    def reset(self):
+        self.frames = 0
+        self.panel = None
+
+    def begin_frame(self):
+        self.recording = self.enabled
+        if not self.enabled:
+            return
+        self.current[:] = 0.0
+        self.frame_start = self.last_mark = time.perf_counter()
+
+    def mark(self, phase):
+        if not self.recording:
+            return
+        now = time.perf_counter()
+        self.current[self.columns[phase]] += now - self.last_mark
+        self.last_mark = now
+
+    def end_frame(self):
+        if not self.recording:
+            return
+        self.recording = False
+        self.current[-1] = time.perf_counter() - self.frame_start
+        self.samples[self.frames % self.history] = self.current
+        self.frames += 1
+
+    def _window(self):
+        """Recorded rows, oldest first"""
+        if self.frames <= self.history:
+            return self.samples[:self.frames]
+        split = self.frames % self.history
+        return np.concatenate((self.samples[split:], self.samples[:split]))
+
+    def summary(self):
+        """Mean and p50/p95/p99 per phase (and "frame" for the total) in milliseconds"""
+        window = self._window()
+        if not len(window):
+            return {}
+        means = window.mean(axis=0) * 1000.0
+        p50, p95, p99 = np.percentile(window, (50, 95, 99), axis=0) * 1000.0
+        names = self.PHASES + ("frame",)
+        return {name: {"mean": float(means[i]), "p50": float(p50[i]), "p95": float(p95[i]),
+                       "p99": float(p99[i])}
+                for i, name in enumerate(names)}
+
+    def draw(self, surface):
+        if not self.enabled:
+            return
+        # Rebuilding the panel every few frames keeps the overlay itself cheap
+        if self.panel is None or self.panel_age >= Config.PROFILER_REFRESH_FRAMES:
+            self.panel = self._build_panel()
+            self.panel_age = 0
+        self.panel_age += 1
+        return surface.blit(self.panel, (surface.get_width() - self.PANEL_WIDTH - 10, 10))
+
+    def _build_panel(self):
+        stats = self.summary()
+        rows = len(self.PHASES) + 2
+        height = rows * self.ROW_HEIGHT + self.SPARKLINE_HEIGHT + 16
+        panel = pygame.Surface((self.PANEL_WIDTH, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 190))
+        font = FONTS.get(13, bold=False)
+
+        y = 4
+        header = f"{'phase':<16}{'mean':>7}{'p50':>7}{'p95':>7}{'p99':>7}  ms"
+        panel.blit(font.render(header, True, Config.NEON_CYAN), (6, y))
+        y += self.ROW_HEIGHT
+        for name in self.PHASES + ("frame",):
+            row = stats.get(name)
+            if row is None:
+                line = f"{name:<16}{'-':>7}"
+            else:
+                line = f"{name:<16}{row['mean']:7.2f}{row['p50']:7.2f}{row['p95']:7.2f}{row['p99']:7.2f}"
+            color = Config.GOLD_COLOR if name == "frame" else (200, 200, 200)
+            panel.blit(font.render(line, True, color), (6, y))
+            y += self.ROW_HEIGHT
+
+        # Sparkline of frame totals with the frame budget as a reference line
+        spark = pygame.Rect(6, y + 6, self.PANEL_WIDTH - 12, self.SPARKLINE_HEIGHT)
+        pygame.draw.rect(panel, (40, 40, 40, 220), spark)
+        totals = self._window()[:, -1] * 1000.0
+        budget = 1000.0 / Config.FPS
+        scale = max(budget * 2.0, float(totals.max()) if len(totals) else 0.0)
+        budget_y = spark.bottom - int(budget / scale * spark.height)
+        pygame.draw.line(panel, (255, 80, 80), (spark.left, budget_y), (spark.right - 1, budget_y))
+        if len(totals) > 1:
+            step = spark.width / (self.history - 1)
+            points = [(spark.left + int(i * step), spark.bottom - 1 - int(value / scale * (spark.height - 1)))
+                      for i, value in enumerate(totals)]
+            pygame.draw.lines(panel, Config.NEON_CYAN, False, points)
+        return panel
+
+
+# ==================== INPUT ====================
+class KeyState:
+    """Held-key lookup compatible with indexing the result of pygame.key.get_pressed()"""
+    def __init__(self, held=()):
+        self.held = frozenset(held)
+
+    def __getitem__(self, key):
+        return key in self.held
+
+
+class KeyboardInput:
+    """Live keyboard/mouse input from the pygame event queue"""
+    def poll(self):
+        return pygame.key.get_pressed(), pygame.event.get()
+
+
+class ScriptedInput:
+    """Replays a fixed script of (held keys, pressed keys) per tick, holding the last entry"""
+    def __init__(self, frames):
+        self.frames = list(frames) or [((), ())]
+        self.tick = 0
+
+    def poll(self):
+        held, pressed = self.frames[min(self.tick, len(self.frames) - 1)]
+        self.tick += 1
+        events = [pygame.event.Event(pygame.KEYDOWN, key=key) for key in pressed]
+        return KeyState(held), events
+
+
+class RandomInput:
+    """Random but reproducible play: holds movement keys for a while, shoots and restarts"""
+    MOVE_KEYS = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN)
+
+    def __init__(self, seed=None, hold_ticks=(10, 60), shoot_chance=0.05, restart_chance=0.01):
+        self.rng = random.Random(seed)
+        self.hold_ticks = hold_ticks
+        self.shoot_chance = shoot_chance
+        self.restart_chance = restart_chance
+        self.held = ()
+        self.hold_remaining = 0
+
+    def poll(self):
+        if self.hold_remaining <= 0:
+            self.held = tuple(self.rng.sample(self.MOVE_KEYS, self.rng.randint(0, 2)))
+            self.hold_remaining = self.rng.randint(*self.hold_ticks)
+        self.hold_remaining -= 1
+
+        events = []
+        if self.rng.random() < self.shoot_chance:
+            events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+        if self.rng.random() < self.restart_chance:
+            # Starts a run from the menu or the death screen, ignored while playing
+            events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN))
+        return KeyState(self.held), events
+
+
+class ReplayInput:
+    """Feeds the recorded frames of a Replay back into the game"""
+    def __init__(self, replay):
+        self.replay = replay
+        self.frame = 0
+        self.steps = 0  # Simulation steps the current frame ran when it was recorded
+
+    def finished(self):
+        return self.frame >= len(self.replay.frames)
+
+    def poll(self):
+        self.steps, mask, events = self.replay.frames[self.frame]
+        self.frame += 1
+        return Replay.keys_from_mask(mask), [Replay.decode_event(event) for event in events]
+
+
+# ==================== REPLAYS ====================
+class Replay:
+    """Compact binary record of a session: seed plus per-frame step count, held keys and events
+
+    Layout: a fixed header (magic, version, simulation rate, seed, frame count, digest of the
+    final simulation state) followed by the zlib-compressed frame stream. Each frame is
+    (steps u8, held key mask u16, event count u8) and its events.
+    """
+    MAGIC = b"ORBR"
+    # 2: float meteor positions; 3: starfield on its own RNG, float coin/player positions.
+    # Each bump changes the simulation, so runs recorded under an older version no longer reproduce
+    VERSION = 3
+    HEADER = struct.Struct("<4sBHQI20s")
+    FRAME = struct.Struct("<BHB")
+    KEY_EVENT = struct.Struct("<BI")
+    MOUSE_EVENT = struct.Struct("<BBHH")
+    EVENT_KEYDOWN = 0
+    EVENT_MOUSEDOWN = 1
+    TRACKED_KEYS = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN,
+                    pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_s, pygame.K_SPACE)
+
+    def __init__(self, seed, sim_hz=Config.SIMULATION_HZ):
+        self.seed = seed
+        self.sim_hz = sim_hz
+        self.frames = []  # (steps, key mask, encoded events)
+        self.final_digest = bytes(20)
+
+    @classmethod
+    def keys_to_mask(cls, keys):
+        mask = 0
+        for bit, key in enumerate(cls.TRACKED_KEYS):
+            if keys[key]:
+                mask |= 1 << bit
+        return mask
+
+    @classmethod
+    def keys_from_mask(cls, mask):
+        return KeyState(key for bit, key in enumerate(cls.TRACKED_KEYS) if mask & (1 << bit))
+
+    @classmethod
+    def encode_event(cls, event):
+        if event.type == pygame.KEYDOWN:
+            return (cls.EVENT_KEYDOWN, event.key)
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            return (cls.EVENT_MOUSEDOWN, event.button, event.pos[0], event.pos[1])
+        return None  # Window/quit events are not part of the simulation
+
+    @classmethod
+    def decode_event(cls, encoded):
+        if encoded[0] == cls.EVENT_KEYDOWN:
+            return pygame.event.Event(pygame.KEYDOWN, key=encoded[1])
+        return pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=encoded[1], pos=(encoded[2], encoded[3]))
+
+    def add_frame(self, steps, keys, events):
+        encoded = tuple(e for e in (self.encode_event(event) for event in events) if e is not None)
+        # A frame holds at most 255 steps; longer stalls are split over empty frames
+        while steps > 255:
+            self.frames.append((255, self.keys_to_mask(keys), ()))
+            steps -= 255
+        self.frames.append((steps, self.keys_to_mask(keys), encoded[:255]))
+
+    def to_bytes(self):
+        body = bytearray()
+        for steps, mask, events in self.frames:
+            body += self.FRAME.pack(steps, mask, len(events))
+            for event in events:
+                if event[0] == self.EVENT_KEYDOWN:
+                    body += self.KEY_EVENT.pack(*event)
+                else:
+                    body += self.MOUSE_EVENT.pack(*event)
+        header = self.HEADER.pack(self.MAGIC, self.VERSION, self.sim_hz, self.seed,
+                                  len(self.frames), self.final_digest)
+        return header + zlib.compress(bytes(body), 9)
+
+    @classmethod
+    def from_bytes(cls, data):
+        if len(data) < cls.HEADER.size:
+            raise ValueError("Not a replay file")
+        magic, version, sim_hz, seed, frame_count, digest = cls.HEADER.unpack_from(data)
+        if magic != cls.MAGIC:
+            raise ValueError("Not a replay file")
+        if version != cls.VERSION:
+            raise ValueError(f"Replay version {version} is not supported (expected {cls.VERSION}); "
+                             "it was recorded by an older build and will not reproduce")
+        replay = cls(seed, sim_hz)
+        replay.final_digest = digest
+        body = zlib.decompress(data[cls.HEADER.size:])
+        offset = 0
+        for _ in range(frame_count):
+            steps, mask, event_count = cls.FRAME.unpack_from(body, offset)
+            offset += cls.FRAME.size
+            events = []
+            for _ in range(event_count):
+                if body[offset] == cls.EVENT_KEYDOWN:
+                    events.append(cls.KEY_EVENT.unpack_from(body, offset))
+                    offset += cls.KEY_EVENT.size
+                else:
+                    events.append(cls.MOUSE_EVENT.unpack_from(body, offset))
+                    offset += cls.MOUSE_EVENT.size
+            replay.frames.append((steps, mask, tuple(events)))
+        return replay
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+# ==================== PERSISTENCE ====================
+class SaveStore:
+    """Write-behind persistence for the player profile (scores, gold, upgrades, settings)
+
+    save() only puts the newest state in a slot and wakes the worker thread, so the frame
+    never waits on the disk, and states submitted while the worker is busy collapse into one
+    write. The worker appends each state to a journal as one checksummed JSON line and
+    fsyncs it; from then on the state is acknowledged and survives a power cut. Every
+    SAVE_JOURNAL_LIMIT entries, and on close(), the state is written to the snapshot (temp
+    file plus rename) and the journal is emptied. load() takes the record with the highest
+    serial from both files; a line torn by a crash fails its checksum and is skipped.
+    """
+    def __init__(self, path=Config.SAVE_PATH):
+        self.path = path
+        self.journal_path = path + ".journal"
+        self.condition = threading.Condition()
+        self.pending = None  # (serial, state) waiting for the worker
+        self.closing = False
+        self.serial = 0
+        self.acknowledged = 0  # Serial of the newest state known to be on disk
+        self.last_record = None
+        self.journal_entries = 0
+        self.journal_torn = False  # The journal ends in a partial line, see load()
+        self.writes = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.thread = threading.Thread(target=self._work, name="save-writer", daemon=True)
+
+    @staticmethod
+    def encode(record):
+        payload = json.dumps(record, separators=(",", ":"))
+        return f"{zlib.crc32(payload.encode()):08x} {payload}\n"
+
+    @staticmethod
+    def decode(line):
+        """Record from one line, or None if it is torn or corrupt"""
+        checksum, _, payload = line.rstrip("\n").partition(" ")
+        try:
+            if int(checksum, 16) != zlib.crc32(payload.encode()):
+                return None
+            record = json.loads(payload)
+        except ValueError:
+            return None
+        if not isinstance(record, dict) or not isinstance(record.get("serial"), int):
+            return None
+        return record
+
+    @staticmethod
+    def _read_lines(path):
         try:
-            # Load flame image (alev.png)
-            if os.path.exists("alev.png"):
-                self.flame_image = pygame.image.load("alev.png").convert_alpha()
-                # Store original dimensions for dynamic scaling
-                self.original_flame_width = self.flame_image.get_width()
-                self.original_flame_height = self.flame_image.get_height()
+            with open(path, encoding="utf-8", errors="replace") as f:
+                return f.readlines()
+        except OSError:
+            return []
+
+    def load(self):
+        """Newest intact saved state, or None; a couple of small reads, fine before the first frame"""
+        lines = self._read_lines(self.journal_path)
+        # The next append must not run on from a line a crash cut short
+        self.journal_torn = bool(lines) and not lines[-1].endswith("\n")
+        journal = [record for record in map(self.decode, lines) if record is not None]
+        self.journal_entries = len(journal)
+        snapshot = [record for record in map(self.decode, self._read_lines(self.path)) if record is not None]
+        for record in snapshot + journal:
+            if self.last_record is None or record["serial"] > self.last_record["serial"]:
+                self.last_record = record
+        if self.last_record is None:
+            return None
+        self.serial = self.acknowledged = self.last_record["serial"]
+        return self.last_record.get("state")
+
+    def start(self):
+        if not self.thread.is_alive():
+            self.thread.start()
+
+    def save(self, state):
+        """Queue `state` for writing; returns immediately"""
+        with self.condition:
+            if self.pending is not None:
+                self.coalesced += 1
+            self.serial += 1
+            self.pending = (self.serial, state)
+            self.condition.notify()
+
+    def _work(self):
+        while True:
+            with self.condition:
+                while self.pending is None and not self.closing:
+                    self.condition.wait()
+                if self.pending is None:
+                    return
+                closing = self.closing
+            if not closing:
+                time.sleep(Config.SAVE_COALESCE_SECONDS)  # Let a burst of changes land in the slot
+            with self.condition:
+                serial, state = self.pending
+                self.pending = None
+            self._write({"serial": serial, "state": state})
+
+    def _write(self, record):
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            if self.journal_entries >= Config.SAVE_JOURNAL_LIMIT:
+                self._write_snapshot(record)
             else:
-                self.flame_image = None
-                self.original_flame_width = None
-                self.original_flame_height = None
-        except Exception as e:
-            self.flame_image = None
-            self.original_flame_width = None
-            self.original_flame_height = None
+                with open(self.journal_path, "a", encoding="utf-8") as f:
+                    f.write(("\n" if self.journal_torn else "") + self.encode(record))
+                    f.flush()
+                    os.fsync(f.fileno())
+                self.journal_entries += 1
+                self.journal_torn = False
+        except OSError:
+            self.errors += 1
+            return
+        self.writes += 1
+        self.last_record = record
+        self.acknowledged = record["serial"]
+
+    def _write_snapshot(self, record):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(self.encode(record))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)  # Readers see the old snapshot or the new one, never half
+        try:
+            # Make the rename itself durable (not possible on every platform)
+            fd = os.open(directory, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError:
+            pass
+        # Older journal entries are covered by the snapshot (and lose to its serial if a crash
+        # leaves them behind)
+        with open(self.journal_path, "w", encoding="utf-8"):
+            pass
+        self.journal_entries = 0
+        self.journal_torn = False
+
+    def close(self):
+        """Write out anything queued, fold the journal into the snapshot and stop the worker"""
+        with self.condition:
+            self.closing = True
+            self.condition.notify()
+        if self.thread.is_alive():
+            self.thread.join()
+        if self.journal_entries and self.last_record is not None:
+            try:
+                self._write_snapshot(self.last_record)
+            except OSError:
+                self.errors += 1
+
+    def stats(self):
+        return {
+            "serial": self.serial,
+            "acknowledged": self.acknowledged,
+            "writes": self.writes,
+            "coalesced": self.coalesced,
+            "journal_entries": self.journal_entries,
+            "errors": self.errors
+        }
+
+
+RunRecord = namedtuple("RunRecord", "id finished_at day score duration gold loadout seed")
+
+
+class RunHistory:
+    """Every finished run in a local SQLite database, with a cached top-N board
+
+    Runs are inserted by a worker thread that owns the connection, so no commit ever lands
+    in a frame. The indexes on score, (day, score) and (loadout, score) let each top-N query
+    read just N index entries, however many runs have piled up. The board is queried once
+    when the worker starts; after that every inserted run is merged into the cached result,
+    and the game only reads the finished tuple in top_runs - no query at all.
+    """
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS runs (
+            id INTEGER PRIMARY KEY,
+            finished_at REAL NOT NULL,  -- Unix time
+            day TEXT NOT NULL,  -- Local date, YYYY-MM-DD
+            score INTEGER NOT NULL,
+            duration REAL NOT NULL,  -- Seconds of game time
+            gold INTEGER NOT NULL,  -- Gold earned in the run
+            loadout TEXT NOT NULL,  -- Upgrades the run started with, see Game._loadout
+            seed INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS runs_by_score ON runs (score DESC);
+        CREATE INDEX IF NOT EXISTS runs_by_day ON runs (day, score DESC);
+        CREATE INDEX IF NOT EXISTS runs_by_loadout ON runs (loadout, score DESC);
+    """
+    COLUMNS = "id, finished_at, day, score, duration, gold, loadout, seed"
+
+    def __init__(self, path=Config.HISTORY_PATH, board_size=Config.LEADERBOARD_SIZE):
+        self.path = path
+        self.board_size = board_size
+        self.top_runs = ()  # Cached board, best first; only ever replaced as a whole
+        self.last_run_id = None  # Newest run recorded this session
+        self.jobs = queue.Queue()
+        self.errors = 0
+        self.thread = threading.Thread(target=self._work, name="run-history", daemon=True)
+
+    def connect(self):
+        connection = sqlite3.connect(self.path)
+        # WAL: a commit appends to the log instead of rewriting pages, and readers never block
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(self.SCHEMA)
+        return connection
+
+    def start(self):
+        if not self.thread.is_alive():
+            self.thread.start()
+
+    def record(self, score, duration, gold, loadout, seed):
+        """Queue a finished run for insertion; returns immediately"""
+        self.jobs.put((time.time(), int(score), float(duration), int(gold), loadout, int(seed)))
+
+    def _work(self):
+        try:
+            connection = self.connect()
+            self.top_runs = tuple(self._query(connection, self.board_size))
+        except sqlite3.Error:
+            self.errors += 1
+            return
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                break
+            finished_at = job[0]
+            day = time.strftime("%Y-%m-%d", time.localtime(finished_at))
+            try:
+                with connection:
+                    cursor = connection.execute(
+                        "INSERT INTO runs (finished_at, day, score, duration, gold, loadout, seed) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?)", (finished_at, day) + job[1:])
+            except sqlite3.Error:
+                self.errors += 1
+                continue
+            run = RunRecord(cursor.lastrowid, finished_at, day, *job[1:])
+            self.last_run_id = run.id
+            # Incremental refresh: a new run can only push the last entry off the board
+            board = sorted(self.top_runs + (run,), key=lambda r: (-r.score, r.id))
+            self.top_runs = tuple(board[:self.board_size])
+        connection.close()
+
+    def _query(self, connection, limit, day=None, loadout=None):
+        conditions, params = [], []
+        if day is not None:
+            conditions.append("day = ?")
+            params.append(day)
+        if loadout is not None:
+            conditions.append("loadout = ?")
+            params.append(loadout)
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+        rows = connection.execute(f"SELECT {self.COLUMNS} FROM runs {where}ORDER BY score DESC, id LIMIT ?",
+                                  params + [limit])
+        return [RunRecord(*row) for row in rows]
+
+    def top(self, limit=Config.LEADERBOARD_SIZE, day=None, loadout=None):
+        """Best runs overall, on `day` (YYYY-MM-DD) and/or with `loadout`, read from the database
+
+        For tools and one-off screens; the running game uses the cached top_runs instead.
+        """
+        connection = self.connect()
+        try:
+            return self._query(connection, limit, day, loadout)
+        finally:
+            connection.close()
+
+    def close(self):
+        """Finish the queued inserts and stop the worker"""
+        if self.thread.is_alive():
+            self.jobs.put(None)
+            self.thread.join()
+
+
+# ==================== GAME OBJECTS ====================
+class ParticleSystem:
+    """Fixed-capacity struct-of-arrays particle storage with vectorized updates"""
+    def __init__(self, capacity=Config.MAX_PARTICLES, seed=None):
+        self.capacity = capacity
+        self.count = 0
+        self.rng = np.random.default_rng(seed)
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.prev_x = np.zeros(capacity, dtype=np.float32)  # Position at the previous simulation step
+        self.prev_y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.max_life = np.ones(capacity, dtype=np.float32)
+        self.size = np.zeros(capacity, dtype=np.int16)
+        self.color = np.zeros(capacity, dtype=np.uint8)
+        self._arrays = (self.x, self.y, self.prev_x, self.prev_y, self.vx, self.vy, self.life,
+                        self.max_life, self.size, self.color)
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.count = 0
+
+    def reseed(self, seed):
+        self.rng = np.random.default_rng(seed)
+
+    def emit_burst(self, x, y, count, speed_range, size_range, color_indices, life=0.8):
+        """Add `count` particles flying out of (x, y) in random directions"""
+        count = min(count, self.capacity - self.count)
+        if count <= 0:
+            return
+        start, end = self.count, self.count + count
+        angles = self.rng.uniform(0, 2 * math.pi, count)
+        speeds = self.rng.uniform(speed_range[0], speed_range[1], count)
+        self.x[start:end] = x
+        self.y[start:end] = y
+        self.prev_x[start:end] = x
+        self.prev_y[start:end] = y
+        self.vx[start:end] = np.cos(angles) * speeds
+        self.vy[start:end] = np.sin(angles) * speeds
+        self.life[start:end] = life
+        self.max_life[start:end] = life
+        self.size[start:end] = self.rng.integers(size_range[0], size_range[1] + 1, count)
+        self.color[start:end] = self.rng.choice(np.asarray(color_indices, dtype=np.uint8), count)
+        self.count = end
+
+    def store_previous(self):
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+
+    def update(self, dt):
+        n = self.count
+        if n == 0:
+            return
+        self.x[:n] += self.vx[:n] * (dt * 60)
+        self.y[:n] += self.vy[:n] * (dt * 60)
+        self.vy[:n] += 50 * dt  # Gravity
+        self.life[:n] -= dt
+
+        # Swap-compaction: fill holes left by dead particles with live ones from the tail
+        dead = np.flatnonzero(self.life[:n] <= 0)
+        if len(dead) == 0:
+            return
+        new_count = n - len(dead)
+        holes = dead[dead < new_count]
+        if len(holes):
+            tail_alive = np.flatnonzero(self.life[new_count:n] > 0) + new_count
+            for array in self._arrays:
+                array[holes] = array[tail_alive]
+        self.count = new_count
+
+    def draw(self, surface, offset=(0, 0), alpha=1.0):
+        """Draw particles with glow effect and smooth fade as a single blits() batch
+
+        `alpha` interpolates between the previous and current simulation step positions.
+        """
+        n = self.count
+        if n == 0:
+            return
+        steps = PARTICLE_SPRITES.alpha_steps
+        buckets = np.ceil(self.life[:n] / self.max_life[:n] * steps).astype(np.int32)
+        np.clip(buckets, 1, steps, out=buckets)
+        glow_sizes = self.size[:n].astype(np.int32) + 2
+        x = self.prev_x[:n] + (self.x[:n] - self.prev_x[:n]) * alpha
+        y = self.prev_y[:n] + (self.y[:n] - self.prev_y[:n]) * alpha
+        xs = (x - glow_sizes + offset[0]).astype(np.int32).tolist()
+        ys = (y - glow_sizes + offset[1]).astype(np.int32).tolist()
+
+        get_sprite = PARTICLE_SPRITES.get
+        surface.blits([(get_sprite(color_index, size, bucket), (x, y))
+                       for color_index, size, bucket, x, y
+                       in zip(self.color[:n].tolist(), self.size[:n].tolist(), buckets.tolist(), xs, ys)],
+                      doreturn=False)
+
+
+class Coin:
+    def __init__(self, x, y, value=1, is_score=False, rng=None):
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(x, y, value, is_score, rng)
+    
+    def reset(self, x, y, value=1, is_score=False, rng=None):
+        rng = rng or random
+        # Boyut puanın değerine göre değişir
+        if is_score:
+            if value == 3:
+                size = 28  # 3 puan - büyük
+            elif value == 2:
+                size = 22  # 2 puan - orta
+            else:  # 1 puan
+                size = 16  # 1 puan - küçük
+        else:
+            size = 20  # Altın - normal boyut
+        
+        self.rect.size = (size, size)
+        self.rect.center = (x, y)
+        # Float center; the integer rect alone would round away sub-pixel steps at 120 Hz
+        self.x = float(self.rect.centerx)
+        self.y = float(self.rect.centery)
+        self.prev_pos = self.rect.topleft  # Position at the previous simulation step
+        self.value = value
+        self.is_score = is_score  # True = puan, False = altın
+        
+        # Puanlar için hareket yok (sadece aşağı düşer), Altınlar için random hareket
+        if is_score:
+            self.vx = 0  # Puanlar yatay hareket etmez
+            self.vy = 3.0  # Puanlar sadece aşağı düşer (başlangıç hızı artırıldı)
+        else:
+            self.vx = rng.uniform(-2.0, 2.0)  # Altınlar sağa-sola hareket eder
+            self.vy = rng.uniform(-2.0, 2.0)
+        
+        self.age = 0.0  # Simulation time since spawn (seconds)
+        self.sparkle = 0.0
+    
+    def update(self, dt, player_pos=None, magnet_active=False):
+        age = self.age
+        self.age += dt
+        
+        # Puanlar için farklı hareket - sadece aşağı düşer (sağ-sol sallanma yok)
+        if self.is_score:
+            # Mıknatıs aktifse puanları rokete çek
+            if magnet_active and player_pos:
+                dx = player_pos[0] - self.x
+                dy = player_pos[1] - self.y
+                distance = math.sqrt(dx**2 + dy**2)
+                if distance > 0:
+                    magnet_force = 5.0 / max(distance / 100, 1.0)  # Puanlar için daha güçlü çekim
+                    self.x += (dx / distance) * magnet_force * dt * 60
+                    self.y += (dy / distance) * magnet_force * dt * 60
+            else:
+                # Puanlar: Sadece aşağı düşer, yerçekimi etkisi
+                self.vy += 0.3 * dt * 60  # Yerçekimi ivmesi
+                self.x += self.vx * dt * 60
+                self.y += self.vy * dt * 60
+                self.vx *= 0.98 ** (dt * 60)  # Hafif yatay yavaşlama
+        else:
+            # Altınlar: Sallanarak hareket eder (eski davranış)
+            swing_amount = math.sin(age * 3) * 2.0
+            
+            if magnet_active and player_pos:
+                dx = player_pos[0] - self.x
+                dy = player_pos[1] - self.y
+                distance = math.sqrt(dx**2 + dy**2)
+                if distance > 0:
+                    magnet_force = 3.0 / max(distance / 100, 1.0)
+                    self.x += (dx / distance) * magnet_force * dt * 60
+                    self.y += (dy / distance) * magnet_force * dt * 60
+                else:
+                    self.x += swing_amount * dt * 60
+                    self.x += self.vx * dt * 60
+                    self.y += self.vy * dt * 60
+                    self.vx *= 0.95 ** (dt * 60)
+                    self.vy *= 0.95 ** (dt * 60)
+            else:
+                self.x += swing_amount * dt * 60
+                self.x += self.vx * dt * 60
+                self.y += self.vy * dt * 60
+                self.vx *= 0.95 ** (dt * 60)
+                self.vy *= 0.95 ** (dt * 60)
+        
+        self.rect.center = (round(self.x), round(self.y))
+        self.sparkle = (math.sin(age * 8) + 1) / 2
+    
+    def draw(self, surface, offset=(0, 0)):
+        coin_size = self.rect.width // 2
+        glow_size = int(coin_size * (1.0 + self.sparkle * 0.5))
+        glow_alpha = int(150 * self.sparkle)
+        
+        # Farklı renk: Altın için sarı, Puan için değere göre farklı renkler
+        if self.is_score:
+            # Puan renkleri value'ya göre
+            if self.value == 3:
+                main_color = (200, 100, 255)  # Mor - 3 puan
+                inner_color = (230, 180, 255)
+            elif self.value == 2:
+                main_color = (100, 200, 255)  # Mavi - 2 puan
+                inner_color = (180, 230, 255)
+            else:  # 1 puan
+                main_color = (255, 220, 100)  # Sarı - 1 puan
+                inner_color = (255, 240, 180)
+        else:
+            main_color = Config.GOLD_COLOR  # Sarı - altın
+            inner_color = (255, 255, 200)
+        
+        glow_surf = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(glow_surf, (main_color[0], main_color[1], main_color[2], glow_alpha),
+                          (glow_size, glow_size), glow_size)
+        surface.blit(glow_surf, (self.rect.centerx - glow_size + offset[0], self.rect.centery - glow_size + offset[1]))
+        
+        pygame.draw.circle(surface, main_color,
+                          (self.rect.centerx + offset[0], self.rect.centery + offset[1]), coin_size)
+        pygame.draw.circle(surface, inner_color,
+                          (self.rect.centerx + offset[0], self.rect.centery + offset[1]), coin_size - 2)
+        
+        value_text = TEXT_CACHE.render(str(self.value), 12, (0, 0, 0))
+        value_rect = value_text.get_rect(center=(self.rect.centerx + offset[0], self.rect.centery + offset[1]))
+        surface.blit(value_text, value_rect)
+
+
+class Bullet:
+    def __init__(self, x, y):
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(x, y)
+    
+    def reset(self, x, y):
+        self.rect.update(x - Config.BULLET_WIDTH // 2, y, Config.BULLET_WIDTH, Config.BULLET_HEIGHT)
+        self.prev_pos = self.rect.topleft  # Position at the previous simulation step
+    
+    def update(self, dt):
+        self.rect.y -= Config.BULLET_SPEED * dt * 60
+    
+    def is_off_screen(self):
+        return self.rect.y < -Config.BULLET_HEIGHT
+    
+    def draw(self, surface, offset=(0, 0)):
+        glow_surf = pygame.Surface((self.rect.width + 6, self.rect.height + 6), pygame.SRCALPHA)
+        pygame.draw.ellipse(glow_surf, (Config.NEON_CYAN[0], Config.NEON_CYAN[1], Config.NEON_CYAN[2], 100),
+                           glow_surf.get_rect())
+        surface.blit(glow_surf, (self.rect.x - 3 + offset[0], self.rect.y - 3 + offset[1]))
+        pygame.draw.ellipse(surface, Config.NEON_CYAN,
+                          (self.rect.x + offset[0], self.rect.y + offset[1], self.rect.width, self.rect.height))
+
+
+class Meteor:
+    """View of one MeteorField slot for code that works on single meteors
+
+    Reads and writes go straight to the field's arrays; `rect` is the integer collision
+    rect the field keeps in step with the float position.
+    """
+    __slots__ = ("field", "slot")
+
+    def __init__(self, field, slot):
+        self.field = field
+        self.slot = slot
+
+    @property
+    def rect(self):
+        return self.field.rects[self.slot]
+
+    @property
+    def prev_pos(self):
+        return (int(self.field.prev_x[self.slot]), int(self.field.prev_y[self.slot]))
+
+    @property
+    def alive(self):
+        return bool(self.field.alive[self.slot])
+
+    @property
+    def generation(self):
+        return int(self.field.generation[self.slot])
+
+    @property
+    def size_type(self):
+        return METEOR_SIZES[self.field.size[self.slot]]
+
+    @property
+    def score_value(self):
+        return METEOR_CONFIGS[self.size_type]["score"]
+
+    @property
+    def color(self):
+        return METEOR_CONFIGS[self.size_type]["color"]
+
+    @property
+    def max_health(self):
+        return int(self.field.MAX_HEALTH[self.field.size[self.slot]])
+
+    @property
+    def health(self):
+        return int(self.field.health[self.slot])
+
+    @health.setter
+    def health(self, value):
+        self.field.health[self.slot] = value
+
+    @property
+    def velocity_x(self):
+        return float(self.field.vx[self.slot])
+
+    @velocity_x.setter
+    def velocity_x(self, value):
+        self.field.vx[self.slot] = value
+
+    @property
+    def velocity_y(self):
+        return float(self.field.vy[self.slot])
+
+    @velocity_y.setter
+    def velocity_y(self, value):
+        self.field.vy[self.slot] = value
+
+    def is_off_screen(self):
+        return self.rect.y > Config.WINDOW_HEIGHT + self.rect.height
+    
+    def draw(self, surface, offset=(0, 0)):
+        """Draw meteor from the pre-baked atlas (one blit per meteor)"""
+        center = (self.rect.centerx + offset[0], self.rect.centery + offset[1])
+        METEOR_ATLAS.draw(surface, self, center)
+
+
+class MeteorField:
+    """Fixed-capacity struct-of-arrays meteor storage with batched spawning and vectorized movement
+
+    Positions are floats; each slot keeps its integer collision box in the left/top/width
+    arrays (mirrored in a pygame.Rect for the views). Rect and radius queries go through a
+    SweepAndPrune over the live meteors, which sweeps straight from those arrays when a batch
+    is large. Live views sit in `active` in spawn order and removals follow the EntityPool
+    contract: kill() only flags, flush() drops the flagged meteors once per tick.
+    """
+    SIZES = np.array([METEOR_CONFIGS[size_type]["size"] for size_type in METEOR_SIZES], dtype=np.int32)
+    SPEED_MULTS = np.array([METEOR_CONFIGS[size_type]["speed_mult"] for size_type in METEOR_SIZES])
+    MAX_HEALTH = np.array([MeteorAtlas._max_health(size_type) for size_type in METEOR_SIZES], dtype=np.int32)
+
+    def __init__(self, capacity=Config.METEOR_CAPACITY, seed=None):
+        self.capacity = capacity
+        self.reseed(seed)
+        # Float64 positions so long runs accumulate the same way on every platform
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.prev_x = np.zeros(capacity)  # Position at the previous simulation step
+        self.prev_y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.left = np.zeros(capacity, dtype=np.int64)  # Integer collision box (truncated position)
+        self.top = np.zeros(capacity, dtype=np.int64)
+        self.width = np.zeros(capacity, dtype=np.int64)
+        self.size = np.zeros(capacity, dtype=np.uint8)  # Index into METEOR_SIZES
+        self.health = np.zeros(capacity, dtype=np.int32)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.generation = np.zeros(capacity, dtype=np.int64)
+        self.rects = [pygame.Rect(0, 0, 0, 0) for _ in range(capacity)]
+        self.views = [Meteor(self, slot) for slot in range(capacity)]
+        # Object arrays of the same, so the live ones are gathered in C for the index
+        self._view_array = np.fromiter(self.views, dtype=object, count=capacity)
+        self._rect_array = np.fromiter(self.rects, dtype=object, count=capacity)
+        self.active = []
+        self.free = list(range(capacity - 1, -1, -1))
+        self.dead = 0
+        self._slots = None  # Slots of `active` as an array, rebuilt after spawns and flushes
+        self.index = SweepAndPrune()
+        self._index_stale = True  # `index` is re-fed after spawns, kills, flushes and moves
+        self.drawn = []  # Screen rects blitted by the last draw() given `dirty`
+
+    def __len__(self):
+        return len(self.active)
+
+    def __iter__(self):
+        return iter(self.active)
+
+    def reseed(self, seed):
+        # Separate stream from the particles' so effects never shift meteor spawns
+        self.rng = np.random.default_rng(None if seed is None else (seed, 1))
+
+    def _live(self):
+        if self._slots is None:
+            self._slots = np.fromiter((meteor.slot for meteor in self.active), dtype=np.intp,
+                                      count=len(self.active))
+        return self._slots[self.alive[self._slots]]
+
+    def _invalidate(self):
+        self._slots = None
+        self._index_stale = True
+
+    def _broadphase(self):
+        """The index over the live meteors in spawn order"""
+        if self._index_stale:
+            live = self._live()
+
+            def boxes():
+                width = self.width[live]
+                return np.stack((self.left[live], self.top[live], width, width), axis=1)
+
+            self.index.rebuild(self._view_array[live].tolist(), self._rect_array[live].tolist(), boxes)
+            self._index_stale = False
+        return self.index
+
+    def _sync_rects(self, slots):
+        left = self.left[slots] = self.x[slots].astype(np.int64)
+        top = self.top[slots] = self.y[slots].astype(np.int64)
+        rects = self.rects
+        for slot, x, y in zip(slots.tolist(), left.tolist(), top.tolist()):
+            rect = rects[slot]
+            rect.x = x
+            rect.y = y
+
+    def spawn(self, count, target_pos=None, speed_scale=1.0):
+        """Spawn up to `count` meteors just above the screen; returns their views
+
+        With `target_pos`, each meteor aims at it with TARGETED_METEOR_CHANCE, otherwise
+        it falls with a small sideways drift. `speed_scale` slows down (or speeds up) the batch.
+        """
+        count = min(count, len(self.free))
+        if count <= 0:
+            return []
+        rng = self.rng
+        sizes = rng.integers(0, len(METEOR_SIZES), count)
+        widths = self.SIZES[sizes]
+        x = rng.integers(0, Config.WINDOW_WIDTH - widths + 1).astype(np.float64)
+        y = rng.integers(-widths * 3, -widths + 1).astype(np.float64)
+        base_speed = (2.5 + rng.uniform(0, 1.5, count)) * self.SPEED_MULTS[sizes]
+        vx = rng.uniform(-1.0, 1.0, count) * base_speed * 0.3
+        vy = base_speed
+        if target_pos is not None:
+            dx = target_pos[0] - x
+            dy = target_pos[1] - y
+            distance = np.hypot(dx, dy)
+            aimed = (rng.random(count) < Config.TARGETED_METEOR_CHANCE) & (distance > 0)
+            distance[~aimed] = 1.0
+            vx = np.where(aimed, dx / distance * base_speed, vx)
+            vy = np.where(aimed, dy / distance * base_speed, vy)
+
+        slots = np.array([self.free.pop() for _ in range(count)], dtype=np.intp)
+        self.x[slots] = self.prev_x[slots] = x
+        self.y[slots] = self.prev_y[slots] = y
+        self.vx[slots] = vx * speed_scale
+        self.vy[slots] = vy * speed_scale
+        self.width[slots] = widths
+        self.size[slots] = sizes
+        self.health[slots] = self.MAX_HEALTH[sizes]
+        self.alive[slots] = True
+        self.generation[slots] += 1
+        for slot, width in zip(slots.tolist(), widths.tolist()):
+            self.rects[slot].size = (width, width)
+        self._sync_rects(slots)
+
+        spawned = [self.views[slot] for slot in slots.tolist()]
+        self.active.extend(spawned)
+        self._invalidate()
+        return spawned
+
+    def kill(self, meteor):
+        """Flag `meteor` for removal at the next flush (safe to call twice)"""
+        if self.alive[meteor.slot]:
+            self.alive[meteor.slot] = False
+            self.dead += 1
+            self._index_stale = True
+
+    def flush(self):
+        if not self.dead:
+            return
+        survivors = []
+        for meteor in self.active:
+            if self.alive[meteor.slot]:
+                survivors.append(meteor)
+            else:
+                self.free.append(meteor.slot)
+        self.active[:] = survivors  # In place, so references to `active` stay valid
+        self.dead = 0
+        self._invalidate()
+
+    def clear(self):
+        for meteor in self.active:
+            self.free.append(meteor.slot)
+        self.alive[:] = False
+        self.active.clear()
+        self.dead = 0
+        self._invalidate()
+
+    def handle(self, meteor):
+        return (meteor.slot, meteor.generation)
+
+    def get(self, handle):
+        """The live meteor behind `handle`, or None if it has been killed or recycled"""
+        slot, generation = handle
+        if self.alive[slot] and self.generation[slot] == generation:
+            return self.views[slot]
+        return None
+
+    def store_previous(self):
+        self.prev_x[:] = self.x
+        self.prev_y[:] = self.y
+
+    def query_rects(self, rects):
+        """Live meteors overlapping each of `rects` (one list per rect, in spawn order)"""
+        return self._broadphase().query_rects(rects)
+
+    def query_rect(self, rect):
+        """Live meteors overlapping `rect`, in spawn order"""
+        return self.query_rects((rect,))[0]
+
+    def query_radius(self, x, y, radius):
+        """Live meteors whose center lies strictly within `radius` of (x, y), in spawn order"""
+        return self._broadphase().query_radius(x, y, radius)
+
+    def update(self, dt):
+        """Move every live meteor and kill the ones that can no longer come back on screen"""
+        if not self.active:
+            return
+        # Whole-array steps are cheaper than gathering the live slots; free slots are
+        # overwritten on spawn
+        x, y, vx, width = self.x, self.y, self.vx, self.width
+        x += vx * (dt * 60)
+        y += self.vy * (dt * 60)
+
+        # Below the screen, or fully past a side edge while still moving away from it
+        gone = self.alive & ((y > Config.WINDOW_HEIGHT + width)
+                             | ((x + width < 0) & (vx < 0)) | ((x > Config.WINDOW_WIDTH) & (vx > 0)))
+        if gone.any():
+            self.alive[gone] = False
+            self.dead += int(np.count_nonzero(gone))
+        self._sync_rects(self._live())
+        self._index_stale = True
+
+    def draw(self, surface, offset=(0, 0), alpha=1.0, dirty=None):
+        """Blit every live meteor from the atlas as a single blits() batch
+
+        `alpha` interpolates between the previous and current simulation step positions.
+        `dirty` receives the areas the meteors covered last time and now.
+        """
+        if dirty is not None:
+            for rect in self.drawn:
+                dirty.add(rect)
+            self.drawn = []
+        live = self._live()
+        if len(live) == 0:
+            return
+        atlas = METEOR_ATLAS
+        if atlas.surface is None:
+            atlas.build()
+        x = self.prev_x[live] + (self.x[live] - self.prev_x[live]) * alpha
+        y = self.prev_y[live] + (self.y[live] - self.prev_y[live]) * alpha
+        xs = (np.round(x) + (offset[0] - atlas.PADDING)).astype(np.int64).tolist()
+        ys = (np.round(y) + (offset[1] - atlas.PADDING)).astype(np.int64).tolist()
+        atlas_surface, area = atlas.surface, atlas.area
+        drawn = surface.blits([(atlas_surface, (x, y), area(METEOR_SIZES[size], health))
+                               for size, health, x, y
+                               in zip(self.size[live].tolist(), self.health[live].tolist(), xs, ys)],
+                              doreturn=dirty is not None)
+        if dirty is not None:
+            for rect in drawn:
+                dirty.add(rect)
+            self.drawn = drawn
+
+
+class Player:
+    def __init__(self, x, y):
+        self.rect = pygame.Rect(x, y, Config.PLAYER_WIDTH, Config.PLAYER_HEIGHT)
+        self.x = float(self.rect.x)  # Float top-left, written back to the rect after every step
+        self.y = float(self.rect.y)
+        self.prev_pos = self.rect.topleft  # Position at the previous simulation step
+        self.velocity_x = 0.0
+        self.velocity_y = 0.0
+        self.rotation = 0.0
+        self.target_rotation = 0.0
     
     def update(self, dt, keys, speed_multiplier=1.0):
         acceleration_x = 0.0
@@ -523,37 +2603,40 @@ class Player:
         self.velocity_x += acceleration_x * dt * 60
         self.velocity_y += acceleration_y * dt * 60
         
-        self.velocity_x *= Config.PLAYER_FRICTION
-        self.velocity_y *= Config.PLAYER_FRICTION
+        friction = Config.PLAYER_FRICTION ** (dt * 60)
+        self.velocity_x *= friction
+        self.velocity_y *= friction
         
         speed = math.sqrt(self.velocity_x**2 + self.velocity_y**2)
         if speed > current_max_speed:
             self.velocity_x = (self.velocity_x / speed) * current_max_speed
             self.velocity_y = (self.velocity_y / speed) * current_max_speed
         
-        self.rect.x += self.velocity_x * dt * 60
-        self.rect.y += self.velocity_y * dt * 60
+        self.x += self.velocity_x * dt * 60
+        self.y += self.velocity_y * dt * 60
         
-        self.rect.x = max(0, min(self.rect.x, Config.WINDOW_WIDTH - Config.PLAYER_WIDTH))
-        self.rect.y = max(0, min(self.rect.y, Config.WINDOW_HEIGHT - Config.PLAYER_HEIGHT))
+        self.x = max(0.0, min(self.x, Config.WINDOW_WIDTH - Config.PLAYER_WIDTH))
+        self.y = max(0.0, min(self.y, Config.WINDOW_HEIGHT - Config.PLAYER_HEIGHT))
+        self.rect.topleft = (round(self.x), round(self.y))
     
     def get_speed(self):
         return math.sqrt(self.velocity_x**2 + self.velocity_y**2)
     
-    def shoot(self, weapon_level):
+    def shoot(self, weapon_level, bullet_pool):
+        """Spawn this weapon level's bullets into `bullet_pool` and return them"""
         bullets = []
         if weapon_level == 1:
             # Tek atış - ortada
-            bullets.append(Bullet(self.rect.centerx, self.rect.top))
+            bullets.append(bullet_pool.spawn(self.rect.centerx, self.rect.top))
         elif weapon_level == 2:
             # Çift atış - sağ ve sol
-            bullets.append(Bullet(self.rect.centerx - 15, self.rect.top))
-            bullets.append(Bullet(self.rect.centerx + 15, self.rect.top))
+            bullets.append(bullet_pool.spawn(self.rect.centerx - 15, self.rect.top))
+            bullets.append(bullet_pool.spawn(self.rect.centerx + 15, self.rect.top))
         elif weapon_level >= 3:
             # Üçlü atış - orta, sağ ve sol (3 mermi aynı anda)
-            bullets.append(Bullet(self.rect.centerx, self.rect.top))  # Ortada
-            bullets.append(Bullet(self.rect.centerx - 20, self.rect.top))  # Solda
-            bullets.append(Bullet(self.rect.centerx + 20, self.rect.top))  # Sağda
+            bullets.append(bullet_pool.spawn(self.rect.centerx, self.rect.top))  # Ortada
+            bullets.append(bullet_pool.spawn(self.rect.centerx - 20, self.rect.top))  # Solda
+            bullets.append(bullet_pool.spawn(self.rect.centerx + 20, self.rect.top))  # Sağda
         return bullets
     
     def draw(self, surface, offset=(0, 0), keys=None, speed_multiplier=1.0):
@@ -564,64 +2647,23 @@ class Player:
         rocket_center = (self.rect.centerx + offset[0], self.rect.centery + offset[1])
         rocket_bottom = (self.rect.centerx + offset[0], self.rect.bottom + offset[1])
         
-        # Rocket (drawn FIRST to get correct positioning for flame)
-        rotated_rocket = None
+        # Rocket (drawn FIRST to get correct positioning for flame), pre-rotated in ROCKET_SPRITES
+        rotated_rocket = ROCKET_SPRITES.rocket(self.rotation)
         rocket_rect = None
-        
-        if self.image is not None:
-            if abs(self.rotation) > 0.1:
-                # Rotate rocket image
-                rotated_rocket = pygame.transform.rotate(self.image, -self.rotation)
-                # Get rect centered on rocket center (prevents diagonal drift)
-                rocket_rect = rotated_rocket.get_rect(center=rocket_center)
-            else:
-                rotated_rocket = self.image
-                rocket_rect = self.image.get_rect(topleft=(draw_x, draw_y))
+        if rotated_rocket is not None:
+            # Rect centered on rocket center (prevents diagonal drift)
+            rocket_rect = rotated_rocket.get_rect(center=rocket_center)
         
         # Flame - draw BEFORE rocket (behind), pinned to rocket's bottom
-        if keys and self.flame_image is not None and rotated_rocket is not None:
-            is_accelerating = keys[pygame.K_UP] or keys[pygame.K_w]
-            speed = self.get_speed()
+        if keys and rotated_rocket is not None and (keys[pygame.K_UP] or keys[pygame.K_w]):
             current_max_speed = Config.PLAYER_MAX_SPEED * speed_multiplier
-            
-            # Calculate flame size based on acceleration
-            if is_accelerating:
-                speed_ratio = min(speed / current_max_speed, 1.0)
-                flame_alpha = int(180 + (speed_ratio * 75))
-                flame_height_multiplier = 0.4 + (speed_ratio * 2.1)
-                flame_width_multiplier = 0.5 + (speed_ratio * 0.5)
-            else:
-                flame_alpha = 0
-                flame_height_multiplier = 0
-                flame_width_multiplier = 0
-            
-            if flame_alpha > 0:
-                # Calculate flame size
-                target_base_width = int(Config.PLAYER_WIDTH * 0.7)
-                target_base_height = int(Config.PLAYER_HEIGHT * 0.8)
-                base_flame_width = max(int(target_base_width * flame_width_multiplier), Config.PLAYER_WIDTH // 4)
-                base_flame_height = max(int(target_base_height * flame_height_multiplier), Config.PLAYER_HEIGHT // 5)
-                
-                # Scale flame
-                scaled_flame = pygame.transform.smoothscale(self.flame_image, (base_flame_width, base_flame_height))
-                
-                # Remove black background FIRST
-                scaled_flame = scaled_flame.convert_alpha()
-                scaled_flame.set_colorkey((0, 0, 0))
-                
-                # Apply transparency
-                scaled_flame.set_alpha(flame_alpha)
-                
-                # Rotate flame WITH rocket (same angle)
-                if abs(self.rotation) > 0.1:
-                    scaled_flame = pygame.transform.rotate(scaled_flame, -self.rotation)
-                
+            speed_ratio = min(self.get_speed() / current_max_speed, 1.0)
+            flame = ROCKET_SPRITES.flame(speed_ratio, self.rotation)
+            if flame is not None:
                 # Pin flame to rocket's bottom center (midbottom)
-                flame_rect = scaled_flame.get_rect()
+                flame_rect = flame.get_rect()
                 flame_rect.midtop = rocket_rect.midbottom
-                
-                # Draw flame FIRST (behind rocket)
-                surface.blit(scaled_flame, flame_rect)
+                surface.blit(flame, flame_rect)
         
         # Draw rocket AFTER flame (on top)
         if rotated_rocket is not None and rocket_rect is not None:
@@ -633,10 +2675,37 @@ class Player:
 
 # ==================== MAIN GAME CLASS ====================
 class Game:
-    def __init__(self):
+    def __init__(self, headless=False, input_source=None, seed=None, audio_buffer=Config.AUDIO_BUFFER,
+                 store=None, history=None):
+        # Boot timings in ms since construction (init, first_frame, fully_loaded), see _mark_boot
+        self.boot_started = time.perf_counter()
+        self.boot_times = {}
+        self.headless = headless
+        if headless:
+            # No window and no audio device; the dummy display still supports convert_alpha
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+        self.input = input_source or KeyboardInput()
+        self.keys = KeyState()
+        self.recorder = None  # Replay being recorded, if any
+        self.profiler = FrameProfiler()  # Toggled with F3
+        
+        # Seeded randomness: the session seed derives one seed per run (see start_game)
+        self.seed = seed if seed is not None else random.getrandbits(63)
+        self.session_rng = random.Random(self.seed)
+        self.run_seed = self.session_rng.getrandbits(63)
+        self.rng = random.Random(self.run_seed)
+        
+        # Sound cues and music; the mixer is configured before pygame.init opens it
+        self.audio = SoundBank()
+        self.audio.pre_init(audio_buffer)
         pygame.init()
-        self.screen = pygame.display.set_mode((Config.WINDOW_WIDTH, Config.WINDOW_HEIGHT),
-                                              pygame.HWSURFACE | pygame.DOUBLEBUF)
+        self.audio.open()
+        if headless:
+            self.screen = pygame.display.set_mode((Config.WINDOW_WIDTH, Config.WINDOW_HEIGHT))
+        else:
+            self.screen = pygame.display.set_mode((Config.WINDOW_WIDTH, Config.WINDOW_HEIGHT),
+                                                  pygame.HWSURFACE | pygame.DOUBLEBUF)
         pygame.display.set_caption("Space Shooter")
         self.clock = pygame.time.Clock()
         self.running = True
@@ -645,16 +2714,30 @@ class Game:
         self.state = "menu"  # menu, playing, paused, shop, settings
         self.shop_section = "main"  # main, weapons
         self.language = Language.TURKISH
-        self.volume = 0.5  # Volume level (0.0 to 1.0)
+        self.volume = 0.5  # Master volume level (0.0 to 1.0)
+        self.audio.set_master(self.volume)
         
         # Game objects
         self.player = None
-        self.meteors = []
-        self.bullets = []
-        self.coins = []
-        self.particles = []
-        self.screen_shake = ScreenShake()
-        self.background = ParallaxBackground(Config.WINDOW_WIDTH, Config.WINDOW_HEIGHT)
+        # Pooled entities; the lists are the pools' live views and are compacted in place
+        self.meteor_pool = MeteorField(seed=self.run_seed)  # Arrays with a Meteor view per slot
+        self.bullet_pool = EntityPool(Bullet)
+        self.coin_pool = EntityPool(Coin)
+        self.meteors = self.meteor_pool.active
+        self.bullets = self.bullet_pool.active
+        self.coins = self.coin_pool.active
+        self.particles = ParticleSystem(seed=self.run_seed)
+        self.render_alpha = 1.0  # Interpolation factor between the last two simulation steps
+        self.coin_index = SweepAndPrune()
+        self.screen_shake = ScreenShake(self.rng)
+        # Offscreen world layer (starfield and entities), composited in one blit at the shake
+        # offset; the margin keeps the edges covered while the view is shaken
+        margin = Config.WORLD_MARGIN
+        self.world_layer = pygame.Surface((Config.WINDOW_WIDTH + 2 * margin,
+                                           Config.WINDOW_HEIGHT + 2 * margin))
+        self.world_origin = (margin, margin)  # Screen (0, 0) in world layer coordinates
+        self.background = ParallaxBackground(self.world_layer.get_width(), self.world_layer.get_height(),
+                                             self.rng)
         
         # Game stats
         self.current_score = 0.0
@@ -662,6 +2745,8 @@ class Game:
         self.high_score = 0.0
         self.last_run_score = 0
         self.is_new_record = False
+        self.run_start_gold = 0
+        self.run_loadout = "none"  # Upgrades the current run started with, see _loadout
         
         # Shop items
         self.weapon_level = 1
@@ -675,102 +2760,156 @@ class Game:
         self.spawn_timer = 0.0  # Time accumulator for dt-based spawning
         self.game_time = 0.0
         self.base_spawn_interval = 1.2  # Base spawn interval in seconds (smooth continuous flow)
+        self.max_meteors = Config.MAX_METEORS_ON_SCREEN  # Raised in meteor-storm mode
+        self.meteor_spawn_batch = 1
+        
+        # Retained UI screens, built on first use and rebuilt when the language changes (see _ui)
+        self.ui_screens = {}
+        self.ui_language = None
+        self.ui_hover_screen = None
         
-        # Button states (for realistic button interactions)
-        self.pressed_buttons = {}  # Track which buttons are currently pressed
-        self.button_scales = {}  # Track button scales for LERP animation
-        self.button_glow_intensities = {}  # Track glow intensities for LERP
+        # Bloom effect surface (drawn in world layer coordinates)
+        self.bloom = BloomPass(self.world_layer.get_width(), self.world_layer.get_height())
         
-        # Bloom effect surface
-        self.bloom_surface = pygame.Surface((Config.WINDOW_WIDTH, Config.WINDOW_HEIGHT), pygame.SRCALPHA)
+        # Cached static screen layers (see draw_menu / draw_paused)
+        self.dim_overlay = pygame.Surface((Config.WINDOW_WIDTH, Config.WINDOW_HEIGHT), pygame.SRCALPHA)
+        self.dim_overlay.fill((0, 0, 0, 180))  # Dark overlay behind pause, settings and equipment panels
+        self.menu_layer = None
+        self.menu_layer_key = None
+        self.pause_backdrop = None
+        self.pause_backdrop_language = None
+        
+        # Presentation: full flip, or only the changed regions with --dirty-rects
+        self.dirty = DirtyRegions(Config.WINDOW_WIDTH, Config.WINDOW_HEIGHT)
+        self.dirty_frame_key = None
         
         # Fade effect for menu transitions (disabled for instant transitions)
         self.fade_alpha = 0
         self.fade_direction = 0  # 0 = none, 1 = fade in, -1 = fade out
         self.fade_speed = 20.0  # Much faster fade
         
-        # Sounds
-        self.hit_sound = None
-        self.start_sound = None
-        self._load_sounds()
-        
-        # Language flag images
-        self.turk_flag_image = None
-        self.eng_flag_image = None
-        self.settings_icon_image = None
-        self._load_flag_images()
-        self._load_settings_icon()
-        
+        # Images and sounds are decoded on a worker thread started after the first frame, so
+        # the menu comes up right away and shows the loading progress (see _poll_assets)
+        self.preloader = AssetPreloader(ASSETS, () if headless else SOUND_MANIFEST)
+        self.boot_progress_rect = None  # Where the loading bar was last drawn
+
+        # Pre-bake meteor sprites once so drawing is a single blit per meteor
+        METEOR_ATLAS.build()
+
         # Initialize menu meteors for background effect
         for _ in range(4):
             self._spawn_menu_meteor()
+        
+        # Saved profile, written behind by the store's worker (see _persist)
+        self.store = store
+        self.saved_state = None
+        if store is not None:
+            saved = store.load()
+            if saved is not None:
+                self._apply_saved_state(saved)
+            self.saved_state = self._saved_state()
+            store.start()
+        
+        # Finished runs go to the leaderboard database on its own worker
+        self.history = history
+        if history is not None:
+            history.start()
+        self._mark_boot("init_ms")
     
-    def _load_sounds(self):
-        try:
-            if os.path.exists("hit.wav"):
-                self.hit_sound = pygame.mixer.Sound("hit.wav")
-        except:
-            pass
-        try:
-            if os.path.exists("start.wav"):
-                self.start_sound = pygame.mixer.Sound("start.wav")
-        except:
-            pass
-        try:
-            if os.path.exists("music.mp3") or os.path.exists("music.ogg"):
-                music_file = "music.mp3" if os.path.exists("music.mp3") else "music.ogg"
-                pygame.mixer.music.load(music_file)
-                pygame.mixer.music.set_volume(self.volume)
-                pygame.mixer.music.play(-1)
-        except:
-            pass
+    def _mark_boot(self, milestone):
+        """Record the first time `milestone` is reached, in ms since the game was created"""
+        if milestone not in self.boot_times:
+            self.boot_times[milestone] = (time.perf_counter() - self.boot_started) * 1000.0
     
-    def _load_flag_images(self):
-        """Load flag images for language selection"""
-        flag_size = 40  # Bayrak boyutu
+    def _poll_assets(self):
+        """Start the preloader after the first frame, then swap in what it finished
         
-        # Türk bayrağı - yeni görsel
-        turk_flag_paths = [
-            "turk_bayragi.png",
-            r"C:\Users\Eren\.cursor\projects\c-Users-Eren-Desktop-proje-yap-m\assets\c__Users_Eren_AppData_Roaming_Cursor_User_workspaceStorage_22ea1cbefb422ba0484b2555f2307e4a_images_images-7d34a241-0627-49bb-b7dd-47d3b7aca5d9.png"
-        ]
-        for path in turk_flag_paths:
-            try:
-                if os.path.exists(path):
-                    self.turk_flag_image = pygame.image.load(path).convert_alpha()
-                    self.turk_flag_image = pygame.transform.smoothscale(self.turk_flag_image, (flag_size, flag_size))
-                    break
-            except:
-                continue
-        
-        # İngilizce bayrağı
-        eng_flag_paths = [
-            "ingilizce_bayragi.png",
-            r"C:\Users\Eren\.cursor\projects\c-Users-Eren-Desktop-proje-yap-m\assets\c__Users_Eren_AppData_Roaming_Cursor_User_workspaceStorage_22ea1cbefb422ba0484b2555f2307e4a_images_download-6be46051-ada2-4875-a00c-703f062ebaf7.png"
-        ]
-        for path in eng_flag_paths:
-            try:
-                if os.path.exists(path):
-                    self.eng_flag_image = pygame.image.load(path).convert_alpha()
-                    self.eng_flag_image = pygame.transform.smoothscale(self.eng_flag_image, (flag_size, flag_size))
-                    break
-            except:
-                continue
+        The music starts once everything is loaded.
+        """
+        if self.preloader.finished:
+            return
+        if not self.preloader.started:
+            # Only now: on a single core the worker would otherwise delay the first frame
+            self.preloader.start()
+            return
+        adopted = self.preloader.poll()
+        if any(kind == "image" for kind, name in adopted):
+            self.ui_language = None  # Rebuild the screens so they pick up the new images
+        for kind, name in adopted:
+            if kind == "sound":
+                self.audio.add(name, ASSETS.sounds.get(name))
+        if not self.preloader.finished:
+            return
+        self._mark_boot("fully_loaded_ms")
+        music_file = ASSETS.find(MUSIC_FILES)
+        if music_file is not None and not self.headless:
+            self.audio.play_music(music_file)
     
-    def _load_settings_icon(self):
-        """Load settings icon image"""
-        icon_size = 60  # Icon size for top-left corner
-        
+    def _saved_state(self):
+        """The part of the game that outlives a session"""
+        return {
+            "high_score": self.high_score,
+            "total_gold": self.total_gold,
+            "has_shield": self.has_shield,
+            "has_magnet": self.has_magnet,
+            "speed_boost_level": self.speed_boost_level,
+            "weapon_level": self.weapon_level,
+            "volume": self.volume,
+            "language": self.language.value
+        }
+    
+    def _apply_saved_state(self, state):
+        # A save from another version may lack fields or hold odd ones; those keep their defaults
         try:
-            if os.path.exists("settings.png"):
-                self.settings_icon_image = pygame.image.load("settings.png").convert_alpha()
-                self.settings_icon_image = pygame.transform.smoothscale(self.settings_icon_image, (icon_size, icon_size))
-        except:
-            self.settings_icon_image = None
+            self.high_score = float(state.get("high_score", self.high_score))
+            self.total_gold = int(state.get("total_gold", self.total_gold))
+            self.has_shield = bool(state.get("has_shield", self.has_shield))
+            self.has_magnet = bool(state.get("has_magnet", self.has_magnet))
+            self.speed_boost_level = min(3, max(0, int(state.get("speed_boost_level",
+                                                                 self.speed_boost_level))))
+            self.weapon_level = min(3, max(1, int(state.get("weapon_level", self.weapon_level))))
+            self._set_volume(float(state.get("volume", self.volume)))
+            self.language = Language(state.get("language", self.language.value))
+        except (TypeError, ValueError, AttributeError):
+            pass
+    
+    def _persist(self):
+        """Hand the profile to the store whenever it changed; the write happens off-thread"""
+        if self.store is None:
+            return
+        state = self._saved_state()
+        if state != self.saved_state:
+            self.saved_state = state
+            self.store.save(state)
+    
+    def _draw_boot_progress(self, surface):
+        """Thin loading bar with a percentage at the bottom of the screen"""
+        progress = self.preloader.progress
+        bar = pygame.Rect(0, 0, 240, 4)
+        bar.midbottom = (Config.WINDOW_WIDTH // 2, Config.WINDOW_HEIGHT - 20)
+        pygame.draw.rect(surface, (40, 40, 60), bar, border_radius=2)
+        pygame.draw.rect(surface, Config.NEON_CYAN, (bar.x, bar.y, int(bar.width * progress), bar.height),
+                         border_radius=2)
+        label = self._text(f"{self.t('loading')} {int(progress * 100)}%", 16, (150, 150, 200))
+        label_rect = label.get_rect(midbottom=(bar.centerx, bar.top - 6))
+        surface.blit(label, label_rect)
+        self._move_boot_progress(label_rect.union(bar))
+    
+    def _move_boot_progress(self, rect):
+        """Report the loading bar's old and new area (None once it is gone) as dirty"""
+        if self.boot_progress_rect is not None:
+            self.dirty.add(self.boot_progress_rect)
+        if rect is not None:
+            self.dirty.add(rect)
+        self.boot_progress_rect = rect
     
     def t(self, key):
         return TRANSLATIONS[self.language].get(key, key)
-    
+
+    def _text(self, text, size, color):
+        """Render text through the shared font registry and LRU text cache"""
+        return TEXT_CACHE.render(text, size, color, self.language)
+
     def _clamp_mouse_pos(self, pos):
         """Clamp mouse position to screen bounds to prevent crashes"""
         x, y = pos
@@ -788,16 +2927,23 @@ class Game:
     
     def start_game(self):
         self.state = "playing"
+        # Every run gets its own reproducible random stream
+        self.run_seed = self.session_rng.getrandbits(63)
+        self.rng.seed(self.run_seed)
+        self.particles.reseed(self.run_seed)
+        self.meteor_pool.reseed(self.run_seed)
         self.game_time = 0.0
         self.current_score = 0.0
         self.player = Player(Config.WINDOW_WIDTH // 2 - Config.PLAYER_WIDTH // 2,
                             Config.WINDOW_HEIGHT - Config.PLAYER_HEIGHT - 50)
-        self.meteors.clear()
-        self.bullets.clear()
-        self.coins.clear()
+        self.meteor_pool.clear()
+        self.bullet_pool.clear()
+        self.coin_pool.clear()
         self.particles.clear()
         self.spawn_timer = 0.0  # Reset spawn timer
         self.screen_shake.intensity = 0.0
+        self.run_start_gold = self.total_gold
+        self.run_loadout = self._loadout()
         
         # Shield kontrolü - satın alındıysa aktif
         if self.has_shield:
@@ -807,49 +2953,39 @@ class Game:
         # Mıknatıs satın alındıysa aktif (çarpışınca yok olur)
         # Hız ve silah da satın alındıysa aktif (oyun boyunca kullanılır)
         
-        if self.start_sound:
-            self.start_sound.play()
+        self.audio.play("start")
         
         # Initial meteors
-        for _ in range(3):
-            self._spawn_meteor()
+        self._spawn_meteors(3)
     
-    def _spawn_meteor(self):
-        if len(self.meteors) >= Config.MAX_METEORS_ON_SCREEN:
+    def set_meteor_storm(self, enabled):
+        """Meteor-storm mode: hundreds of meteors on screen, spawned in large batches"""
+        self.max_meteors = Config.METEOR_STORM_MAX_METEORS if enabled else Config.MAX_METEORS_ON_SCREEN
+        self.meteor_spawn_batch = Config.METEOR_STORM_SPAWN_BATCH if enabled else 1
+    
+    def _spawn_meteors(self, count=1):
+        """Spawn a batch of meteors, up to the on-screen limit"""
+        count = min(count, self.max_meteors - len(self.meteors))
+        if count <= 0:
             return
         
-        size_type = random.choice(list(MeteorSize))
-        meteor_size = METEOR_CONFIGS[size_type]["size"]
-        x = random.randint(0, Config.WINDOW_WIDTH - meteor_size)
-        y = random.randint(-meteor_size * 3, -meteor_size)
-        
         target_pos = None
         if self.player:
             target_pos = (self.player.rect.centerx, self.player.rect.centery)
         
-        meteor = Meteor(x, y, size_type, target_pos)
-        self.meteors.append(meteor)
+        self.meteor_pool.spawn(count, target_pos)
     
     def _spawn_menu_meteor(self):
         """Spawn meteors for menu background effect (non-targeting, slower)"""
         if len(self.meteors) >= 8:  # Limit for menu
             return
         
-        size_type = random.choice(list(MeteorSize))
-        meteor_size = METEOR_CONFIGS[size_type]["size"]
-        x = random.randint(0, Config.WINDOW_WIDTH - meteor_size)
-        y = random.randint(-meteor_size * 3, -meteor_size)
-        
-        # No targeting for menu meteors - just random movement
-        meteor = Meteor(x, y, size_type, None)
-        # Slow down meteors for menu background effect
-        meteor.velocity_x *= 0.5
-        meteor.velocity_y *= 0.5
-        self.meteors.append(meteor)
+        # No targeting for menu meteors - just random movement, at half speed
+        self.meteor_pool.spawn(1, speed_scale=0.5)
     
     def _update_spawn_system(self, dt):
         """Update meteor spawn system using dt for smooth continuous flow (no pauses)"""
-        if len(self.meteors) >= Config.MAX_METEORS_ON_SCREEN:
+        if len(self.meteors) >= self.max_meteors:
             return
         
         # Calculate dynamic spawn interval based on game time (gradually decreases)
@@ -865,15 +3001,11 @@ class Game:
             spawn_count = 1
             # Increase spawn count as game progresses
             if self.game_time > 15:
-                spawn_count = random.randint(1, 2)
+                spawn_count = self.rng.randint(1, 2)
             if self.game_time > 45:
-                spawn_count = random.randint(1, 3)
-            
-            available_slots = Config.MAX_METEORS_ON_SCREEN - len(self.meteors)
-            spawn_count = min(spawn_count, available_slots)
+                spawn_count = self.rng.randint(1, 3)
             
-            for _ in range(spawn_count):
-                self._spawn_meteor()
+            self._spawn_meteors(spawn_count * self.meteor_spawn_batch)
             
             # Reset timer (keep remainder for smooth flow)
             self.spawn_timer = 0.0
@@ -884,23 +3016,9 @@ class Game:
         if is_large:
             particle_count = max(particle_count, 12)
         
-        # Enhanced particle colors with neon tints
-        particle_colors = [
-            (180, 100, 220),  # Purple debris
-            (200, 60, 240),   # Bright purple
-            (255, 150, 0),    # Orange sparks
-            (255, 200, 100),  # Bright orange
-            (150, 150, 200),  # Blue-gray debris
-            (100, 100, 150)   # Dark debris
-        ]
-        
-        for _ in range(particle_count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2.5, 7.0)  # Slightly faster particles
-            color = random.choice(particle_colors)
-            # Vary particle size
-            size = random.randint(3, 8) if meteor_type == MeteorSize.LARGE else random.randint(2, 6)
-            self.particles.append(Particle(x, y, math.cos(angle) * speed, math.sin(angle) * speed, color, size=size))
+        # Enhanced particle colors with neon tints, slightly faster particles, varied sizes
+        size_range = (3, 8) if meteor_type == MeteorSize.LARGE else (2, 6)
+        self.particles.emit_burst(x, y, particle_count, (2.5, 7.0), size_range, EXPLOSION_COLORS)
         
         # Enhanced screen shake based on meteor size
         shake_amount = 4.0 if meteor_type == MeteorSize.LARGE else 2.5 if meteor_type == MeteorSize.MEDIUM else 1.5
@@ -908,37 +3026,45 @@ class Game:
             shake_amount = max(shake_amount, 3.0)
         self.screen_shake.add_shake(shake_amount)
     
+    def _create_hit_sparks(self, x, y):
+        """Small white spark burst when a meteor is hit but not destroyed"""
+        self.particles.emit_burst(x, y, 3, (1, 3), (2, 2), [HIT_SPARK_COLOR], life=0.3)
+    
     def _spawn_coins(self, x, y):
-        if random.random() < Config.COIN_DROP_CHANCE:
-            coin_count = random.randint(1, 3)
+        if self.rng.random() < Config.COIN_DROP_CHANCE:
+            coin_count = self.rng.randint(1, 3)
             for _ in range(coin_count):
-                angle = random.uniform(0, 2 * math.pi)
-                spread_distance = random.uniform(30, 60)
+                angle = self.rng.uniform(0, 2 * math.pi)
+                spread_distance = self.rng.uniform(30, 60)
                 coin_x = x + math.cos(angle) * spread_distance
                 coin_y = y + math.sin(angle) * spread_distance
-                self.coins.append(Coin(coin_x, coin_y, random.choice([1, 1, 1, 2, 3]), is_score=False))
+                self.coin_pool.spawn(coin_x, coin_y, self.rng.choice([1, 1, 1, 2, 3]), is_score=False,
+                                     rng=self.rng)
     
     def _spawn_score_drops(self, x, y, size_type):
         """Spawn score pickups based on meteor size"""
         if size_type == MeteorSize.SMALL:
             # Küçük: %20 şansla 1 puan
-            if random.random() < 0.2:
-                self.coins.append(Coin(x, y, 1, is_score=True))
+            if self.rng.random() < 0.2:
+                self.coin_pool.spawn(x, y, 1, is_score=True, rng=self.rng)
         elif size_type == MeteorSize.MEDIUM:
             # Orta: random 0, 1, veya 2 puan
-            score_value = random.choice([0, 1, 2])
+            score_value = self.rng.choice([0, 1, 2])
             if score_value > 0:
-                self.coins.append(Coin(x, y, score_value, is_score=True))
+                self.coin_pool.spawn(x, y, score_value, is_score=True, rng=self.rng)
         else:  # LARGE
             # Büyük: Her zaman 2 veya 3 puan
-            score_value = random.choice([2, 3])
-            self.coins.append(Coin(x, y, score_value, is_score=True))
+            score_value = self.rng.choice([2, 3])
+            self.coin_pool.spawn(x, y, score_value, is_score=True, rng=self.rng)
     
     def update_playing(self, dt, keys):
+        profiler = self.profiler
+        profiler.mark("update_other")
         self.game_time += dt
         
         # Spawn system (dt-based for smooth continuous flow)
         self._update_spawn_system(dt)
+        profiler.mark("spawn")
         
         # Screen shake
         self.screen_shake.update(dt)
@@ -957,61 +3083,51 @@ class Game:
             self.is_new_record = True
         else:
             self.is_new_record = False
+        profiler.mark("player")
         
-        # Bullets
-        for bullet in self.bullets[:]:
+        # Bullets: moved first, then tested against all live meteors in one batched query
+        # Removals only flag entities; the pools are compacted once at the end of the tick
+        for bullet in self.bullets:
             bullet.update(dt)
             if bullet.is_off_screen():
-                self.bullets.remove(bullet)
+                self.bullet_pool.kill(bullet)
+        bullets = [bullet for bullet in self.bullets if bullet.alive]
+        for bullet, hits in zip(bullets, self.meteor_pool.query_rects([bullet.rect for bullet in bullets])):
+            # A meteor destroyed by an earlier bullet this tick no longer counts
+            meteor = next((meteor for meteor in hits if meteor.alive), None)
+            if meteor is None:
                 continue
             
-            for meteor in self.meteors[:]:
-                if bullet.rect.colliderect(meteor.rect):
-                    self.bullets.remove(bullet)
-                    
-                    # Reduce meteor health
-                    meteor.health -= 1
-                    
-                    # Only destroy if health reaches 0
-                    if meteor.health <= 0:
-                        meteor_pos = meteor.rect.center
-                        self._create_explosion(meteor_pos[0], meteor_pos[1], meteor.size_type)
-                        self._spawn_coins(meteor_pos[0], meteor_pos[1])  # Altın düşür
-                        self._spawn_score_drops(meteor_pos[0], meteor_pos[1], meteor.size_type)  # Puan düşür
-                        self.meteors.remove(meteor)
-                    else:
-                        # Hit effect but not destroyed - create small particle effect
-                        meteor_pos = meteor.rect.center
-                        for _ in range(3):
-                            angle = random.uniform(0, math.pi * 2)
-                            speed = random.uniform(1, 3)
-                            self.particles.append(
-                                Particle(meteor_pos[0], meteor_pos[1],
-                                       math.cos(angle) * speed, math.sin(angle) * speed,
-                                       (255, 255, 255), life=0.3, size=2)
-                            )
-                    break
+            self.bullet_pool.kill(bullet)
+            # Reduce meteor health
+            meteor.health -= 1
+            
+            # Only destroy if health reaches 0
+            if meteor.health <= 0:
+                meteor_pos = meteor.rect.center
+                self._create_explosion(meteor_pos[0], meteor_pos[1], meteor.size_type)
+                self._spawn_coins(meteor_pos[0], meteor_pos[1])  # Altın düşür
+                self._spawn_score_drops(meteor_pos[0], meteor_pos[1], meteor.size_type)  # Puan düşür
+                self.meteor_pool.kill(meteor)
+            else:
+                # Hit effect but not destroyed - create small particle effect
+                meteor_pos = meteor.rect.center
+                self._create_hit_sparks(meteor_pos[0], meteor_pos[1])
+        profiler.mark("bullets")
         
-        # Meteors
-        for meteor in self.meteors[:]:
-            meteor.update(dt)
-            if meteor.is_off_screen():
-                self.meteors.remove(meteor)
+        # Meteors (moved and culled as arrays)
+        self.meteor_pool.update(dt)
         
         # Space destroy
         if keys[pygame.K_SPACE]:
             destroy_radius = 150
-            for meteor in self.meteors[:]:
-                distance = math.sqrt(
-                    (meteor.rect.centerx - self.player.rect.centerx)**2 +
-                    (meteor.rect.centery - self.player.rect.centery)**2
-                )
-                if distance < destroy_radius:
-                    meteor_pos = meteor.rect.center
-                    self.current_score += meteor.score_value
-                    self._create_explosion(meteor_pos[0], meteor_pos[1], meteor.size_type, is_large=True)
-                    self._spawn_coins(meteor_pos[0], meteor_pos[1])
-                    self.meteors.remove(meteor)
+            for meteor in self.meteor_pool.query_radius(self.player.rect.centerx, self.player.rect.centery,
+                                                        destroy_radius):
+                meteor_pos = meteor.rect.center
+                self.current_score += meteor.score_value
+                self._create_explosion(meteor_pos[0], meteor_pos[1], meteor.size_type, is_large=True)
+                self._spawn_coins(meteor_pos[0], meteor_pos[1])
+                self.meteor_pool.kill(meteor)
         
         # Shield
         if self.has_shield and self.shield_active:
@@ -1020,94 +3136,112 @@ class Game:
                 self.shield_active = False
         
         # Collisions
-        for meteor in self.meteors[:]:
-            if self.player.rect.colliderect(meteor.rect):
-                # Önce kalkan kontrol et
-                if self.has_shield and self.shield_active:
-                    self.shield_active = False
-                    self.shield_timer = 0.0
-                    self._create_explosion(meteor.rect.centerx, meteor.rect.centery, meteor.size_type)
-                    self.meteors.remove(meteor)
-                # Kalkan yoksa mıknatıs kontrol et
-                elif self.has_magnet:
-                    self.has_magnet = False  # Mıknatıs bir çarpışmayı engelleyip yok olur
-                    self._create_explosion(meteor.rect.centerx, meteor.rect.centery, meteor.size_type)
-                    self.meteors.remove(meteor)
-                # İkisi de yoksa oyun biter
-                else:
-                    self.screen_shake.add_shake(5.0)
-                    if self.hit_sound:
-                        self.hit_sound.play()
-                    self.last_run_score = int(self.current_score)
-                    self.total_gold += int(self.current_score) // 2
-                    if self.current_score > self.high_score:
-                        self.high_score = self.current_score
-                    
-                    # Tüm tek kullanımlık öğeleri sıfırla (her oyun için ayrı satın alınmalı)
-                    self.has_shield = False
-                    self.has_magnet = False
-                    self.speed_boost_level = 0
-                    self.weapon_level = 1
-                    
-                    # Ensure shop_section exists before switching to shop
-                    if not hasattr(self, 'shop_section'):
-                        self.shop_section = "main"
-                    self.state = "shop"
+        for meteor in self.meteor_pool.query_rect(self.player.rect):
+            # Önce kalkan kontrol et
+            if self.has_shield and self.shield_active:
+                self.shield_active = False
+                self.shield_timer = 0.0
+                self._create_explosion(meteor.rect.centerx, meteor.rect.centery, meteor.size_type)
+                self.meteor_pool.kill(meteor)
+            # Kalkan yoksa mıknatıs kontrol et
+            elif self.has_magnet:
+                self.has_magnet = False  # Mıknatıs bir çarpışmayı engelleyip yok olur
+                self._create_explosion(meteor.rect.centerx, meteor.rect.centery, meteor.size_type)
+                self.meteor_pool.kill(meteor)
+            # İkisi de yoksa oyun biter
+            else:
+                self.screen_shake.add_shake(5.0)
+                self.audio.play("hit")
+                self.last_run_score = int(self.current_score)
+                self.total_gold += int(self.current_score) // 2
+                if self.current_score > self.high_score:
+                    self.high_score = self.current_score
+                if self.history is not None:
+                    self.history.record(self.last_run_score, self.game_time,
+                                        self.total_gold - self.run_start_gold, self.run_loadout,
+                                        self.run_seed)
+                
+                # Tüm tek kullanımlık öğeleri sıfırla (her oyun için ayrı satın alınmalı)
+                self.has_shield = False
+                self.has_magnet = False
+                self.speed_boost_level = 0
+                self.weapon_level = 1
+                
+                # Ensure shop_section exists before switching to shop
+                if not hasattr(self, 'shop_section'):
                     self.shop_section = "main"
-                    break
+                self.state = "shop"
+                self.shop_section = "main"
+                break
+        profiler.mark("meteors")
         
         # Coins
         player_pos = (self.player.rect.centerx, self.player.rect.centery)
-        for coin in self.coins[:]:
+        for coin in self.coins:
             coin.update(dt, player_pos, self.has_magnet)
-            if coin.rect.y > Config.WINDOW_HEIGHT or coin.rect.x < -50 or coin.rect.x > Config.WINDOW_WIDTH + 50:
-                self.coins.remove(coin)
-            elif self.player.rect.colliderect(coin.rect):
-                if coin.is_score:
-                    # Puan toplama
-                    self.current_score += coin.value
-                else:
-                    # Altın toplama
-                    self.total_gold += coin.value
-                self.coins.remove(coin)
+            if (coin.rect.y > Config.WINDOW_HEIGHT or coin.rect.x < -50
+                    or coin.rect.x > Config.WINDOW_WIDTH + 50):
+                self.coin_pool.kill(coin)
+        self.coin_index.rebuild(coin for coin in self.coins if coin.alive)
+        for coin in self.coin_index.query_rect(self.player.rect):
+            if coin.is_score:
+                # Puan toplama
+                self.current_score += coin.value
+            else:
+                # Altın toplama
+                self.total_gold += coin.value
+            self.coin_pool.kill(coin)
+        profiler.mark("coins")
         
         # Particles
-        for particle in self.particles[:]:
-            particle.update(dt)
-            if not particle.is_alive():
-                self.particles.remove(particle)
+        self.particles.update(dt)
+        profiler.mark("particles")
+        
+        # Deferred removals, once per tick
+        self.bullet_pool.flush()
+        self.meteor_pool.flush()
+        self.coin_pool.flush()
     
     def draw_playing(self, surface, keys):
-        # Background
-        surface.fill(Config.BACKGROUND_COLOR)
-        self.background.draw(surface)
-        
-        offset = self.screen_shake.get_offset()
-        
-        # Bloom surface for neon effects
-        self.bloom_surface.fill((0, 0, 0, 0))
+        profiler = self.profiler
+        profiler.mark("draw_other")
+        # The world (starfield and entities) is drawn into the offscreen layer, in layer coordinates
+        world = self.world_layer
+        world.fill(Config.BACKGROUND_COLOR)
+        self.background.draw(world)
+        self.dirty.mark_full()  # The scrolling starfield changes the whole frame
+        profiler.mark("draw_background")
+        
+        offset = self.world_origin
+        player_offset = self._interp_offset(self.player, offset)
+        
+        # Bloom buffer for neon effects
+        self.bloom.begin()
+        profiler.mark("bloom")
         
         # Particles
-        for particle in self.particles:
-            particle.draw(surface, offset)
+        self.particles.draw(world, offset, self.render_alpha)
+        profiler.mark("draw_particles")
         
         # Coins
         for coin in self.coins:
-            coin.draw(surface, offset)
+            coin.draw(world, self._interp_offset(coin, offset))
+        profiler.mark("draw_coins")
         
         # Meteors
-        for meteor in self.meteors:
-            meteor.draw(surface, offset)
+        self.meteor_pool.draw(world, offset, self.render_alpha)
+        profiler.mark("draw_meteors")
         
         # Bullets with bloom
         for bullet in self.bullets:
-            bullet.draw(surface, offset)
+            bullet_offset = self._interp_offset(bullet, offset)
+            bullet.draw(world, bullet_offset)
             # Bloom effect for bullets
-            glow_rect = pygame.Rect(bullet.rect.x + offset[0] - 5, bullet.rect.y + offset[1] - 5,
-                                   bullet.rect.width + 10, bullet.rect.height + 10)
-            pygame.draw.ellipse(self.bloom_surface, 
-                              (Config.NEON_CYAN[0], Config.NEON_CYAN[1], Config.NEON_CYAN[2], 100),
-                              glow_rect)
+            glow_rect = pygame.Rect(bullet.rect.x + bullet_offset[0] - 5,
+                                    bullet.rect.y + bullet_offset[1] - 5,
+                                    bullet.rect.width + 10, bullet.rect.height + 10)
+            self.bloom.ellipse(Config.NEON_CYAN, glow_rect)
+        profiler.mark("draw_bullets")
         
         # Shield with bloom (Mavi şeffaf çember)
         if self.has_shield and self.shield_active:
@@ -1119,490 +3253,673 @@ class Game:
             shield_surf = pygame.Surface((shield_radius * 2, shield_radius * 2), pygame.SRCALPHA)
             pygame.draw.circle(shield_surf, (shield_color[0], shield_color[1], shield_color[2], shield_alpha),
                              (shield_radius, shield_radius), shield_radius, width=4)
-            surface.blit(shield_surf, (self.player.rect.centerx - shield_radius + offset[0],
-                                     self.player.rect.centery - shield_radius + offset[1]))
+            world.blit(shield_surf, (self.player.rect.centerx - shield_radius + player_offset[0],
+                                     self.player.rect.centery - shield_radius + player_offset[1]))
             
             # İç çember (daha şeffaf)
             inner_surf = pygame.Surface((shield_radius * 2, shield_radius * 2), pygame.SRCALPHA)
             pygame.draw.circle(inner_surf, (shield_color[0], shield_color[1], shield_color[2], shield_alpha // 3),
                              (shield_radius, shield_radius), shield_radius - 2)
-            surface.blit(inner_surf, (self.player.rect.centerx - shield_radius + offset[0],
-                                     self.player.rect.centery - shield_radius + offset[1]))
+            world.blit(inner_surf, (self.player.rect.centerx - shield_radius + player_offset[0],
+                                     self.player.rect.centery - shield_radius + player_offset[1]))
+        
+        # Magnet with bloom (Mor/Yeşil şeffaf çember)
+        if self.has_magnet:
+            magnet_radius = max(Config.PLAYER_WIDTH, Config.PLAYER_HEIGHT) // 2 + 18
+            magnet_alpha = int(100 + 70 * math.sin(pygame.time.get_ticks() / 200.0))
+            magnet_color = (150, 100, 255)  # Mor renk (mıknatıs için)
+            
+            # Mıknatıs çemberi
+            magnet_surf = pygame.Surface((magnet_radius * 2, magnet_radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(magnet_surf, (magnet_color[0], magnet_color[1], magnet_color[2], magnet_alpha),
+                             (magnet_radius, magnet_radius), magnet_radius, width=3)
+            world.blit(magnet_surf, (self.player.rect.centerx - magnet_radius + player_offset[0],
+                                     self.player.rect.centery - magnet_radius + player_offset[1]))
             
-            # Bloom for shield
-            bloom_shield_surf = pygame.Surface((shield_radius * 2 + 20, shield_radius * 2 + 20), pygame.SRCALPHA)
-            pygame.draw.circle(bloom_shield_surf, 
-                             (shield_color[0], shield_color[1], shield_color[2], 60),
-                             (shield_radius + 10, shield_radius + 10), shield_radius + 10)
-            self.bloom_surface.blit(bloom_shield_surf, 
-                                   (self.player.rect.centerx - shield_radius - 10 + offset[0],
-                                    self.player.rect.centery - shield_radius - 10 + offset[1]))
+            # İç çember (daha şeffaf)
+            inner_magnet_surf = pygame.Surface((magnet_radius * 2, magnet_radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(inner_magnet_surf, (magnet_color[0], magnet_color[1], magnet_color[2], magnet_alpha // 4),
+                             (magnet_radius, magnet_radius), magnet_radius - 2)
+            world.blit(inner_magnet_surf, (self.player.rect.centerx - magnet_radius + player_offset[0],
+                                     self.player.rect.centery - magnet_radius + player_offset[1]))
+        
+        # Aura blooms; the magnet goes first so the shield glow stays on top where they overlap
+        player_center = (self.player.rect.centerx + player_offset[0],
+                         self.player.rect.centery + player_offset[1])
+        if self.has_magnet:
+            self.bloom.circle(magnet_color, player_center, magnet_radius + 10)
+        if self.has_shield and self.shield_active:
+            self.bloom.circle(shield_color, player_center, shield_radius + 10)
+        profiler.mark("draw_auras")
+        
+        # Player
+        self.player.draw(world, player_offset, keys, 1.0 + (self.speed_boost_level * 0.3))
+        profiler.mark("draw_player")
+        
+        # Apply bloom effect (additive, dirty regions only)
+        self.bloom.composite(world)
+        profiler.mark("bloom")
+        
+        # Screen shake moves the whole world in one blit; the HUD below is drawn unshaken
+        shake_x, shake_y = self.screen_shake.get_offset(Config.WORLD_MARGIN)
+        surface.blit(world, (shake_x - offset[0], shake_y - offset[1]))
+        profiler.mark("draw_world")
+        
+        # UI with glow
+        score_color = Config.GOLD_COLOR if self.is_new_record else Config.TEXT_COLOR
+        score_text = self._text(f"{self.t('score')}: {int(self.current_score)}", 32, score_color)
+        # Glow effect for score
+        glow_score = self._text(f"{self.t('score')}: {int(self.current_score)}", 32,
+                                tuple(int(channel * 0.3) for channel in score_color))
+        surface.blit(glow_score, (17, 17))
+        surface.blit(score_text, (15, 15))
+        
+        gold_text = self._text(f"{self.t('points')}: {int(self.total_gold)}", 32, Config.GOLD_COLOR)
+        glow_gold = self._text(f"{self.t('points')}: {int(self.total_gold)}", 32,
+                               tuple(int(channel * 0.3) for channel in Config.GOLD_COLOR))
+        surface.blit(glow_gold, (17, 57))
+        surface.blit(gold_text, (15, 55))
+        profiler.mark("draw_hud")
+    
+    # ---- Retained UI screens (one layout shared by drawing and hit-testing) ----
+    def _ui(self, name):
+        """Screen `name`, built on first use; all screens are dropped when the language changed"""
+        if self.ui_language != self.language:
+            self.ui_screens = {}
+            self.ui_language = self.language
+            self.ui_hover_screen = None
+        screen = self.ui_screens.get(name)
+        if screen is None:
+            builders = {
+                "menu": self._build_menu_ui,
+                "pause": self._build_pause_ui,
+                "settings": self._build_settings_ui,
+                "death": self._build_death_ui,
+                "equipment": self._build_equipment_ui
+            }
+            screen = self.ui_screens[name] = builders[name]()
+        return screen
+    
+    def _active_ui(self):
+        """Name of the screen that receives clicks in the current state"""
+        if self.state == "menu":
+            return "menu"
+        if self.state == "paused":
+            return "pause"
+        if self.state == "settings":
+            return "settings"
+        if self.state == "shop":
+            return "equipment" if self.shop_section == "weapons" else "death"
+        return None
+    
+    def _sync_ui_hover(self):
+        """On a screen change, move the hover to the new screen from wherever the mouse already is"""
+        name = self._active_ui()
+        screen = self._ui(name) if name is not None else None
+        if screen is self.ui_hover_screen:
+            return
+        if self.ui_hover_screen is not None:
+            self.ui_hover_screen.clear_hover()
+        self.ui_hover_screen = screen
+        if screen is not None:
+            screen.update_hover(self._get_safe_mouse_pos())
+        self._update_cursor(screen)
+    
+    def _update_cursor(self, screen):
+        try:
+            if screen is not None and screen.hovered is not None:
+                pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)
+            else:
+                pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+        except:
+            pass  # Silently ignore cursor errors
+    
+    def _ui_mouse_motion(self, pos):
+        self._sync_ui_hover()
+        screen = self.ui_hover_screen
+        if screen is not None and screen.update_hover(self._clamp_mouse_pos(pos)):
+            self._update_cursor(screen)
+    
+    def _text_painter(self, text, size, color, outline=None):
+        def paint(surface, rect, hovered, state):
+            text_surf = self._text(text, size, color)
+            if outline is None:
+                surface.blit(text_surf, text_surf.get_rect(center=rect.center))
+            else:
+                blit_outlined(surface, text_surf, self._text(text, size, outline), rect.center)
+        return paint
+    
+    def _text_widget(self, text, size, color, center, outline=None, visible=None):
+        surf = self._text(text, size, color)
+        return Widget(surf.get_rect(center=center), self._text_painter(text, size, color, outline),
+                      visible=visible)
+    
+    def _button_painter(self, color, hover_color, border_color, radius, text, text_size,
+                        text_color=(255, 255, 255), outline=(0, 0, 0)):
+        """Plain rounded button: fill (brighter on hover), border and centered label"""
+        def paint(surface, rect, hovered, state):
+            pygame.draw.rect(surface, hover_color if hovered else color, rect, border_radius=radius)
+            pygame.draw.rect(surface, border_color, rect, width=3, border_radius=radius)
+            text_surf = self._text(text, text_size, text_color)
+            if outline is None:
+                surface.blit(text_surf, text_surf.get_rect(center=rect.center))
+            else:
+                blit_outlined(surface, text_surf, self._text(text, text_size, outline), rect.center)
+        return paint
+    
+    def _panel_painter(self, fill, border, border_width, title, title_size, title_color, title_y, extra=None):
+        def paint(surface, rect, hovered, state):
+            pygame.draw.rect(surface, fill, rect, border_radius=20)
+            pygame.draw.rect(surface, border, rect, width=border_width, border_radius=20)
+            title_surf = self._text(title, title_size, title_color)
+            surface.blit(title_surf, title_surf.get_rect(center=(rect.centerx, rect.y + title_y)))
+            if extra:
+                extra(surface, rect)
+        return paint
+    
+    def _build_menu_ui(self):
+        # Settings icon (top-left corner)
+        icon_size = 60
+        icon_rect = pygame.Rect(20, 20, icon_size, icon_size)
+        
+        def paint_icon(surface, rect, hovered, state):
+            if hovered:
+                # Brighter glow on hover
+                pygame.draw.rect(surface, (*Config.NEON_CYAN[:3], 150), rect.inflate(10, 10),
+                                 border_radius=10)
+            icon_image = ASSETS.peek("settings_icon")  # Drawn as a gear until the preloader has it
+            if icon_image:
+                surface.blit(icon_image, rect.topleft)
+            else:
+                # Fallback: draw simple gear icon
+                pygame.draw.circle(surface, (100, 100, 150), rect.center, icon_size // 2)
+                pygame.draw.circle(surface, (150, 150, 200), rect.center, icon_size // 3)
+            if hovered:
+                pygame.draw.rect(surface, Config.NEON_CYAN, rect, width=3, border_radius=10)
+            else:
+                pygame.draw.rect(surface, (100, 100, 150), rect, width=2, border_radius=10)
         
-        # Magnet with bloom (Mor/Yeşil şeffaf çember)
-        if self.has_magnet:
-            magnet_radius = max(Config.PLAYER_WIDTH, Config.PLAYER_HEIGHT) // 2 + 18
-            magnet_alpha = int(100 + 70 * math.sin(pygame.time.get_ticks() / 200.0))
-            magnet_color = (150, 100, 255)  # Mor renk (mıknatıs için)
+        def open_settings():
+            self.state = "settings"
+        
+        widgets = [Widget(icon_rect, paint_icon, open_settings, bounds=icon_rect.inflate(10, 10))]
+        
+        # Language flags (bottom-left) with their label underneath
+        flag_size = 40
+        spacing = 10
+        start_x = 15
+        start_y = Config.WINDOW_HEIGHT - 70
+        for index, (language, label, image, fallback) in enumerate((
+                (Language.TURKISH, "TUR", ASSETS.peek("flag_tr"), "turk"),
+                (Language.ENGLISH, "ENG", ASSETS.peek("flag_en"), "eng"))):
+            flag_rect = pygame.Rect(start_x + index * (flag_size + spacing), start_y, flag_size, flag_size)
             
-            # Mıknatıs çemberi
-            magnet_surf = pygame.Surface((magnet_radius * 2, magnet_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(magnet_surf, (magnet_color[0], magnet_color[1], magnet_color[2], magnet_alpha),
-                             (magnet_radius, magnet_radius), magnet_radius, width=3)
-            surface.blit(magnet_surf, (self.player.rect.centerx - magnet_radius + offset[0],
-                                     self.player.rect.centery - magnet_radius + offset[1]))
+            def paint_flag(surface, rect, hovered, state, language=language, label=label, image=image,
+                           fallback=fallback):
+                if image:
+                    surface.blit(image, rect.topleft)
+                elif fallback == "turk":
+                    pygame.draw.rect(surface, (227, 10, 23), rect)
+                    pygame.draw.circle(surface, (255, 255, 255), rect.center, flag_size // 3)
+                    pygame.draw.circle(surface, (227, 10, 23), rect.center, flag_size // 4)
+                else:
+                    pygame.draw.rect(surface, (0, 35, 149), rect)
+                    pygame.draw.line(surface, (255, 255, 255), rect.topleft, rect.bottomright, 3)
+                    pygame.draw.line(surface, (255, 255, 255), rect.topright, rect.bottomleft, 3)
+                if hovered:
+                    pygame.draw.rect(surface, Config.NEON_CYAN, rect, width=2)
+                text_color = Config.NEON_CYAN if state == language else Config.TEXT_COLOR
+                text = self._text(label, 14, text_color)
+                surface.blit(text, text.get_rect(center=(rect.centerx, rect.bottom + 12)))
             
-            # İç çember (daha şeffaf)
-            inner_magnet_surf = pygame.Surface((magnet_radius * 2, magnet_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(inner_magnet_surf, (magnet_color[0], magnet_color[1], magnet_color[2], magnet_alpha // 4),
-                             (magnet_radius, magnet_radius), magnet_radius - 2)
-            surface.blit(inner_magnet_surf, (self.player.rect.centerx - magnet_radius + offset[0],
-                                     self.player.rect.centery - magnet_radius + offset[1]))
+            def choose(language=language):
+                self.language = language
             
-            # Bloom for magnet
-            bloom_magnet_surf = pygame.Surface((magnet_radius * 2 + 20, magnet_radius * 2 + 20), pygame.SRCALPHA)
-            pygame.draw.circle(bloom_magnet_surf, 
-                             (magnet_color[0], magnet_color[1], magnet_color[2], 50),
-                             (magnet_radius + 10, magnet_radius + 10), magnet_radius + 10)
-            self.bloom_surface.blit(bloom_magnet_surf, 
-                                   (self.player.rect.centerx - magnet_radius - 10 + offset[0],
-                                    self.player.rect.centery - magnet_radius - 10 + offset[1]))
+            widgets.append(Widget(flag_rect, paint_flag, choose, state=lambda: self.language,
+                                  bounds=flag_rect.inflate(10, 0).union(flag_rect.move(0, 24))))
+        return UIScreen(widgets)
+    
+    def _build_pause_ui(self):
+        # Pause panel (taller for settings button)
+        panel_rect = pygame.Rect(0, 0, 400, 320)
+        panel_rect.center = (Config.WINDOW_WIDTH // 2, Config.WINDOW_HEIGHT // 2)
+        button_width = 300
+        button_height = 60
+        button_x = panel_rect.centerx - button_width // 2
+        continue_rect = pygame.Rect(button_x, panel_rect.y + 120, button_width, button_height)
+        settings_rect = pygame.Rect(button_x, panel_rect.y + 200, button_width, button_height)
+        
+        def resume():
+            self.state = "playing"  # Oyuna devam et
+        
+        def open_settings():
+            self.state = "settings"  # Ayarlar menüsüne git
+        
+        return UIScreen([
+            Widget(panel_rect, self._panel_painter((50, 50, 70), (100, 100, 150), 3,
+                                                   self.t("paused"), 48, (255, 255, 255), 50)),
+            Widget(continue_rect, self._button_painter((80, 180, 80), (100, 200, 100), (50, 150, 50), 15,
+                                                       self.t("continue_game"), 28), resume),
+            Widget(settings_rect, self._button_painter((255, 140, 0), (255, 165, 0), (200, 100, 0), 15,
+                                                       self.t("settings"), 28), open_settings)
+        ])
+    
+    def _set_volume(self, volume):
+        self.volume = min(1.0, max(0.0, volume))
+        self.audio.set_master(self.volume)
+    
+    def _leave_settings(self):
+        # Doğru ekrana geri dön
+        if self.player:  # Oyun oynarken ayarlara girdiyse
+            self.state = "paused"
+        elif self.last_run_score > 0:  # Ölüm ekranından ayarlara girdiyse
+            self.state = "shop"
+        else:  # Menu'den ayarlara girdiyse
+            self.state = "menu"
+    
+    def _build_settings_ui(self):
+        # Settings panel (increased height to fit all buttons)
+        panel_rect = pygame.Rect(0, 0, 500, 500)
+        panel_rect.center = (Config.WINDOW_WIDTH // 2, Config.WINDOW_HEIGHT // 2)
+        volume_y = panel_rect.y + 100
+        lang_y = volume_y + 120
         
-        # Player
-        self.player.draw(surface, offset, keys, 1.0 + (self.speed_boost_level * 0.3))
+        def paint_language_label(surface, rect):
+            label = self._text(self.t("language"), 28, (0, 0, 0))
+            surface.blit(label, label.get_rect(center=(rect.centerx, rect.y + lang_y - panel_rect.y)))
         
-        # Apply bloom effect (blend mode)
-        surface.blit(self.bloom_surface, (0, 0), special_flags=pygame.BLEND_ADD)
+        def paint_volume(surface, rect, hovered, volume):
+            label = self._text(f"{self.t('volume')}: {int(volume * 100)}%", 28, (0, 0, 0))
+            surface.blit(label, label.get_rect(center=rect.center))
         
-        # UI with glow
-        score_color = Config.GOLD_COLOR if self.is_new_record else Config.TEXT_COLOR
-        font = pygame.font.SysFont("consolas", 32, bold=True)
-        score_text = font.render(f"{self.t('score')}: {int(self.current_score)}", True, score_color)
-        # Glow effect for score
-        glow_score = font.render(f"{self.t('score')}: {int(self.current_score)}", True, 
-                               (int(score_color[0] * 0.3), int(score_color[1] * 0.3), int(score_color[2] * 0.3)))
-        surface.blit(glow_score, (17, 17))
-        surface.blit(score_text, (15, 15))
+        # Volume buttons
+        vol_button_size = 60
+        vol_button_y = volume_y + 50
+        vol_dec_rect = pygame.Rect(0, 0, vol_button_size, vol_button_size)
+        vol_dec_rect.center = (panel_rect.centerx - 80, vol_button_y)
+        vol_inc_rect = pygame.Rect(0, 0, vol_button_size, vol_button_size)
+        vol_inc_rect.center = (panel_rect.centerx + 80, vol_button_y)
         
-        gold_text = font.render(f"{self.t('points')}: {int(self.total_gold)}", True, Config.GOLD_COLOR)
-        glow_gold = font.render(f"{self.t('points')}: {int(self.total_gold)}", True,
-                              (int(Config.GOLD_COLOR[0] * 0.3), int(Config.GOLD_COLOR[1] * 0.3), int(Config.GOLD_COLOR[2] * 0.3)))
-        surface.blit(glow_gold, (17, 57))
-        surface.blit(gold_text, (15, 55))
+        # Language buttons
+        lang_button_y = lang_y + 40
+        lang_turk_rect = pygame.Rect(0, 0, 180, 50)
+        lang_turk_rect.center = (panel_rect.centerx - 100, lang_button_y)
+        lang_eng_rect = pygame.Rect(0, 0, 180, 50)
+        lang_eng_rect.center = (panel_rect.centerx + 100, lang_button_y)
+        
+        def language_painter(language, text):
+            def paint(surface, rect, hovered, current):
+                color = (200, 200, 255) if hovered else (180, 180, 255)
+                if current == language:
+                    color = (150, 150, 255)
+                pygame.draw.rect(surface, color, rect, border_radius=10)
+                pygame.draw.rect(surface, (100, 100, 200), rect, width=3, border_radius=10)
+                text_surf = self._text(text, 24, (0, 0, 0))
+                surface.blit(text_surf, text_surf.get_rect(center=rect.center))
+            return paint
+        
+        def choose(language):
+            return lambda: setattr(self, "language", language)
+        
+        back_rect = pygame.Rect(panel_rect.centerx - 75, panel_rect.bottom - 110, 150, 45)
+        quit_rect = pygame.Rect(panel_rect.centerx - 100, panel_rect.bottom - 50, 200, 45)
+        quit_text = "OYUNDAN ÇIK" if self.language == Language.TURKISH else "QUIT GAME"
+        
+        def quit_game():
+            self.running = False  # Oyunu kapat
+        
+        return UIScreen([
+            Widget(panel_rect, self._panel_painter((255, 255, 200), (200, 200, 100), 4,
+                                                   self.t("settings"), 48, (0, 0, 0), 40,
+                                                   paint_language_label)),
+            Widget((panel_rect.x + 20, volume_y - 20, panel_rect.width - 40, 40), paint_volume,
+                   state=lambda: self.volume),
+            Widget(vol_dec_rect, self._button_painter((255, 150, 150), (255, 100, 100), (200, 0, 0), 10,
+                                                      self.t("decrease_volume"), 40, outline=None),
+                   lambda: self._set_volume(self.volume - 0.1)),
+            Widget(vol_inc_rect, self._button_painter((150, 255, 150), (100, 255, 100), (0, 200, 0), 10,
+                                                      self.t("increase_volume"), 40, outline=None),
+                   lambda: self._set_volume(self.volume + 0.1)),
+            Widget(lang_turk_rect, language_painter(Language.TURKISH, self.t("turkish")),
+                   choose(Language.TURKISH), state=lambda: self.language),
+            Widget(lang_eng_rect, language_painter(Language.ENGLISH, self.t("english")),
+                   choose(Language.ENGLISH), state=lambda: self.language),
+            Widget(back_rect, self._button_painter((150, 255, 150), (200, 255, 200), (0, 200, 0), 10,
+                                                   self.t("back"), 22, (0, 0, 0), outline=None),
+                   self._leave_settings),
+            Widget(quit_rect, self._button_painter((255, 150, 150), (255, 100, 100), (200, 0, 0), 10,
+                                                   quit_text, 22, outline=None), quit_game)
+        ])
+    
+    def _build_death_ui(self):
+        center_x = Config.WINDOW_WIDTH // 2
+        
+        # Title "GAME OVER" or "OYUN BİTTİ" with a thick dark outline
+        title_text = self.t("game_over")
+        title_rect = self._text(title_text, 72, (255, 255, 255)).get_rect(center=(center_x, 120))
+        
+        def paint_title(surface, rect, hovered, state):
+            outline = self._text(title_text, 72, (50, 50, 50))
+            for dx in [-3, -2, -1, 1, 2, 3]:
+                for dy in [-3, -2, -1, 1, 2, 3]:
+                    surface.blit(outline, outline.get_rect(center=(rect.centerx + dx, rect.centery + dy)))
+            title = self._text(title_text, 72, (255, 255, 255))
+            surface.blit(title, title.get_rect(center=rect.center))
+        
+        def paint_score(surface, rect, hovered, score):
+            score_surf = self._text(f"{self.t('score')}: {score}", 36, (255, 255, 0))  # Yellow
+            surface.blit(score_surf, score_surf.get_rect(center=rect.center))
+        
+        # Three rounded square buttons
+        button_size = 120
+        button_spacing = 40
+        buttons_y = Config.WINDOW_HEIGHT // 2 + 50
+        buttons_start_x = center_x - (3 * button_size + 2 * button_spacing) // 2
+        cart_rect = pygame.Rect(buttons_start_x, buttons_y, button_size, button_size)
+        play_rect = cart_rect.move(button_size + button_spacing, 0)
+        settings_rect = cart_rect.move(2 * (button_size + button_spacing), 0)
+        
+        def square_painter(color, hover_color, border_color, highlight_color, text=None, text_size=28):
+            def paint(surface, rect, hovered, state):
+                # Button with 3D effect and a highlight strip
+                pygame.draw.rect(surface, hover_color if hovered else color, rect, border_radius=15)
+                pygame.draw.rect(surface, border_color, rect, width=3, border_radius=15)
+                pygame.draw.rect(surface, highlight_color, (rect.x + 5, rect.y + 5, rect.width - 10, 20),
+                                 border_radius=8)
+                if text:
+                    blit_outlined(surface, self._text(text, text_size, (255, 255, 255)),
+                                  self._text(text, text_size, (0, 0, 0)), rect.center)
+                else:
+                    # Play icon (triangle)
+                    half = 25
+                    pygame.draw.polygon(surface, (255, 255, 255), [
+                        (rect.centerx - half, rect.centery - half),
+                        (rect.centerx - half, rect.centery + half),
+                        (rect.centerx + half, rect.centery)
+                    ])
+            return paint
+        
+        def open_cart():
+            self.shop_section = "weapons"
+        
+        def open_settings():
+            self.state = "settings"
+        
+        def back_to_menu():
+            self.state = "menu"  # Ana ekrana dön
+        
+        label_y = buttons_y + button_size + 15
+        back_rect = pygame.Rect(center_x - 100, label_y + 50, 200, 50)
+        
+        # Leaderboard beside the buttons, repainted only when the cached board changes
+        board_rect = pygame.Rect(Config.WINDOW_WIDTH - 330, 180, 290, 300)
+        
+        def paint_board(surface, rect, hovered, state):
+            runs, last_run_id = state
+            pygame.draw.rect(surface, (20, 20, 35), rect, border_radius=15)
+            pygame.draw.rect(surface, Config.NEON_PURPLE, rect, width=2, border_radius=15)
+            title = self._text(self.t("leaderboard"), 24, Config.NEON_CYAN)
+            surface.blit(title, title.get_rect(center=(rect.centerx, rect.y + 25)))
+            for rank, run in enumerate(runs, 1):
+                y = rect.y + 40 + rank * 24
+                color = (255, 255, 0) if run.id == last_run_id else (220, 220, 240)
+                minutes, seconds = divmod(int(run.duration), 60)
+                label = self._text(f"{rank}.", 18, color)
+                surface.blit(label, label.get_rect(midleft=(rect.x + 20, y)))
+                score = self._text(str(run.score), 18, color)
+                surface.blit(score, score.get_rect(midright=(rect.x + 170, y)))
+                duration = self._text(f"{minutes}:{seconds:02d}", 18, (150, 150, 200))
+                surface.blit(duration, duration.get_rect(midright=(rect.right - 20, y)))
+        
+        widgets = []
+        if self.history is not None:
+            history = self.history
+            widgets.append(Widget(board_rect, paint_board,
+                                  state=lambda: (history.top_runs, history.last_run_id)))
+        
+        return UIScreen(widgets + [
+            Widget(title_rect, paint_title, bounds=title_rect.inflate(6, 6)),
+            Widget((center_x - 300, 180, 600, 40), paint_score, state=lambda: int(self.last_run_score)),
+            self._text_widget(self.t("new_record"), 28, (255, 200, 0), (center_x, 240),
+                              visible=lambda: (self.last_run_score == int(self.high_score)
+                                               and self.last_run_score > 0)),
+            Widget(cart_rect, square_painter((255, 165, 0), (255, 200, 0), (200, 120, 0), (255, 220, 100),
+                                             "MAĞAZA"),
+                   open_cart),
+            Widget(play_rect, square_painter((255, 0, 0), (255, 50, 50), (180, 0, 0), (255, 100, 100)),
+                   self.start_game),
+            Widget(settings_rect, square_painter((255, 165, 0), (255, 200, 0), (200, 120, 0), (255, 220, 100),
+                                                 "AYARLAR", 26), open_settings),
+            self._text_widget("TEKRAR BAŞLA", 20, (255, 255, 255), (play_rect.centerx, label_y),
+                              outline=(0, 0, 0)),
+            Widget(back_rect, self._button_painter((100, 100, 150), (150, 150, 200), (70, 70, 100), 10,
+                                                   f"◄ {self.t('back')}", 24), back_to_menu,
+                   visible=lambda: self.shop_section == "main")
+        ])
+    
+    def _buy_item(self, item_id):
+        cost = SHOP_ITEMS[item_id]
+        if self._item_owned(item_id) or self.total_gold < cost:
+            return
+        self.total_gold -= cost
+        if item_id == "shield":
+            self.has_shield = True
+        elif item_id == "magnet":
+            self.has_magnet = True  # Tek kullanımlık - her tura özel
+        elif item_id == "speed":
+            self.speed_boost_level += 1
+        elif item_id == "triple":
+            self.weapon_level = 3
+    
+    def _loadout(self):
+        """Upgrades currently bought, as the leaderboard's loadout key (e.g. "shield+speed2")"""
+        parts = []
+        if self.has_shield:
+            parts.append("shield")
+        if self.has_magnet:
+            parts.append("magnet")
+        if self.speed_boost_level:
+            parts.append(f"speed{self.speed_boost_level}")
+        if self.weapon_level >= 3:
+            parts.append("triple")
+        return "+".join(parts) or "none"
+    
+    def _item_owned(self, item_id):
+        if item_id == "shield":
+            return self.has_shield
+        if item_id == "magnet":
+            return self.has_magnet
+        if item_id == "speed":
+            return self.speed_boost_level >= 3
+        return self.weapon_level >= 3
+    
+    def _build_equipment_ui(self):
+        # Equipment panel
+        panel_rect = pygame.Rect(0, 0, 700, 500)
+        panel_rect.center = (Config.WINDOW_WIDTH // 2, Config.WINDOW_HEIGHT // 2)
+        
+        def paint_gold(surface, rect, hovered, gold):
+            gold_surf = self._text(f"{self.t('points')}: {gold}", 32, (255, 215, 0))
+            surface.blit(gold_surf, gold_surf.get_rect(center=rect.center))
+        
+        widgets = [
+            Widget(panel_rect, self._panel_painter((255, 255, 200), (200, 200, 100), 4,
+                                                   self.t("shopping"), 48, (0, 0, 0), 40)),
+            Widget((panel_rect.x + 20, panel_rect.y + 70, panel_rect.width - 40, 40), paint_gold,
+                   state=lambda: int(self.total_gold))
+        ]
+        
+        # Item buttons (circular) - simple design
+        item_button_size = 90
+        item_spacing = 30
+        items_start_y = panel_rect.y + 190
+        items_start_x = panel_rect.centerx - (4 * item_button_size + 3 * item_spacing) // 2
+        icons = {"shield": "S", "magnet": "M", "speed": "SP", "triple": "3X"}
+        
+        def item_label(item_id):
+            if item_id == "speed":
+                if self.speed_boost_level < 3:
+                    return f"{self.t('speed')} +{self.speed_boost_level + 1}"
+                return f"{self.t('speed')} MAX"
+            return self.t({"shield": "shield", "magnet": "magnet", "triple": "triple_shot"}[item_id])
+        
+        def item_painter(item_id):
+            cost = SHOP_ITEMS[item_id]
+            icon = icons[item_id]
+            
+            def paint(surface, rect, hovered, state):
+                can_afford, is_owned, label = state
+                # Simple button drawing - NO excessive glow effects
+                if is_owned:
+                    button_color = (100, 200, 100)  # Light green
+                    border_color = (50, 150, 50)
+                elif not can_afford:
+                    button_color = (100, 100, 100)  # Gray
+                    border_color = (70, 70, 70)
+                else:
+                    button_color = (150, 150, 200)  # Light blue-gray
+                    border_color = (100, 100, 150)
+                # Hover effect - slightly brighter
+                if hovered and can_afford and not is_owned:
+                    button_color = tuple(min(255, c + 30) for c in button_color)
+                    border_color = tuple(min(255, c + 30) for c in border_color)
+                pygame.draw.circle(surface, button_color, rect.center, item_button_size // 2)
+                pygame.draw.circle(surface, border_color, rect.center, item_button_size // 2, width=3)
+                
+                icon_color = (255, 255, 255) if can_afford or is_owned else (150, 150, 150)
+                blit_outlined(surface, self._text(icon, 36, icon_color), self._text(icon, 36, (0, 0, 0)),
+                              rect.center)
+                
+                # Label and cost below, black with a white outline
+                blit_outlined(surface, self._text(label, 16, (0, 0, 0)),
+                              self._text(label, 16, (255, 255, 255)), (rect.centerx, rect.bottom + 18))
+                if not is_owned:
+                    cost_text = f"{cost} {self.t('points')}"
+                    cost_color = (200, 150, 0) if can_afford else (120, 120, 120)  # Gold or gray
+                    blit_outlined(surface, self._text(cost_text, 14, cost_color),
+                                  self._text(cost_text, 14, (255, 255, 255)),
+                                  (rect.centerx, rect.bottom + 36))
+                else:
+                    purchased = self.t("purchased")
+                    blit_outlined(surface, self._text(purchased, 14, (0, 150, 0)),
+                                  self._text(purchased, 14, (255, 255, 255)),
+                                  (rect.centerx, rect.bottom + 36))
+            return paint
+        
+        for index, item_id in enumerate(SHOP_ITEMS):
+            item_rect = pygame.Rect(items_start_x + index * (item_button_size + item_spacing), items_start_y,
+                                    item_button_size, item_button_size)
+            state = (lambda item_id=item_id: (self.total_gold >= SHOP_ITEMS[item_id],
+                                              self._item_owned(item_id), item_label(item_id)))
+            widgets.append(Widget(item_rect, item_painter(item_id),
+                                  lambda item_id=item_id: self._buy_item(item_id), state=state,
+                                  bounds=item_rect.inflate(50, 0).union(item_rect.move(0, 50))))
+        
+        def back_to_menu():
+            self.state = "menu"  # Ana ekrana dön
+            self.shop_section = "main"
+        
+        back_rect = pygame.Rect(panel_rect.centerx - 100, items_start_y + item_button_size + 80, 200, 45)
+        widgets.append(Widget(back_rect, self._button_painter((200, 50, 50), (220, 80, 80), (150, 0, 0), 10,
+                                                              f"◄ {self.t('back')}", 22), back_to_menu))
+        return UIScreen(widgets)
+    
+    def _update_screen_background(self, dt):
+        """Scroll the menu and death screen starfield
+
+        In dirty-rect mode it stands still: a scrolling starfield changes every pixel, so each
+        frame would be a full flip and the mode would save nothing on these screens.
+        """
+        if not self.dirty.enabled:
+            self.background.update(dt)
+    
+    def _draw_screen_background(self, surface):
+        """Draw the starfield straight to the screen, lined up with the world layer's"""
+        surface.fill(Config.BACKGROUND_COLOR)  # Deep black
+        # The starfield spans the world layer, whose origin sits at screen (0, 0)
+        self.background.draw(surface, (-self.world_origin[0], -self.world_origin[1]))
     
     def draw_menu(self, surface):
         # Space background with flowing stars (same as in game)
-        surface.fill(Config.BACKGROUND_COLOR)  # Deep black
-        self.background.draw(surface)  # Draw parallax starfield
+        self._draw_screen_background(surface)
         
         # Draw flowing meteors in background
-        for meteor in self.meteors:
-            meteor.draw(surface)
+        self.meteor_pool.draw(surface, alpha=self.render_alpha, dirty=self.dirty)
         
+        # Title, subtitle and high score only change with the language or the record
+        layer_key = (self.language, int(self.high_score))
+        if self.menu_layer is None or self.menu_layer_key != layer_key:
+            self.menu_layer = self._render_menu_layer()
+            self.menu_layer_key = layer_key
+        surface.blit(self.menu_layer[0], self.menu_layer[1])
+        
+        # Settings icon and language flags
+        self._ui("menu").draw(surface, self.dirty)
+    
+    def _render_menu_layer(self):
+        """Static menu texts composited once; returns (surface, position)"""
         # Title - Clean cyan style (no pink/magenta)
-        title_font = pygame.font.SysFont("consolas", 110, bold=True)
         title_text = "INFINITE ORBIT"
-        
         title_center = (Config.WINDOW_WIDTH // 2, Config.WINDOW_HEIGHT // 2 - 80)
-        
-        # Glow effect (cyan only)
-        glow_surf = title_font.render(title_text, True, (0, 180, 220))
-        glow_surf.set_alpha(120)
-        for offset in range(4, 0, -1):
-            glow_rect = glow_surf.get_rect(center=(title_center[0], title_center[1]))
-            glow_rect.inflate_ip(offset * 2, offset * 2)
-            surface.blit(glow_surf, glow_rect)
-        
-        # Main cyan text - bright and clean
-        title_surf = title_font.render(title_text, True, (0, 255, 255))
-        title_rect = title_surf.get_rect(center=title_center)
-        surface.blit(title_surf, title_rect)
+        glow_surf = self._text(title_text, 110, (0, 180, 220))
+        title_surf = self._text(title_text, 110, (0, 255, 255))
         
         # Subtitle - "BAŞLAMAK İÇİN TIKLA" / "CLICK TO START"
-        subtitle_font = pygame.font.SysFont("consolas", 32, bold=True)
         subtitle_text = "BAŞLAMAK İÇİN TIKLA" if self.language == Language.TURKISH else "CLICK TO START"
-        subtitle_surf = subtitle_font.render(subtitle_text, True, (150, 220, 255))
+        subtitle_surf = self._text(subtitle_text, 32, (150, 220, 255))
         subtitle_rect = subtitle_surf.get_rect(center=(Config.WINDOW_WIDTH // 2, Config.WINDOW_HEIGHT // 2 + 50))
-        surface.blit(subtitle_surf, subtitle_rect)
         
         # High score
+        hs_surf = None
         if self.high_score > 0:
-            hs_font = pygame.font.SysFont("consolas", 28, bold=True)
             hs_text = f"{self.t('high_score')}: {int(self.high_score)}"
-            hs_surf = hs_font.render(hs_text, True, (255, 200, 100))
+            hs_surf = self._text(hs_text, 28, (255, 200, 100))
             hs_rect = hs_surf.get_rect(center=(Config.WINDOW_WIDTH // 2, Config.WINDOW_HEIGHT // 2 + 160))
-            surface.blit(hs_surf, hs_rect)
         
-        # Language button
-        self._draw_language_button(surface)
-        
-        # Settings icon (top-left corner)
-        self._draw_menu_settings_icon(surface)
-    
-    def _draw_menu_settings_icon(self, surface):
-        """Draw settings icon in top-left corner of menu"""
-        icon_size = 60
-        icon_x = 20
-        icon_y = 20
-        icon_rect = pygame.Rect(icon_x, icon_y, icon_size, icon_size)
+        area = glow_surf.get_rect(center=title_center).inflate(8, 8).union(subtitle_rect)
+        if hs_surf is not None:
+            area.union_ip(hs_rect)
+        layer = pygame.Surface(area.size, pygame.SRCALPHA)
         
-        try:
-            mouse_pos = self._get_safe_mouse_pos()
-        except:
-            mouse_pos = (Config.WINDOW_WIDTH // 2, Config.WINDOW_HEIGHT // 2)
-        
-        is_hovered = icon_rect.collidepoint(mouse_pos)
-        
-        # Draw icon background (hover effect)
-        if is_hovered:
-            # Brighter glow on hover
-            glow_surf = pygame.Surface((icon_size + 10, icon_size + 10), pygame.SRCALPHA)
-            pygame.draw.rect(glow_surf, (Config.NEON_CYAN[0], Config.NEON_CYAN[1], Config.NEON_CYAN[2], 150),
-                           glow_surf.get_rect(), border_radius=10)
-            surface.blit(glow_surf, (icon_x - 5, icon_y - 5))
-            pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)
-        
-        # Draw icon image or fallback
-        if self.settings_icon_image:
-            surface.blit(self.settings_icon_image, icon_rect.topleft)
-        else:
-            # Fallback: draw simple gear icon
-            pygame.draw.circle(surface, (100, 100, 150), icon_rect.center, icon_size // 2)
-            pygame.draw.circle(surface, (150, 150, 200), icon_rect.center, icon_size // 3)
+        # Glow effect (cyan only)
+        glow_surf.set_alpha(120)
+        for offset in range(4, 0, -1):
+            glow_rect = glow_surf.get_rect(center=title_center)
+            glow_rect.inflate_ip(offset * 2, offset * 2)
+            layer.blit(glow_surf, glow_rect.move(-area.x, -area.y))
+        glow_surf.set_alpha(None)  # The surface is shared through the text cache
         
-        # Border
-        if is_hovered:
-            pygame.draw.rect(surface, Config.NEON_CYAN, icon_rect, width=3, border_radius=10)
-        else:
-            pygame.draw.rect(surface, (100, 100, 150), icon_rect, width=2, border_radius=10)
+        # Main cyan text - bright and clean
+        layer.blit(title_surf, title_surf.get_rect(center=title_center).move(-area.x, -area.y))
+        layer.blit(subtitle_surf, subtitle_rect.move(-area.x, -area.y))
+        if hs_surf is not None:
+            layer.blit(hs_surf, hs_rect.move(-area.x, -area.y))
+        return layer, area.topleft
     
     def draw_paused(self, surface):
         """Draw pause menu overlay on top of game"""
-        # Draw the game in background (frozen)
-        if self.player:
-            keys = pygame.key.get_pressed()
-            self.draw_playing(surface, keys)
-        
-        # Semi-transparent overlay
-        overlay = pygame.Surface((Config.WINDOW_WIDTH, Config.WINDOW_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))  # Dark overlay
-        surface.blit(overlay, (0, 0))
-        
-        # Pause panel (taller for settings button)
-        panel_width = 400
-        panel_height = 320
-        panel_x = Config.WINDOW_WIDTH // 2 - panel_width // 2
-        panel_y = Config.WINDOW_HEIGHT // 2 - panel_height // 2
-        panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
-        
-        # Panel background
-        pygame.draw.rect(surface, (50, 50, 70), panel_rect, border_radius=20)
-        pygame.draw.rect(surface, (100, 100, 150), panel_rect, width=3, border_radius=20)
-        
-        # Paused title
-        title_font = pygame.font.SysFont("consolas", 48, bold=True)
-        title_text = self.t("paused")
-        title_surf = title_font.render(title_text, True, (255, 255, 255))
-        title_rect = title_surf.get_rect(center=(panel_rect.centerx, panel_rect.y + 50))
-        surface.blit(title_surf, title_rect)
-        
-        try:
-            mouse_pos = self._get_safe_mouse_pos()
-        except:
-            mouse_pos = (Config.WINDOW_WIDTH // 2, Config.WINDOW_HEIGHT // 2)
-        
-        # Continue button
-        continue_button_width = 300
-        continue_button_height = 60
-        continue_button_rect = pygame.Rect(panel_rect.centerx - continue_button_width // 2,
-                                          panel_rect.y + 120,
-                                          continue_button_width, continue_button_height)
-        continue_hover = continue_button_rect.collidepoint(mouse_pos)
-        
-        if continue_hover:
-            continue_color = (100, 200, 100)  # Brighter green
-            pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)
-        else:
-            continue_color = (80, 180, 80)  # Normal green
-        
-        # Draw continue button
-        pygame.draw.rect(surface, continue_color, continue_button_rect, border_radius=15)
-        pygame.draw.rect(surface, (50, 150, 50), continue_button_rect, width=3, border_radius=15)
-        
-        # Continue button text
-        continue_font = pygame.font.SysFont("consolas", 28, bold=True)
-        continue_text = self.t("continue_game")
-        continue_text_surf = continue_font.render(continue_text, True, (255, 255, 255))
-        continue_text_rect = continue_text_surf.get_rect(center=continue_button_rect.center)
-        # Black outline for visibility
-        outline_continue = continue_font.render(continue_text, True, (0, 0, 0))
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx != 0 or dy != 0:
-                    surface.blit(outline_continue, (continue_text_rect.x + dx, continue_text_rect.y + dy))
-        surface.blit(continue_text_surf, continue_text_rect)
-        
-        # Settings button
-        settings_button_width = 300
-        settings_button_height = 60
-        settings_button_rect = pygame.Rect(panel_rect.centerx - settings_button_width // 2,
-                                          panel_rect.y + 200,
-                                          settings_button_width, settings_button_height)
-        settings_hover = settings_button_rect.collidepoint(mouse_pos)
-        
-        if settings_hover:
-            settings_color = (255, 165, 0)  # Brighter orange
-            pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)
-        else:
-            settings_color = (255, 140, 0)  # Normal orange
-        
-        # Draw settings button
-        pygame.draw.rect(surface, settings_color, settings_button_rect, border_radius=15)
-        pygame.draw.rect(surface, (200, 100, 0), settings_button_rect, width=3, border_radius=15)
-        
-        # Settings button text
-        settings_font = pygame.font.SysFont("consolas", 28, bold=True)
-        settings_text = self.t("settings")
-        settings_text_surf = settings_font.render(settings_text, True, (255, 255, 255))
-        settings_text_rect = settings_text_surf.get_rect(center=settings_button_rect.center)
-        # Black outline for visibility
-        outline_settings = settings_font.render(settings_text, True, (0, 0, 0))
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx != 0 or dy != 0:
-                    surface.blit(outline_settings, (settings_text_rect.x + dx, settings_text_rect.y + dy))
-        surface.blit(settings_text_surf, settings_text_rect)
-    
-    def _draw_language_button(self, surface):
-        """Draw language selection buttons with flag images and text"""
-        flag_size = 40
-        spacing = 10
-        start_x = 15
-        start_y = Config.WINDOW_HEIGHT - 70
-        
-        try:
-            mouse_pos = self._get_safe_mouse_pos()
-        except:
-            mouse_pos = (Config.WINDOW_WIDTH // 2, Config.WINDOW_HEIGHT // 2)
-        
-        # Türk bayrağı
-        turk_rect = pygame.Rect(start_x, start_y, flag_size, flag_size)
-        is_hovered_turk = turk_rect.collidepoint(mouse_pos)
-        
-        if self.turk_flag_image:
-            surface.blit(self.turk_flag_image, turk_rect.topleft)
+        # The game is frozen while paused: draw it dimmed once and reuse that frame
+        if self.pause_backdrop is None or self.pause_backdrop_language != self.language:
+            if self.player:
+                self.draw_playing(surface, self.keys)
+            surface.blit(self.dim_overlay, (0, 0))
+            self.pause_backdrop = surface.copy()
+            self.dirty.mark_full()
+            self.pause_backdrop_language = self.language  # The HUD underneath is translated
         else:
-            # Fallback: çizim
-            pygame.draw.rect(surface, (227, 10, 23), turk_rect)
-            pygame.draw.circle(surface, (255, 255, 255), turk_rect.center, flag_size // 3)
-            pygame.draw.circle(surface, (227, 10, 23), turk_rect.center, flag_size // 4)
-        
-        if is_hovered_turk:
-            pygame.draw.rect(surface, Config.NEON_CYAN, turk_rect, width=2)
-        
-        # TUR yazısı
-        turk_text_font = pygame.font.SysFont("consolas", 14, bold=True)
-        turk_text_color = Config.NEON_CYAN if self.language == Language.TURKISH else Config.TEXT_COLOR
-        turk_text = turk_text_font.render("TUR", True, turk_text_color)
-        turk_text_rect = turk_text.get_rect(center=(turk_rect.centerx, turk_rect.bottom + 12))
-        surface.blit(turk_text, turk_text_rect)
-        
-        # İngilizce bayrağı
-        eng_rect = pygame.Rect(start_x + flag_size + spacing, start_y, flag_size, flag_size)
-        is_hovered_eng = eng_rect.collidepoint(mouse_pos)
-        
-        if self.eng_flag_image:
-            surface.blit(self.eng_flag_image, eng_rect.topleft)
-        else:
-            # Fallback: çizim
-            pygame.draw.rect(surface, (0, 35, 149), eng_rect)
-            pygame.draw.line(surface, (255, 255, 255), eng_rect.topleft, eng_rect.bottomright, 3)
-            pygame.draw.line(surface, (255, 255, 255), eng_rect.topright, eng_rect.bottomleft, 3)
-        
-        if is_hovered_eng:
-            pygame.draw.rect(surface, Config.NEON_CYAN, eng_rect, width=2)
+            surface.blit(self.pause_backdrop, (0, 0))
         
-        # ENG yazısı
-        eng_text_font = pygame.font.SysFont("consolas", 14, bold=True)
-        eng_text_color = Config.NEON_CYAN if self.language == Language.ENGLISH else Config.TEXT_COLOR
-        eng_text = eng_text_font.render("ENG", True, eng_text_color)
-        eng_text_rect = eng_text.get_rect(center=(eng_rect.centerx, eng_rect.bottom + 12))
-        surface.blit(eng_text, eng_text_rect)
+        # Pause panel with continue and settings buttons
+        self._ui("pause").draw(surface, self.dirty)
     
     def draw_shop(self, surface):
         """Draw death screen with space background (flowing stars like in game)"""
         try:
             # Space background - same as in game (flowing stars)
-            surface.fill(Config.BACKGROUND_COLOR)  # Deep black
-            self.background.draw(surface)  # Draw parallax starfield
-            
-            # Title "GAME OVER" or "OYUN BİTTİ"
-            title_font = pygame.font.SysFont("consolas", 72, bold=True)
-            title_text = self.t("game_over")
-            title_color = (255, 255, 255)  # White
-            title_outline_color = (50, 50, 50)  # Dark gray outline
-            
-            # Draw outline (shadow effect)
-            for dx in [-3, -2, -1, 1, 2, 3]:
-                for dy in [-3, -2, -1, 1, 2, 3]:
-                    title_surf = title_font.render(title_text, True, title_outline_color)
-                    title_rect = title_surf.get_rect(center=(Config.WINDOW_WIDTH // 2 + dx, 120 + dy))
-                    surface.blit(title_surf, title_rect)
-            
-            # Draw main title
-            title_surf = title_font.render(title_text, True, title_color)
-            title_rect = title_surf.get_rect(center=(Config.WINDOW_WIDTH // 2, 120))
-            surface.blit(title_surf, title_rect)
-            
-            # Score display
-            score_font = pygame.font.SysFont("consolas", 36, bold=True)
-            score_text = f"{self.t('score')}: {int(self.last_run_score)}"
-            score_surf = score_font.render(score_text, True, (255, 255, 0))  # Yellow
-            score_rect = score_surf.get_rect(center=(Config.WINDOW_WIDTH // 2, 200))
-            surface.blit(score_surf, score_rect)
-            
-            if self.last_run_score == int(self.high_score) and self.last_run_score > 0:
-                record_font = pygame.font.SysFont("consolas", 28, bold=True)
-                record_text = self.t("new_record")
-                record_surf = record_font.render(record_text, True, (255, 200, 0))  # Gold
-                record_rect = record_surf.get_rect(center=(Config.WINDOW_WIDTH // 2, 240))
-                surface.blit(record_surf, record_rect)
-            
-            # Three rounded square buttons (like in the image)
-            button_size = 120
-            button_spacing = 40
-            buttons_y = Config.WINDOW_HEIGHT // 2 + 50
-            total_width = 3 * button_size + 2 * button_spacing
-            buttons_start_x = Config.WINDOW_WIDTH // 2 - total_width // 2
-            
-            try:
-                mouse_pos = self._get_safe_mouse_pos()
-            except:
-                mouse_pos = (Config.WINDOW_WIDTH // 2, Config.WINDOW_HEIGHT // 2)
-            
-            # Shopping Cart Button (left) - Orange-yellow
-            cart_button_rect = pygame.Rect(buttons_start_x, buttons_y, button_size, button_size)
-            cart_color = (255, 165, 0)  # Orange
-            cart_hover = cart_button_rect.collidepoint(mouse_pos)
-            if cart_hover:
-                cart_color = (255, 200, 0)  # Brighter orange
-                pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)
-            
-            # Draw button with 3D effect
-            pygame.draw.rect(surface, cart_color, cart_button_rect, border_radius=15)
-            pygame.draw.rect(surface, (200, 120, 0), cart_button_rect, width=3, border_radius=15)
-            # Highlight
-            highlight_rect = pygame.Rect(cart_button_rect.x + 5, cart_button_rect.y + 5, 
-                                        cart_button_rect.width - 10, 20)
-            pygame.draw.rect(surface, (255, 220, 100), highlight_rect, border_radius=8)
-            
-            # Shopping cart text - "MAĞAZA"
-            cart_text_font = pygame.font.SysFont("consolas", 28, bold=True)
-            cart_text = cart_text_font.render("MAĞAZA", True, (255, 255, 255))
-            cart_text_rect = cart_text.get_rect(center=cart_button_rect.center)
-            # Black outline for better visibility
-            outline_cart = cart_text_font.render("MAĞAZA", True, (0, 0, 0))
-            for dx in [-1, 0, 1]:
-                for dy in [-1, 0, 1]:
-                    if dx != 0 or dy != 0:
-                        surface.blit(outline_cart, (cart_text_rect.x + dx, cart_text_rect.y + dy))
-            surface.blit(cart_text, cart_text_rect)
-            
-            # Play/Retry Button (center) - Red
-            play_button_rect = pygame.Rect(buttons_start_x + button_size + button_spacing, buttons_y, 
-                                          button_size, button_size)
-            play_color = (255, 0, 0)  # Red
-            play_hover = play_button_rect.collidepoint(mouse_pos)
-            if play_hover:
-                play_color = (255, 50, 50)  # Brighter red
-                pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)
-            
-            pygame.draw.rect(surface, play_color, play_button_rect, border_radius=15)
-            pygame.draw.rect(surface, (180, 0, 0), play_button_rect, width=3, border_radius=15)
-            highlight_rect = pygame.Rect(play_button_rect.x + 5, play_button_rect.y + 5,
-                                       play_button_rect.width - 10, 20)
-            pygame.draw.rect(surface, (255, 100, 100), highlight_rect, border_radius=8)
+            self._draw_screen_background(surface)
             
-            # Play icon (triangle) - keep for visual
-            play_icon_size = 50
-            play_triangle = [
-                (play_button_rect.centerx - play_icon_size // 2, play_button_rect.centery - play_icon_size // 2),
-                (play_button_rect.centerx - play_icon_size // 2, play_button_rect.centery + play_icon_size // 2),
-                (play_button_rect.centerx + play_icon_size // 2, play_button_rect.centery)
-            ]
-            pygame.draw.polygon(surface, (255, 255, 255), play_triangle)
-            
-            # Settings Button (right) - Orange-yellow
-            settings_button_rect = pygame.Rect(buttons_start_x + 2 * (button_size + button_spacing), 
-                                               buttons_y, button_size, button_size)
-            settings_color = (255, 165, 0)  # Orange
-            settings_hover = settings_button_rect.collidepoint(mouse_pos)
-            if settings_hover:
-                settings_color = (255, 200, 0)  # Brighter orange
-                pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)
-            
-            pygame.draw.rect(surface, settings_color, settings_button_rect, border_radius=15)
-            pygame.draw.rect(surface, (200, 120, 0), settings_button_rect, width=3, border_radius=15)
-            highlight_rect = pygame.Rect(settings_button_rect.x + 5, settings_button_rect.y + 5,
-                                       settings_button_rect.width - 10, 20)
-            pygame.draw.rect(surface, (255, 220, 100), highlight_rect, border_radius=8)
-            
-            # Settings text - "AYARLAR"
-            settings_text_font = pygame.font.SysFont("consolas", 26, bold=True)
-            settings_text = settings_text_font.render("AYARLAR", True, (255, 255, 255))
-            settings_text_rect = settings_text.get_rect(center=settings_button_rect.center)
-            # Black outline for better visibility
-            outline_settings = settings_text_font.render("AYARLAR", True, (0, 0, 0))
-            for dx in [-1, 0, 1]:
-                for dy in [-1, 0, 1]:
-                    if dx != 0 or dy != 0:
-                        surface.blit(outline_settings, (settings_text_rect.x + dx, settings_text_rect.y + dy))
-            surface.blit(settings_text, settings_text_rect)
-            
-            # Button labels - only for center button (Retry/Play)
-            label_font = pygame.font.SysFont("consolas", 20, bold=True)
-            label_y = buttons_y + button_size + 15
-            
-            # Only retry label (center button)
-            retry_label = label_font.render("TEKRAR BAŞLA", True, (255, 255, 255))
-            retry_label_rect = retry_label.get_rect(center=(play_button_rect.centerx, label_y))
-            # Black outline
-            for dx in [-1, 0, 1]:
-                for dy in [-1, 0, 1]:
-                    if dx != 0 or dy != 0:
-                        outline_surf = label_font.render("TEKRAR BAŞLA", True, (0, 0, 0))
-                        surface.blit(outline_surf, (retry_label_rect.x + dx, retry_label_rect.y + dy))
-            surface.blit(retry_label, retry_label_rect)
-            
-            # Back button (ana ekrana dön) - sadece ana ölüm ekranında göster
-            if self.shop_section == "main":
-                back_button_width = 200
-                back_button_height = 50
-                back_button_y = label_y + 50
-                back_button_rect = pygame.Rect(Config.WINDOW_WIDTH // 2 - back_button_width // 2,
-                                               back_button_y, back_button_width, back_button_height)
-                back_hover = back_button_rect.collidepoint(mouse_pos)
-                if back_hover:
-                    back_color = (150, 150, 200)  # Brighter on hover
-                    pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)
-                else:
-                    back_color = (100, 100, 150)  # Normal
-                
-                # Draw back button
-                pygame.draw.rect(surface, back_color, back_button_rect, border_radius=10)
-                pygame.draw.rect(surface, (70, 70, 100), back_button_rect, width=3, border_radius=10)
-                
-                # Back button text
-                back_font = pygame.font.SysFont("consolas", 24, bold=True)
-                back_text = f"◄ {self.t('back')}"
-                back_text_surf = back_font.render(back_text, True, (255, 255, 255))
-                back_text_rect = back_text_surf.get_rect(center=back_button_rect.center)
-                # Black outline for visibility
-                outline_back = back_font.render(back_text, True, (0, 0, 0))
-                for dx in [-1, 0, 1]:
-                    for dy in [-1, 0, 1]:
-                        if dx != 0 or dy != 0:
-                            surface.blit(outline_back, (back_text_rect.x + dx, back_text_rect.y + dy))
-                surface.blit(back_text_surf, back_text_rect)
+            # Title, score and the cart / retry / settings buttons
+            self._ui("death").draw(surface, self.dirty)
             
             # Draw shop/equipment menu if shopping cart was clicked (overlay on death screen)
             if self.shop_section == "weapons" and self.state == "shop":
@@ -1615,608 +3932,30 @@ class Game:
         except Exception as e:
             # Fallback: Draw simple error message
             try:
-                error_font = pygame.font.SysFont("consolas", 24, bold=True)
-                error_text = error_font.render("Error - Press ESC to continue", True, (255, 0, 0))
+                error_text = self._text("Error - Press ESC to continue", 24, (255, 0, 0))
                 error_rect = error_text.get_rect(center=(Config.WINDOW_WIDTH // 2, Config.WINDOW_HEIGHT // 2))
                 surface.blit(error_text, error_rect)
             except:
                 pass
     
-    def _draw_modern_button(self, surface, rect, text, icon="", base_color=Config.NEON_BLUE, 
-                           is_hovered=False, is_pressed=False, button_id=""):
-        """Draw modern glassmorphism button with LERP animations"""
-        # LERP animation for smooth transitions
-        target_scale = 1.0
-        target_glow = 0.6
-        
-        if is_pressed:
-            target_scale = 0.9  # 10% smaller when pressed
-            target_glow = 0.8
-        elif is_hovered:
-            target_scale = 1.05  # 5% larger when hovered
-            target_glow = 1.2
-        
-        # Smooth LERP interpolation
-        if button_id not in self.button_scales:
-            self.button_scales[button_id] = 1.0
-        if button_id not in self.button_glow_intensities:
-            self.button_glow_intensities[button_id] = 0.6
-        
-        # LERP speed (adjust for smoothness - frame-independent)
-        lerp_speed = 0.2  # Smooth but responsive
-        self.button_scales[button_id] += (target_scale - self.button_scales[button_id]) * lerp_speed
-        self.button_glow_intensities[button_id] += (target_glow - self.button_glow_intensities[button_id]) * lerp_speed
-        
-        scale = self.button_scales[button_id]
-        glow_intensity_base = self.button_glow_intensities[button_id]
-        
-        # Scaled rect
-        scaled_width = int(rect.width * scale)
-        scaled_height = int(rect.height * scale)
-        scaled_rect = pygame.Rect(
-            rect.centerx - scaled_width // 2,
-            rect.centery - scaled_height // 2,
-            scaled_width,
-            scaled_height
-        )
-        
-        # Border radius
-        border_radius = min(scaled_rect.width, scaled_rect.height) // 2 if scaled_rect.width == scaled_rect.height else 15
-        
-        # Color based on state with LERP smooth transitions
-        glow_intensity = glow_intensity_base
-        
-        if is_pressed:
-            button_color = tuple(max(0, c - 40) for c in base_color)  # Darker when pressed
-            border_color = tuple(max(0, c - 20) for c in base_color)
-        elif is_hovered:
-            # Hover: %20 brighter with neon glow (never disappears)
-            button_color = tuple(min(255, int(c * 1.2)) for c in base_color)  # 20% brighter
-            border_color = tuple(min(255, int(c * 1.3)) for c in base_color)  # 30% brighter border
-        else:
-            button_color = base_color
-            border_color = tuple(min(255, c + 20) for c in base_color)
-        
-        # Enhanced Neon Glow effect
-        glow_layers = 3
-        for i in range(glow_layers):
-            glow_size = 30 + (i * 10)
-            glow_surf = pygame.Surface((scaled_rect.width + glow_size * 2, scaled_rect.height + glow_size * 2), pygame.SRCALPHA)
-            glow_alpha = int((150 - i * 30) * glow_intensity)
-            glow_color = (int(border_color[0] * glow_intensity), int(border_color[1] * glow_intensity),
-                         int(border_color[2] * glow_intensity), glow_alpha)
-            pygame.draw.rect(glow_surf, glow_color, glow_surf.get_rect(), border_radius=border_radius + glow_size // 2)
-            surface.blit(glow_surf, (scaled_rect.x - glow_size, scaled_rect.y - glow_size))
-        
-        # Modern glassmorphism button background (always visible, never disappears)
-        button_surf = pygame.Surface((scaled_rect.width, scaled_rect.height), pygame.SRCALPHA)
-        if is_hovered:
-            button_alpha = 240  # Very visible when hovered (bright)
-            button_surf.fill((int(button_color[0] * 0.3), int(button_color[1] * 0.3), int(button_color[2] * 0.3), button_alpha))
-        else:
-            button_alpha = 200  # Visible when normal
-            button_surf.fill((button_color[0] // 5, button_color[1] // 5, button_color[2] // 5, button_alpha))
-        surface.blit(button_surf, scaled_rect)
-        
-        # Enhanced Neon border with glow
-        border_width = 5 if is_hovered else 3
-        # Inner glow
-        inner_glow = pygame.Surface((scaled_rect.width - 4, scaled_rect.height - 4), pygame.SRCALPHA)
-        inner_glow_rect = pygame.Rect(2, 2, scaled_rect.width - 4, scaled_rect.height - 4)
-        pygame.draw.rect(inner_glow, (border_color[0], border_color[1], border_color[2], 100), 
-                        inner_glow.get_rect(), border_radius=border_radius - 2)
-        surface.blit(inner_glow, (scaled_rect.x + 2, scaled_rect.y + 2))
-        # Main border
-        pygame.draw.rect(surface, border_color, scaled_rect, width=border_width, border_radius=border_radius)
-        
-        # Highlight effect
-        if is_hovered and not is_pressed:
-            highlight = pygame.Surface((scaled_rect.width, scaled_rect.height), pygame.SRCALPHA)
-            pygame.draw.rect(highlight, (255, 255, 255, 60), highlight.get_rect(), border_radius=border_radius)
-            surface.blit(highlight, scaled_rect.topleft)
-        
-        # Text and icon
-        if icon:
-            icon_font = pygame.font.SysFont("consolas", int(28 * scale), bold=True)
-            icon_surf = icon_font.render(icon, True, (255, 255, 255))
-            icon_rect = icon_surf.get_rect(center=(scaled_rect.centerx, scaled_rect.centery - 8))
-            surface.blit(icon_surf, icon_rect)
-        
-        if text:
-            text_font = pygame.font.SysFont("consolas", int(20 * scale), bold=True)
-            text_surf = text_font.render(text, True, (255, 255, 255))
-            text_rect = text_surf.get_rect(center=(scaled_rect.centerx, scaled_rect.centery + (12 if icon else 0)))
-            # Glow text
-            glow_text = text_font.render(text, True, (int(border_color[0] * 0.3), int(border_color[1] * 0.3), int(border_color[2] * 0.3)))
-            surface.blit(glow_text, (text_rect.x + 1, text_rect.y + 1))
-            surface.blit(text_surf, text_rect)
-    
-    def _draw_main_shop(self, surface, content_rect, start_y):
-        """Draw main shop with modern glassmorphism buttons"""
-        try:
-            mouse_pos = self._get_safe_mouse_pos()
-            mouse_pressed = pygame.mouse.get_pressed()[0]
-        except:
-            mouse_pos = (Config.WINDOW_WIDTH // 2, Config.WINDOW_HEIGHT // 2)
-            mouse_pressed = False
-        
-        hovered_button = None
-        
-        # Circular buttons row
-        button_size = 80
-        button_spacing = 20
-        buttons_start_y = start_y + 100
-        total_buttons_width = 3 * button_size + 2 * button_spacing
-        buttons_start_x = content_rect.centerx - total_buttons_width // 2
-        
-        circular_buttons = [
-            ("weapons", "⚔", self.t("shop"), Config.NEON_CYAN),
-            ("stats", "📊", "Stats", Config.NEON_BLUE),
-            ("help", "?", "Help", Config.NEON_PURPLE)
-        ]
-        
-        for idx, (button_id, icon, label, color) in enumerate(circular_buttons):
-            try:
-                button_x = buttons_start_x + idx * (button_size + button_spacing)
-                button_rect = pygame.Rect(button_x, buttons_start_y, button_size, button_size)
-                is_hovered = button_rect.collidepoint(mouse_pos)
-                is_pressed = is_hovered and mouse_pressed and button_id not in self.pressed_buttons
-                
-                if is_hovered:
-                    hovered_button = button_id
-                
-                if is_pressed:
-                    self.pressed_buttons[button_id] = True
-                elif button_id in self.pressed_buttons and not mouse_pressed:
-                    del self.pressed_buttons[button_id]
-                
-                # Draw modern button
-                self._draw_modern_button(surface, button_rect, label, icon, color, is_hovered, is_pressed, button_id)
-            except:
-                pass  # Silently ignore button drawing errors
-        
-        # Set cursor based on hover state
-        try:
-            if hovered_button:
-                pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)
-            else:
-                pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
-        except:
-            pass  # Silently ignore cursor errors
-        
-        # Pill-shaped buttons
-        try:
-            pill_button_width = 200  # Modern, elegant size
-            pill_button_height = 45
-            pill_buttons_start_y = buttons_start_y + button_size + 80
-            
-            # "Weapons" button
-            weapons_button_rect = pygame.Rect(content_rect.centerx - pill_button_width // 2,
-                                             pill_buttons_start_y, pill_button_width, pill_button_height)
-            is_hovered_weapons = weapons_button_rect.collidepoint(mouse_pos)
-            is_pressed_weapons = is_hovered_weapons and mouse_pressed and "weapons_pill" not in self.pressed_buttons
-            
-            if is_pressed_weapons:
-                self.pressed_buttons["weapons_pill"] = True
-            elif "weapons_pill" in self.pressed_buttons and not mouse_pressed:
-                del self.pressed_buttons["weapons_pill"]
-            
-            self._draw_modern_button(surface, weapons_button_rect, f"⚔ {self.t('shop')}", "", 
-                                    Config.NEON_CYAN, is_hovered_weapons, is_pressed_weapons, "weapons_pill")
-        except:
-            pass  # Silently ignore pill button errors
-        
-        # "Back" button
-        back_button_rect = pygame.Rect(content_rect.centerx - pill_button_width // 2,
-                                       pill_buttons_start_y + pill_button_height + 20,
-                                       pill_button_width, pill_button_height)
-        try:
-            is_hovered_back = back_button_rect.collidepoint(mouse_pos)
-            is_pressed_back = is_hovered_back and mouse_pressed and "back_pill" not in self.pressed_buttons
-            
-            if is_pressed_back:
-                self.pressed_buttons["back_pill"] = True
-            elif "back_pill" in self.pressed_buttons and not mouse_pressed:
-                del self.pressed_buttons["back_pill"]
-            
-            self._draw_modern_button(surface, back_button_rect, f"◄ {self.t('back')}", "", 
-                                    (220, 50, 50), is_hovered_back, is_pressed_back, "back_pill")
-        except:
-            pass  # Silently ignore back button errors
-        
-        # Enter prompt
-        enter_font = pygame.font.SysFont("consolas", 20, bold=True)
-        enter_text = self.t("press_enter")
-        enter_surf = enter_font.render(enter_text, True, Config.NEON_CYAN)
-        enter_rect = enter_surf.get_rect(center=(content_rect.centerx, content_rect.bottom - 30))
-        surface.blit(enter_surf, enter_rect)
-    
-    def _draw_weapons_shop(self, surface, content_rect, start_y):
-        """Draw weapons shop with simple, clean buttons (no excessive glow effects)"""
-        try:
-            mouse_pos = self._get_safe_mouse_pos()
-            mouse_pressed = pygame.mouse.get_pressed()[0]
-        except:
-            mouse_pos = (Config.WINDOW_WIDTH // 2, Config.WINDOW_HEIGHT // 2)
-            mouse_pressed = False
-        
-        hovered_button = None
-        
-        # Item buttons (circular) - simple design
-        item_button_size = 90
-        item_spacing = 30
-        items_start_y = start_y + 50
-        total_items_width = 4 * item_button_size + 3 * item_spacing
-        items_start_x = content_rect.centerx - total_items_width // 2
-        
-        items = [
-            ("shield", "S", self.t("shield"), 100, self.has_shield),
-            ("magnet", "M", self.t("magnet"), 80, self.has_magnet),
-            ("speed", "SP", f"{self.t('speed')} +{self.speed_boost_level + 1}" if self.speed_boost_level < 3 else f"{self.t('speed')} MAX", 50, self.speed_boost_level >= 3),
-            ("triple", "3X", self.t("triple_shot"), 150, self.weapon_level >= 3)
-        ]
-        
-        for idx, (item_id, icon, item_name, cost, is_owned) in enumerate(items):
-            button_x = items_start_x + idx * (item_button_size + item_spacing)
-            item_rect = pygame.Rect(button_x, items_start_y, item_button_size, item_button_size)
-            is_hovered = item_rect.collidepoint(mouse_pos)
-            can_afford = self.total_gold >= cost
-            
-            if is_hovered and can_afford:
-                hovered_button = item_id
-            
-            # Simple button drawing - NO excessive glow effects
-            if is_owned:
-                button_color = (100, 200, 100)  # Light green
-                border_color = (50, 150, 50)
-            elif not can_afford:
-                button_color = (100, 100, 100)  # Gray
-                border_color = (70, 70, 70)
-            else:
-                button_color = (150, 150, 200)  # Light blue-gray
-                border_color = (100, 100, 150)
-            
-            # Hover effect - slightly brighter
-            if is_hovered and can_afford and not is_owned:
-                button_color = tuple(min(255, c + 30) for c in button_color)
-                border_color = tuple(min(255, c + 30) for c in border_color)
-            
-            # Draw simple circular button (NO glow layers)
-            pygame.draw.circle(surface, button_color, item_rect.center, item_button_size // 2)
-            pygame.draw.circle(surface, border_color, item_rect.center, item_button_size // 2, width=3)
-            
-            # Icon text (always visible)
-            icon_font = pygame.font.SysFont("consolas", 36, bold=True)
-            icon_color = (255, 255, 255) if can_afford or is_owned else (150, 150, 150)
-            icon_surf = icon_font.render(icon, True, icon_color)
-            icon_rect = icon_surf.get_rect(center=item_rect.center)
-            # Text outline for visibility
-            outline_surf = icon_font.render(icon, True, (0, 0, 0))
-            for dx in [-1, 0, 1]:
-                for dy in [-1, 0, 1]:
-                    if dx != 0 or dy != 0:
-                        surface.blit(outline_surf, (icon_rect.x + dx, icon_rect.y + dy))
-            surface.blit(icon_surf, icon_rect)
-            
-            # Label and cost below (ALWAYS visible with outline)
-            label_font = pygame.font.SysFont("consolas", 16, bold=True)
-            label_color = (0, 0, 0)  # Black text for visibility on light background
-            label_surf = label_font.render(item_name, True, label_color)
-            label_rect = label_surf.get_rect(center=(item_rect.centerx, item_rect.bottom + 18))
-            # White outline for visibility
-            outline_label = label_font.render(item_name, True, (255, 255, 255))
-            for dx in [-1, 0, 1]:
-                for dy in [-1, 0, 1]:
-                    if dx != 0 or dy != 0:
-                        surface.blit(outline_label, (label_rect.x + dx, label_rect.y + dy))
-            surface.blit(label_surf, label_rect)
-            
-            if not is_owned:
-                cost_font = pygame.font.SysFont("consolas", 14, bold=True)
-                cost_text = f"{cost} {self.t('points')}"
-                cost_color = (200, 150, 0) if can_afford else (120, 120, 120)  # Gold or gray
-                cost_surf = cost_font.render(cost_text, True, cost_color)
-                cost_rect = cost_surf.get_rect(center=(item_rect.centerx, item_rect.bottom + 36))
-                # White outline for visibility
-                outline_cost = cost_font.render(cost_text, True, (255, 255, 255))
-                for dx in [-1, 0, 1]:
-                    for dy in [-1, 0, 1]:
-                        if dx != 0 or dy != 0:
-                            surface.blit(outline_cost, (cost_rect.x + dx, cost_rect.y + dy))
-                surface.blit(cost_surf, cost_rect)
-            else:
-                owned_font = pygame.font.SysFont("consolas", 14, bold=True)
-                owned_color = (0, 150, 0)  # Dark green
-                owned_surf = owned_font.render(self.t("purchased"), True, owned_color)
-                owned_rect = owned_surf.get_rect(center=(item_rect.centerx, item_rect.bottom + 36))
-                # White outline for visibility
-                outline_owned = owned_font.render(self.t("purchased"), True, (255, 255, 255))
-                for dx in [-1, 0, 1]:
-                    for dy in [-1, 0, 1]:
-                        if dx != 0 or dy != 0:
-                            surface.blit(outline_owned, (owned_rect.x + dx, owned_rect.y + dy))
-                surface.blit(owned_surf, owned_rect)
-        
-        # Back button - simple design
-        pill_button_width = 200
-        pill_button_height = 45
-        back_button_rect = pygame.Rect(content_rect.centerx - pill_button_width // 2,
-                                       items_start_y + item_button_size + 80,
-                                       pill_button_width, pill_button_height)
-        is_hovered_back = back_button_rect.collidepoint(mouse_pos)
-        
-        if is_hovered_back:
-            hovered_button = "back_weapons"
-            back_color = (220, 80, 80)  # Brighter red on hover
-        else:
-            back_color = (200, 50, 50)  # Normal red
-        
-        # Simple back button (NO glow effects)
-        pygame.draw.rect(surface, back_color, back_button_rect, border_radius=10)
-        pygame.draw.rect(surface, (150, 0, 0), back_button_rect, width=3, border_radius=10)
-        
-        # Back button text (always visible)
-        back_font = pygame.font.SysFont("consolas", 22, bold=True)
-        back_text = f"◄ {self.t('back')}"
-        back_text_surf = back_font.render(back_text, True, (255, 255, 255))
-        back_text_rect = back_text_surf.get_rect(center=back_button_rect.center)
-        # Black outline for visibility
-        outline_back = back_font.render(back_text, True, (0, 0, 0))
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx != 0 or dy != 0:
-                    surface.blit(outline_back, (back_text_rect.x + dx, back_text_rect.y + dy))
-        surface.blit(back_text_surf, back_text_rect)
-        
-        # Set cursor based on hover state
-        try:
-            if hovered_button:
-                pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)
-            else:
-                pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
-        except:
-            pass  # Silently ignore cursor errors
-        
-        # Enter prompt removed - mouse click only
-    
     def _draw_settings_menu(self, surface):
         """Draw settings menu overlay with volume and language controls"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((Config.WINDOW_WIDTH, Config.WINDOW_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        surface.blit(overlay, (0, 0))
-        
-        # Settings panel (increased height to fit all buttons)
-        panel_width = 500
-        panel_height = 500
-        panel_x = Config.WINDOW_WIDTH // 2 - panel_width // 2
-        panel_y = Config.WINDOW_HEIGHT // 2 - panel_height // 2
-        panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
-        
-        # Bright, childish panel background
-        pygame.draw.rect(surface, (255, 255, 200), panel_rect, border_radius=20)
-        pygame.draw.rect(surface, (200, 200, 100), panel_rect, width=4, border_radius=20)
-        
-        # Title
-        title_font = pygame.font.SysFont("consolas", 48, bold=True)
-        title_text = self.t("settings")
-        title_surf = title_font.render(title_text, True, (0, 0, 0))
-        title_rect = title_surf.get_rect(center=(panel_rect.centerx, panel_rect.y + 40))
-        surface.blit(title_surf, title_rect)
-        
-        try:
-            mouse_pos = self._get_safe_mouse_pos()
-        except:
-            mouse_pos = (Config.WINDOW_WIDTH // 2, Config.WINDOW_HEIGHT // 2)
-        
-        # Volume section (moved up)
-        volume_y = panel_rect.y + 100
-        volume_label_font = pygame.font.SysFont("consolas", 28, bold=True)
-        volume_label = volume_label_font.render(f"{self.t('volume')}: {int(self.volume * 100)}%", True, (0, 0, 0))
-        volume_label_rect = volume_label.get_rect(center=(panel_rect.centerx, volume_y))
-        surface.blit(volume_label, volume_label_rect)
-        
-        # Volume buttons
-        vol_button_size = 60
-        vol_button_y = volume_y + 50
-        vol_decrease_x = panel_rect.centerx - 80
-        vol_increase_x = panel_rect.centerx + 80
-        
-        # Decrease button
-        vol_dec_rect = pygame.Rect(vol_decrease_x - vol_button_size // 2, vol_button_y - vol_button_size // 2,
-                                   vol_button_size, vol_button_size)
-        vol_dec_hover = vol_dec_rect.collidepoint(mouse_pos)
-        vol_dec_color = (255, 100, 100) if vol_dec_hover else (255, 150, 150)
-        pygame.draw.rect(surface, vol_dec_color, vol_dec_rect, border_radius=10)
-        pygame.draw.rect(surface, (200, 0, 0), vol_dec_rect, width=3, border_radius=10)
-        dec_font = pygame.font.SysFont("consolas", 40, bold=True)
-        dec_text = dec_font.render(self.t("decrease_volume"), True, (255, 255, 255))
-        dec_rect = dec_text.get_rect(center=vol_dec_rect.center)
-        surface.blit(dec_text, dec_rect)
-        
-        # Increase button
-        vol_inc_rect = pygame.Rect(vol_increase_x - vol_button_size // 2, vol_button_y - vol_button_size // 2,
-                                   vol_button_size, vol_button_size)
-        vol_inc_hover = vol_inc_rect.collidepoint(mouse_pos)
-        vol_inc_color = (100, 255, 100) if vol_inc_hover else (150, 255, 150)
-        pygame.draw.rect(surface, vol_inc_color, vol_inc_rect, border_radius=10)
-        pygame.draw.rect(surface, (0, 200, 0), vol_inc_rect, width=3, border_radius=10)
-        inc_font = pygame.font.SysFont("consolas", 40, bold=True)
-        inc_text = inc_font.render(self.t("increase_volume"), True, (255, 255, 255))
-        inc_rect = inc_text.get_rect(center=vol_inc_rect.center)
-        surface.blit(inc_text, inc_rect)
-        
-        # Language section (moved up)
-        lang_y = volume_y + 120
-        lang_label_font = pygame.font.SysFont("consolas", 28, bold=True)
-        lang_label = lang_label_font.render(self.t("language"), True, (0, 0, 0))
-        lang_label_rect = lang_label.get_rect(center=(panel_rect.centerx, lang_y))
-        surface.blit(lang_label, lang_label_rect)
+        surface.blit(self.dim_overlay, (0, 0))
         
-        # Language buttons
-        lang_button_width = 180
-        lang_button_height = 50
-        lang_button_y = lang_y + 40
-        lang_turk_x = panel_rect.centerx - 100
-        lang_eng_x = panel_rect.centerx + 100
-        
-        # Turkish button
-        lang_turk_rect = pygame.Rect(lang_turk_x - lang_button_width // 2, lang_button_y - lang_button_height // 2,
-                                     lang_button_width, lang_button_height)
-        lang_turk_hover = lang_turk_rect.collidepoint(mouse_pos)
-        lang_turk_color = (200, 200, 255) if lang_turk_hover else (180, 180, 255)
-        if self.language == Language.TURKISH:
-            lang_turk_color = (150, 150, 255)
-        pygame.draw.rect(surface, lang_turk_color, lang_turk_rect, border_radius=10)
-        pygame.draw.rect(surface, (100, 100, 200), lang_turk_rect, width=3, border_radius=10)
-        turk_font = pygame.font.SysFont("consolas", 24, bold=True)
-        turk_text = turk_font.render(self.t("turkish"), True, (0, 0, 0))
-        turk_rect = turk_text.get_rect(center=lang_turk_rect.center)
-        surface.blit(turk_text, turk_rect)
-        
-        # English button
-        lang_eng_rect = pygame.Rect(lang_eng_x - lang_button_width // 2, lang_button_y - lang_button_height // 2,
-                                    lang_button_width, lang_button_height)
-        lang_eng_hover = lang_eng_rect.collidepoint(mouse_pos)
-        lang_eng_color = (200, 200, 255) if lang_eng_hover else (180, 180, 255)
-        if self.language == Language.ENGLISH:
-            lang_eng_color = (150, 150, 255)
-        pygame.draw.rect(surface, lang_eng_color, lang_eng_rect, border_radius=10)
-        pygame.draw.rect(surface, (100, 100, 200), lang_eng_rect, width=3, border_radius=10)
-        eng_font = pygame.font.SysFont("consolas", 24, bold=True)
-        eng_text = eng_font.render(self.t("english"), True, (0, 0, 0))
-        eng_rect = eng_text.get_rect(center=lang_eng_rect.center)
-        surface.blit(eng_text, eng_rect)
-        
-        # Back button (Geri - moved up)
-        back_button_width = 150
-        back_button_height = 45
-        back_button_rect = pygame.Rect(panel_rect.centerx - back_button_width // 2,
-                                       panel_rect.bottom - 110,
-                                       back_button_width, back_button_height)
-        back_hover = back_button_rect.collidepoint(mouse_pos)
-        back_color = (200, 255, 200) if back_hover else (150, 255, 150)
-        pygame.draw.rect(surface, back_color, back_button_rect, border_radius=10)
-        pygame.draw.rect(surface, (0, 200, 0), back_button_rect, width=3, border_radius=10)
-        back_font = pygame.font.SysFont("consolas", 22, bold=True)
-        back_text = back_font.render(self.t("back"), True, (0, 0, 0))
-        back_text_rect = back_text.get_rect(center=back_button_rect.center)
-        surface.blit(back_text, back_text_rect)
-        
-        # Quit button (Oyundan Çık - at the bottom)
-        quit_button_width = 200
-        quit_button_height = 45
-        quit_button_rect = pygame.Rect(panel_rect.centerx - quit_button_width // 2,
-                                       panel_rect.bottom - 50,
-                                       quit_button_width, quit_button_height)
-        quit_hover = quit_button_rect.collidepoint(mouse_pos)
-        quit_color = (255, 100, 100) if quit_hover else (255, 150, 150)
-        pygame.draw.rect(surface, quit_color, quit_button_rect, border_radius=10)
-        pygame.draw.rect(surface, (200, 0, 0), quit_button_rect, width=3, border_radius=10)
-        quit_font = pygame.font.SysFont("consolas", 22, bold=True)
-        quit_text_str = "OYUNDAN ÇIK" if self.language == Language.TURKISH else "QUIT GAME"
-        quit_text = quit_font.render(quit_text_str, True, (255, 255, 255))
-        quit_text_rect = quit_text.get_rect(center=quit_button_rect.center)
-        surface.blit(quit_text, quit_text_rect)
+        self._ui("settings").draw(surface, self.dirty)
     
     def _draw_equipment_menu(self, surface):
         """Draw equipment/shop menu overlay"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((Config.WINDOW_WIDTH, Config.WINDOW_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        surface.blit(overlay, (0, 0))
+        surface.blit(self.dim_overlay, (0, 0))
         
-        # Equipment panel
-        panel_width = 700
-        panel_height = 500
-        panel_x = Config.WINDOW_WIDTH // 2 - panel_width // 2
-        panel_y = Config.WINDOW_HEIGHT // 2 - panel_height // 2
-        panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
-        
-        # Bright, childish panel background
-        pygame.draw.rect(surface, (255, 255, 200), panel_rect, border_radius=20)
-        pygame.draw.rect(surface, (200, 200, 100), panel_rect, width=4, border_radius=20)
-        
-        # Title
-        title_font = pygame.font.SysFont("consolas", 48, bold=True)
-        title_text = self.t("shopping")
-        title_surf = title_font.render(title_text, True, (0, 0, 0))
-        title_rect = title_surf.get_rect(center=(panel_rect.centerx, panel_rect.y + 40))
-        surface.blit(title_surf, title_rect)
-        
-        # Gold display
-        gold_font = pygame.font.SysFont("consolas", 32, bold=True)
-        gold_text = f"{self.t('points')}: {int(self.total_gold)}"
-        gold_surf = gold_font.render(gold_text, True, (255, 215, 0))
-        gold_rect = gold_surf.get_rect(center=(panel_rect.centerx, panel_rect.y + 90))
-        surface.blit(gold_surf, gold_rect)
-        
-        # Draw equipment items using existing weapons shop function
-        content_rect = pygame.Rect(panel_x + 20, panel_y + 120, panel_width - 40, panel_height - 180)
-        content_start_y = content_rect.top + 20
-        self._draw_weapons_shop(surface, content_rect, content_start_y)
-    
-    def _draw_shop_item_button(self, surface, rect, text, cost, can_afford, is_hovered, is_owned):
-        t = pygame.time.get_ticks() / 1000.0
-        glow = (math.sin(t * 4) + 1) / 2
-        
-        if is_owned:
-            button_color = (Config.NEON_CYAN[0] // 6, Config.NEON_CYAN[1] // 6, Config.NEON_CYAN[2] // 6)
-            border_color = Config.NEON_CYAN
-            text_color = Config.NEON_CYAN
-            glow_intensity = 0.6
-        elif is_hovered and can_afford:
-            button_color = (Config.NEON_PINK[0] // 4, Config.NEON_PINK[1] // 4, Config.NEON_PINK[2] // 4)
-            border_color = Config.NEON_PINK
-            text_color = Config.NEON_PINK
-            glow_intensity = 1.0
-        elif can_afford:
-            button_color = (Config.CYBERPUNK_DARK[0], Config.CYBERPUNK_DARK[1], Config.CYBERPUNK_DARK[2])
-            border_color = Config.NEON_BLUE
-            text_color = Config.NEON_CYAN
-            glow_intensity = 0.5 + glow * 0.3
-        else:
-            button_color = (Config.CYBERPUNK_DARK[0] // 2, Config.CYBERPUNK_DARK[1] // 2, Config.CYBERPUNK_DARK[2] // 2)
-            border_color = (100, 100, 100)
-            text_color = (150, 150, 150)
-            glow_intensity = 0.2
-        
-        glow_surface = pygame.Surface((rect.width + 25, rect.height + 25), pygame.SRCALPHA)
-        glow_alpha = int(140 * glow_intensity)
-        glow_color = (int(border_color[0] * glow_intensity), int(border_color[1] * glow_intensity),
-                     int(border_color[2] * glow_intensity), glow_alpha)
-        pygame.draw.rect(glow_surface, glow_color, glow_surface.get_rect(), border_radius=20)
-        surface.blit(glow_surface, (rect.x - 12, rect.y - 12))
-        
-        pygame.draw.rect(surface, button_color, rect, border_radius=18)
-        pygame.draw.rect(surface, border_color, rect, width=3, border_radius=18)
-        
-        if is_hovered and can_afford:
-            highlight = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-            pygame.draw.rect(highlight, (255, 255, 255, 50), highlight.get_rect(), border_radius=18)
-            surface.blit(highlight, rect.topleft)
-        
-        button_font = pygame.font.SysFont("consolas", 22, bold=True)
-        button_text = button_font.render(text, True, text_color)
-        button_text_rect = button_text.get_rect(center=(rect.centerx, rect.centery - 10))
-        glow_text = button_font.render(text, True, (text_color[0] // 3, text_color[1] // 3, text_color[2] // 3))
-        surface.blit(glow_text, (button_text_rect.x + 1, button_text_rect.y + 1))
-        surface.blit(button_text, button_text_rect)
-        
-        if cost > 0 and not is_owned:
-            cost_font = pygame.font.SysFont("consolas", 18, bold=True)
-            cost_text = cost_font.render(f"{cost} {self.t('points')}", True,
-                                       Config.GOLD_COLOR if can_afford else (100, 100, 100))
-            cost_text_rect = cost_text.get_rect(center=(rect.centerx, rect.centery + 15))
-            surface.blit(cost_text, cost_text_rect)
-        elif is_owned:
-            owned_font = pygame.font.SysFont("consolas", 16, bold=True)
-            owned_text = owned_font.render(self.t("purchased"), True, Config.NEON_CYAN)
-            owned_text_rect = owned_text.get_rect(center=(rect.centerx, rect.centery + 15))
-            surface.blit(owned_text, owned_text_rect)
-    
-    def handle_events(self):
-        for event in pygame.event.get():
+        self._ui("equipment").draw(surface, self.dirty)
+    
+    def handle_events(self, events=None):
+        if events is None:
+            events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
             
@@ -2224,6 +3963,8 @@ class Game:
                 if event.key == pygame.K_F11:
                     # Toggle fullscreen
                     pass  # Fullscreen toggle can be added here
+                elif event.key == pygame.K_F3:
+                    self.profiler.toggle()
                 elif event.key == pygame.K_RETURN or event.key == pygame.K_KP_ENTER or event.key == pygame.K_SPACE:
                     if self.state == "menu":
                         self.start_game()
@@ -2232,13 +3973,7 @@ class Game:
                         self.start_game()
                 elif event.key == pygame.K_ESCAPE:
                     if self.state == "settings":
-                        # Settings'ten geri dön
-                        if self.player:  # Oyun aktifse pause'a dön
-                            self.state = "paused"
-                        elif self.last_run_score > 0:  # Ölüm ekranından ayarlara girdiyse
-                            self.state = "shop"
-                        else:  # Menu'den ayarlara girdiyse
-                            self.state = "menu"
+                        self._leave_settings()  # Settings'ten geri dön
                     elif self.state == "shop":
                         if self.shop_section == "weapons":
                             self.shop_section = "main"
@@ -2251,339 +3986,344 @@ class Game:
             
             if event.type == pygame.KEYDOWN and self.state == "playing":
                 if event.key == pygame.K_SPACE:
-                    new_bullets = self.player.shoot(self.weapon_level)
-                    self.bullets.extend(new_bullets)
+                    self.player.shoot(self.weapon_level, self.bullet_pool)
+            
+            if event.type == pygame.MOUSEMOTION:
+                # Hover only changes when the mouse actually moves
+                self._ui_mouse_motion(event.pos)
             
             # Only process mouse clicks (not drags)
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 try:
                     mouse_pos = self._clamp_mouse_pos(event.pos)
-                    
-                    flag_size = 40
-                    spacing = 10
-                    start_x = 15
-                    start_y = Config.WINDOW_HEIGHT - 70
-                    
-                    # Türk bayrağı tıklama
-                    turk_rect = pygame.Rect(start_x, start_y, flag_size, flag_size)
-                    if turk_rect.collidepoint(mouse_pos):
-                        self.language = Language.TURKISH
-                        continue
-                    
-                    # İngilizce bayrağı tıklama
-                    eng_rect = pygame.Rect(start_x + flag_size + spacing, start_y, flag_size, flag_size)
-                    if eng_rect.collidepoint(mouse_pos):
-                        self.language = Language.ENGLISH
-                        continue
-                    
-                    # Menu state - ayarlar ikonu veya genel tıklama
-                    if self.state == "menu":
-                        # Ayarlar ikonu kontrolü
-                        icon_size = 60
-                        icon_x = 20
-                        icon_y = 20
-                        icon_rect = pygame.Rect(icon_x, icon_y, icon_size, icon_size)
-                        
-                        # Dil butonları kontrolü
-                        flag_clicked = turk_rect.collidepoint(mouse_pos) or eng_rect.collidepoint(mouse_pos)
-                        
-                        if icon_rect.collidepoint(mouse_pos):
-                            self.state = "settings"
-                            continue
-                        elif not flag_clicked:
+                    name = self._active_ui()
+                    if name is not None:
+                        # Same layout as drawn, so hit-testing never drifts from the visuals
+                        clicked = self._ui(name).click(mouse_pos)
+                        if not clicked and name == "menu":
                             # Ekranın herhangi bir yerine tıklanınca oyunu başlat
                             self.start_game()
-                            continue
-                    
-                    if self.state == "paused":
-                        # Pause menu button clicks
-                        try:
-                            panel_width = 400
-                            panel_height = 320
-                            panel_x = Config.WINDOW_WIDTH // 2 - panel_width // 2
-                            panel_y = Config.WINDOW_HEIGHT // 2 - panel_height // 2
-                            
-                            # Continue button
-                            continue_button_width = 300
-                            continue_button_height = 60
-                            continue_button_rect = pygame.Rect(panel_x + panel_width // 2 - continue_button_width // 2,
-                                                              panel_y + 120,
-                                                              continue_button_width, continue_button_height)
-                            if continue_button_rect.collidepoint(mouse_pos):
-                                self.state = "playing"  # Oyuna devam et
-                            
-                            # Settings button
-                            settings_button_width = 300
-                            settings_button_height = 60
-                            settings_button_rect = pygame.Rect(panel_x + panel_width // 2 - settings_button_width // 2,
-                                                              panel_y + 200,
-                                                              settings_button_width, settings_button_height)
-                            if settings_button_rect.collidepoint(mouse_pos):
-                                self.state = "settings"  # Ayarlar menüsüne git
-                        except:
-                            pass
-                    
-                    elif self.state == "settings":
-                        # Settings menu button clicks
-                        try:
-                            panel_width = 500
-                            panel_height = 500
-                            panel_x = Config.WINDOW_WIDTH // 2 - panel_width // 2
-                            panel_y = Config.WINDOW_HEIGHT // 2 - panel_height // 2
-                            
-                            # Volume decrease button
-                            vol_button_size = 60
-                            volume_y = panel_y + 100
-                            vol_button_y = volume_y + 50
-                            vol_decrease_x = Config.WINDOW_WIDTH // 2 - 80
-                            vol_dec_rect = pygame.Rect(vol_decrease_x - vol_button_size // 2, vol_button_y - vol_button_size // 2,
-                                                       vol_button_size, vol_button_size)
-                            if vol_dec_rect.collidepoint(mouse_pos):
-                                self.volume = max(0.0, self.volume - 0.1)
-                                pygame.mixer.music.set_volume(self.volume)
-                                if self.hit_sound:
-                                    self.hit_sound.set_volume(self.volume)
-                                if self.start_sound:
-                                    self.start_sound.set_volume(self.volume)
-                            
-                            # Volume increase button
-                            vol_increase_x = Config.WINDOW_WIDTH // 2 + 80
-                            vol_inc_rect = pygame.Rect(vol_increase_x - vol_button_size // 2, vol_button_y - vol_button_size // 2,
-                                                       vol_button_size, vol_button_size)
-                            if vol_inc_rect.collidepoint(mouse_pos):
-                                self.volume = min(1.0, self.volume + 0.1)
-                                pygame.mixer.music.set_volume(self.volume)
-                                if self.hit_sound:
-                                    self.hit_sound.set_volume(self.volume)
-                                if self.start_sound:
-                                    self.start_sound.set_volume(self.volume)
-                            
-                            # Language buttons
-                            lang_button_width = 180
-                            lang_button_height = 50
-                            lang_y = volume_y + 120
-                            lang_button_y = lang_y + 40
-                            lang_turk_x = Config.WINDOW_WIDTH // 2 - 100
-                            lang_eng_x = Config.WINDOW_WIDTH // 2 + 100
-                            
-                            lang_turk_rect = pygame.Rect(lang_turk_x - lang_button_width // 2, lang_button_y - lang_button_height // 2,
-                                                          lang_button_width, lang_button_height)
-                            if lang_turk_rect.collidepoint(mouse_pos):
-                                self.language = Language.TURKISH
-                            
-                            lang_eng_rect = pygame.Rect(lang_eng_x - lang_button_width // 2, lang_button_y - lang_button_height // 2,
-                                                         lang_button_width, lang_button_height)
-                            if lang_eng_rect.collidepoint(mouse_pos):
-                                self.language = Language.ENGLISH
-                            
-                            # Back button (Geri - moved up)
-                            back_button_width = 150
-                            back_button_height = 45
-                            back_button_rect = pygame.Rect(Config.WINDOW_WIDTH // 2 - back_button_width // 2,
-                                                           panel_y + panel_height - 110,
-                                                           back_button_width, back_button_height)
-                            if back_button_rect.collidepoint(mouse_pos):
-                                # Doğru ekrana geri dön
-                                if self.player:  # Oyun oynarken ayarlara girdiyse
-                                    self.state = "paused"
-                                elif self.last_run_score > 0:  # Ölüm ekranından ayarlara girdiyse
-                                    self.state = "shop"
-                                else:  # Menu'den ayarlara girdiyse
-                                    self.state = "menu"
-                            
-                            # Quit button (Oyundan Çık - at the bottom)
-                            quit_button_width = 200
-                            quit_button_height = 45
-                            quit_button_rect = pygame.Rect(Config.WINDOW_WIDTH // 2 - quit_button_width // 2,
-                                                           panel_y + panel_height - 50,
-                                                           quit_button_width, quit_button_height)
-                            if quit_button_rect.collidepoint(mouse_pos):
-                                self.running = False  # Oyunu kapat
-                        except:
-                            pass
-                    
-                    elif self.state == "shop":
-                        # Death screen button clicks
-                        try:
-                            button_size = 120
-                            button_spacing = 40
-                            buttons_y = Config.WINDOW_HEIGHT // 2 + 50
-                            total_width = 3 * button_size + 2 * button_spacing
-                            buttons_start_x = Config.WINDOW_WIDTH // 2 - total_width // 2
-                            
-                            # Shopping cart button (left)
-                            cart_button_rect = pygame.Rect(buttons_start_x, buttons_y, button_size, button_size)
-                            if cart_button_rect.collidepoint(mouse_pos):
-                                self.shop_section = "weapons"
-                            
-                            # Play/Retry button (center)
-                            play_button_rect = pygame.Rect(buttons_start_x + button_size + button_spacing, buttons_y,
-                                                          button_size, button_size)
-                            if play_button_rect.collidepoint(mouse_pos):
-                                self.start_game()
-                            
-                            # Settings button (right)
-                            settings_button_rect = pygame.Rect(buttons_start_x + 2 * (button_size + button_spacing),
-                                                               buttons_y, button_size, button_size)
-                            if settings_button_rect.collidepoint(mouse_pos):
-                                self.state = "settings"
-                            
-                            # Back button (ana ekrana dön) - sadece ana ölüm ekranında
-                            if self.shop_section == "main":
-                                label_y = buttons_y + button_size + 15
-                                back_button_width = 200
-                                back_button_height = 50
-                                back_button_y = label_y + 50
-                                back_button_rect = pygame.Rect(Config.WINDOW_WIDTH // 2 - back_button_width // 2,
-                                                               back_button_y, back_button_width, back_button_height)
-                                if back_button_rect.collidepoint(mouse_pos):
-                                    self.state = "menu"  # Ana ekrana dön
-                            
-                            # Equipment menu clicks (if open)
-                            if self.shop_section == "weapons":
-                                try:
-                                    # Calculate panel and content rects (same as drawing)
-                                    panel_width = 700
-                                    panel_height = 500
-                                    panel_x = Config.WINDOW_WIDTH // 2 - panel_width // 2
-                                    panel_y = Config.WINDOW_HEIGHT // 2 - panel_height // 2
-                                    content_rect = pygame.Rect(panel_x + 20, panel_y + 120, panel_width - 40, panel_height - 180)
-                                    content_start_y = content_rect.top + 20
-                                    
-                                    # Check circular item buttons
-                                    item_button_size = 90
-                                    item_spacing = 25
-                                    items_start_y = content_start_y + 100
-                                    total_items_width = 4 * item_button_size + 3 * item_spacing
-                                    items_start_x = content_rect.centerx - total_items_width // 2
-                                    
-                                    # Shield
-                                    shield_rect = pygame.Rect(items_start_x, items_start_y, item_button_size, item_button_size)
-                                    if shield_rect.collidepoint(mouse_pos) and not self.has_shield and self.total_gold >= 300:
-                                        self.total_gold -= 300
-                                        self.has_shield = True
-                                    
-                                    # Magnet (tek kullanımlık - her tura özel)
-                                    magnet_rect = pygame.Rect(items_start_x + item_button_size + item_spacing, items_start_y,
-                                                              item_button_size, item_button_size)
-                                    if magnet_rect.collidepoint(mouse_pos) and not self.has_magnet and self.total_gold >= 80:
-                                        self.total_gold -= 80
-                                        self.has_magnet = True
-                                    
-                                    # Speed Boost
-                                    speed_rect = pygame.Rect(items_start_x + 2 * (item_button_size + item_spacing),
-                                                            items_start_y, item_button_size, item_button_size)
-                                    if speed_rect.collidepoint(mouse_pos) and self.speed_boost_level < 3 and self.total_gold >= 150:
-                                        self.total_gold -= 150
-                                        self.speed_boost_level += 1
-                                    
-                                    # Triple Shot
-                                    triple_rect = pygame.Rect(items_start_x + 3 * (item_button_size + item_spacing),
-                                                              items_start_y, item_button_size, item_button_size)
-                                    if triple_rect.collidepoint(mouse_pos) and self.weapon_level < 3 and self.total_gold >= 500:
-                                        self.total_gold -= 500
-                                        self.weapon_level = 3
-                                    
-                                    # Back button - ana ekrana dön
-                                    pill_button_width = 200
-                                    pill_button_height = 45
-                                    back_button_rect = pygame.Rect(content_rect.centerx - pill_button_width // 2,
-                                                                   items_start_y + item_button_size + 100,
-                                                                   pill_button_width, pill_button_height)
-                                    if back_button_rect.collidepoint(mouse_pos):
-                                        self.state = "menu"  # Ana ekrana dön
-                                        self.shop_section = "main"
-                                except:
-                                    pass
-                            
-                        except Exception as e:
-                            # Silently handle any shop state errors
-                            pass
                 except Exception as e:
                     # Silently handle any mouse event errors to prevent game crash
                     pass
     
+    def update(self, dt, keys):
+        """Advance the simulation of the current state by one step"""
+        # Update background for flowing stars (in all states)
+        if self.state == "playing":
+            self.update_playing(dt, keys)
+        elif self.state == "menu":
+            # Update background animation and meteors for menu screen
+            self._update_screen_background(dt)
+            self._update_menu_meteors(dt)
+        elif self.state == "shop":
+            # Update background animation for flowing stars effect
+            self._update_screen_background(dt)
+        elif self.state == "settings":
+            # Update background animation for flowing stars effect
+            self._update_screen_background(dt)
+            # Menu'den ayarlara girdiyse meteors da güncelle
+            if not self.player and self.last_run_score == 0:
+                self._update_menu_meteors(dt)
+    
+    def _update_menu_meteors(self, dt):
+        # Update meteors for flowing effect
+        self.meteor_pool.update(dt)
+        self.meteor_pool.flush()
+        # Spawn meteors occasionally for menu background effect (2% chance per 60 Hz frame)
+        if len(self.meteors) < 5:  # Keep a few meteors flowing
+            if self.rng.random() < 1.0 - 0.98 ** (dt * 60):
+                self._spawn_menu_meteor()
+    
+    def _store_previous_positions(self):
+        """Remember entity positions before a simulation step for render interpolation"""
+        for entities in (self.bullets, self.coins):
+            for entity in entities:
+                entity.prev_pos = entity.rect.topleft
+        self.meteor_pool.store_previous()
+        if self.player:
+            self.player.prev_pos = self.player.rect.topleft
+        self.particles.store_previous()
+    
+    def _interp_offset(self, entity, offset=(0, 0)):
+        """Draw offset that places `entity` between its previous and current step positions"""
+        t = 1.0 - self.render_alpha
+        return (offset[0] + round((entity.prev_pos[0] - entity.rect.x) * t),
+                offset[1] + round((entity.prev_pos[1] - entity.rect.y) * t))
+    
+    def draw(self, keys):
+        self._sync_ui_hover()
+        if self.state not in ("paused", "settings"):
+            self.pause_backdrop = None  # Only valid while the game stays frozen
+        frame_key = (self.state, self.shop_section, self.language, self.profiler.enabled)
+        if frame_key != self.dirty_frame_key:
+            self.dirty.mark_full()  # A different screen replaces everything
+            self.dirty_frame_key = frame_key
+        if self.state == "menu":
+            self.draw_menu(self.screen)
+        elif self.state == "playing":
+            self.draw_playing(self.screen, keys)
+        elif self.state == "paused":
+            self.draw_paused(self.screen)
+        elif self.state == "settings":
+            # Settings overlay - draw correct background first
+            if self.player:  # Oyun oynarken ayarlara girdiyse
+                self.draw_paused(self.screen)
+            elif self.last_run_score > 0:  # Ölüm ekranından ayarlara girdiyse
+                self.draw_shop(self.screen)
+            else:  # Menu'den ayarlara girdiyse
+                self.draw_menu(self.screen)
+            self._draw_settings_menu(self.screen)
+        elif self.state == "shop":
+            try:
+                self.draw_shop(self.screen)
+            except Exception as e:
+                # If shop drawing fails, return to menu instead of crashing
+                self.state = "menu"
+                if not hasattr(self, 'shop_section'):
+                    self.shop_section = "main"
+        
+        if not self.preloader.finished:
+            self._draw_boot_progress(self.screen)
+        else:
+            self._move_boot_progress(None)
+        
+        # Apply fade overlay
+        if self.fade_alpha > 0:
+            fade_surf = pygame.Surface((Config.WINDOW_WIDTH, Config.WINDOW_HEIGHT), pygame.SRCALPHA)
+            fade_surf.fill((0, 0, 0, int(self.fade_alpha)))
+            self.screen.blit(fade_surf, (0, 0))
+            self.dirty.mark_full()
+        
+        self.profiler.mark("draw_other")
+        profiler_rect = self.profiler.draw(self.screen)
+        if profiler_rect is not None:
+            self.dirty.add(profiler_rect)
+        self.profiler.mark("overlay")
+        self._poll_assets()
+    
     def run(self):
+        step = 1.0 / Config.SIMULATION_HZ
+        accumulator = 0.0
         while self.running:
-            dt = self.clock.tick(Config.FPS) / 1000.0
-            keys = pygame.key.get_pressed()
+            # Rendering is capped at Config.FPS, the simulation always advances in fixed steps
+            frame_dt = min(self.clock.tick(Config.FPS) / 1000.0, 0.25)
+            self.profiler.begin_frame()
+            keys, events = self.input.poll()
+            self.keys = keys
             
-            self.handle_events()
+            self.handle_events(events)
+            self.profiler.mark("events")
             
             # Fade effect disabled - instant transitions
             # (Keeping fade code but not using it to avoid kararma effect)
             self.fade_alpha = 0
             self.fade_direction = 0
             
-            # Update background for flowing stars (in all states)
-            if self.state == "playing":
-                self.update_playing(dt, keys)
-            elif self.state == "menu":
-                # Update background animation and meteors for menu screen
-                self.background.update(dt)
-                # Update meteors for flowing effect
-                for meteor in self.meteors[:]:
-                    meteor.update(dt)
-                    if meteor.is_off_screen():
-                        self.meteors.remove(meteor)
-                # Spawn meteors occasionally for menu background effect
-                if len(self.meteors) < 5:  # Keep a few meteors flowing
-                    if random.random() < 0.02:  # Small chance each frame
-                        self._spawn_menu_meteor()
-            elif self.state == "shop":
-                # Update background animation for flowing stars effect
-                self.background.update(dt)
-            elif self.state == "settings":
-                # Update background animation for flowing stars effect
-                self.background.update(dt)
-                # Menu'den ayarlara girdiyse meteors da güncelle
-                if not self.player and self.last_run_score == 0:
-                    # Menu'den ayarlara girdiyse meteors güncelle
-                    for meteor in self.meteors[:]:
-                        meteor.update(dt)
-                        if meteor.is_off_screen():
-                            self.meteors.remove(meteor)
-                    # Spawn meteors occasionally for menu background effect
-                    if len(self.meteors) < 5:
-                        if random.random() < 0.02:
-                            self._spawn_menu_meteor()
+            accumulator += frame_dt
+            steps = 0
+            while accumulator >= step:
+                if steps >= Config.MAX_SIM_STEPS_PER_FRAME:
+                    # Too far behind - drop the backlog instead of spiralling
+                    accumulator = 0.0
+                    break
+                self._store_previous_positions()
+                self.update(step, keys)
+                accumulator -= step
+                steps += 1
+            self.render_alpha = accumulator / step
+            if self.recorder is not None:
+                self.recorder.add_frame(steps, keys, events)
+            self.profiler.mark("update_other")
             
             # Draw
-            if self.state == "menu":
-                self.draw_menu(self.screen)
-            elif self.state == "playing":
-                self.draw_playing(self.screen, keys)
-            elif self.state == "paused":
-                self.draw_paused(self.screen)
-            elif self.state == "settings":
-                # Settings overlay - draw correct background first
-                if self.player:  # Oyun oynarken ayarlara girdiyse
-                    self.draw_paused(self.screen)
-                elif self.last_run_score > 0:  # Ölüm ekranından ayarlara girdiyse
-                    self.draw_shop(self.screen)
-                else:  # Menu'den ayarlara girdiyse
-                    self.draw_menu(self.screen)
-                self._draw_settings_menu(self.screen)
-            elif self.state == "shop":
-                try:
-                    self.draw_shop(self.screen)
-                except Exception as e:
-                    # If shop drawing fails, return to menu instead of crashing
-                    self.state = "menu"
-                    if not hasattr(self, 'shop_section'):
-                        self.shop_section = "main"
+            self.draw(keys)
             
-            # Apply fade overlay
-            if self.fade_alpha > 0:
-                fade_surf = pygame.Surface((Config.WINDOW_WIDTH, Config.WINDOW_HEIGHT), pygame.SRCALPHA)
-                fade_surf.fill((0, 0, 0, int(self.fade_alpha)))
-                self.screen.blit(fade_surf, (0, 0))
+            self.dirty.present()
+            self._mark_boot("first_frame_ms")
+            self.profiler.mark("flip")
+            self._persist()
+            self.profiler.end_frame()
+        
+        if self.store is not None:
+            self._persist()
+            self.store.close()
+        if self.history is not None:
+            self.history.close()
+        pygame.quit()
+    
+    def run_headless(self, ticks, render=False):
+        """Run `ticks` fixed simulation steps as fast as the CPU allows and report throughput"""
+        step = 1.0 / Config.SIMULATION_HZ
+        ticks_run = 0
+        runs_started = 0
+        start = time.perf_counter()
+        while ticks_run < ticks and self.running:
+            self.profiler.begin_frame()
+            keys, events = self.input.poll()
+            self.keys = keys
+            was_playing = self.state == "playing"
+            self.handle_events(events)
+            if self.state == "playing" and not was_playing:
+                runs_started += 1
+            self.profiler.mark("events")
             
-            pygame.display.flip()
-        
+            self._store_previous_positions()
+            self.update(step, keys)
+            if self.recorder is not None:
+                self.recorder.add_frame(1, keys, events)
+            self.profiler.mark("update_other")
+            if render:
+                self.render_alpha = 1.0
+                self.draw(keys)
+                self._mark_boot("first_frame_ms")
+            self.profiler.end_frame()
+            ticks_run += 1
+        elapsed = time.perf_counter() - start
+        
+        stats = {
+            "ticks": ticks_run,
+            "seconds": elapsed,
+            "ticks_per_sec": ticks_run / elapsed if elapsed > 0 else 0.0,
+            "simulated_seconds": ticks_run * step,
+            "runs_started": runs_started,
+            "state": self.state,
+            "high_score": int(self.high_score),
+            "total_gold": self.total_gold
+        }
+        stats["boot_ms"] = self.boot_times
+        if self.profiler.enabled:
+            stats["profile_ms"] = self.profiler.summary()
+            stats["audio"] = self.audio.stats()
+        return stats
+    
+    def simulation_digest(self):
+        """SHA-1 over the gameplay state; equal digests mean two simulations did not diverge"""
+        state = [self.state, self.current_score, self.game_time, self.total_gold, self.high_score]
+        if self.player is not None:
+            state.append((tuple(self.player.rect), self.player.velocity_x, self.player.velocity_y))
+        state.extend((tuple(m.rect), m.velocity_x, m.velocity_y, m.health) for m in self.meteors)
+        state.extend(tuple(b.rect) for b in self.bullets)
+        state.extend((tuple(c.rect), c.vx, c.vy, c.value) for c in self.coins)
+        return hashlib.sha1(repr(state).encode()).digest()
+    
+    def run_replay(self, replay, realtime=False):
+        """Play a Replay back through the simulation and return the resulting digest
+        
+        The game must have been created with seed=replay.seed. With realtime the frames
+        are drawn at the render cap, otherwise they are simulated as fast as possible.
+        """
+        step = 1.0 / replay.sim_hz
+        self.input = ReplayInput(replay)
+        while self.running and not self.input.finished():
+            keys, events = self.input.poll()
+            self.keys = keys
+            self.handle_events(events)
+            for _ in range(self.input.steps):
+                self._store_previous_positions()
+                self.update(step, keys)
+            if realtime:
+                self.render_alpha = 1.0
+                self.draw(keys)
+                self.dirty.present()
+                self._mark_boot("first_frame_ms")
+                self.clock.tick(Config.FPS)
+        return self.simulation_digest()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Infinite Orbit space shooter")
+    parser.add_argument("--headless", action="store_true",
+                        help="simulate without a window or audio using random input")
+    parser.add_argument("--ticks", type=int, default=Config.SIMULATION_HZ * 60,
+                        help="simulation steps to run in headless mode")
+    parser.add_argument("--input-seed", type=int, default=None,
+                        help="seed for the random headless input")
+    parser.add_argument("--render", action="store_true",
+                        help="also draw every step in headless mode (to an offscreen surface)")
+    parser.add_argument("--profile", action="store_true",
+                        help="collect per-phase frame timings (F3 toggles the overlay in-game)")
+    parser.add_argument("--bloom-scale", type=float, default=Config.BLOOM_SCALE,
+                        help="bloom buffer resolution factor (0.125-1)")
+    parser.add_argument("--bloom-strength", type=float, default=Config.BLOOM_STRENGTH,
+                        help="bloom intensity (0 disables bloom)")
+    parser.add_argument("--audio-buffer", type=int, default=Config.AUDIO_BUFFER,
+                        help="mixer buffer in samples (smaller = lower latency, too small crackles)")
+    parser.add_argument("--meteor-storm", action="store_true",
+                        help=f"allow up to {Config.METEOR_STORM_MAX_METEORS} meteors on screen and spawn "
+                             "them in large batches (cannot be recorded)")
+    parser.add_argument("--dirty-rects", action="store_true",
+                        help="present only changed screen regions instead of flipping every frame "
+                             "(the menu starfield stands still)")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="session seed for all gameplay randomness")
+    parser.add_argument("--record", metavar="PATH",
+                        help="record the session's input to a replay file")
+    parser.add_argument("--replay", metavar="PATH",
+                        help="play a replay file back and verify its final state")
+    parser.add_argument("--leaderboard", action="store_true",
+                        help="print the best runs overall and of today, then exit")
+    args = parser.parse_args()
+    if args.meteor_storm and (args.record or args.replay):
+        parser.error("--meteor-storm cannot be combined with --record or --replay")
+    
+    if args.leaderboard:
+        history = RunHistory()
+        today = time.strftime("%Y-%m-%d")
+        print(json.dumps({
+            "top": [run._asdict() for run in history.top()],
+            "today": [run._asdict() for run in history.top(day=today)]
+        }, indent=2))
+        return
+    
+    if args.replay:
+        try:
+            replay = Replay.load(args.replay)
+        except (OSError, ValueError, struct.error, zlib.error) as e:
+            parser.error(f"cannot load replay {args.replay}: {e}")
+        game = Game(headless=args.headless, seed=replay.seed)
+        digest = game.run_replay(replay, realtime=not args.headless)
         pygame.quit()
+        print(json.dumps({
+            "frames": len(replay.frames),
+            "seed": replay.seed,
+            "digest": digest.hex(),
+            "matches_recording": digest == replay.final_digest
+        }, indent=2))
+        return
+    
+    if args.headless:
+        game = Game(headless=True, input_source=RandomInput(args.input_seed), seed=args.seed)
+    else:
+        # A recording must start from the default profile, so it neither loads nor saves one
+        store = SaveStore() if not args.record else None
+        game = Game(seed=args.seed, audio_buffer=args.audio_buffer, store=store, history=RunHistory())
+    game.bloom.configure(args.bloom_scale, args.bloom_strength)
+    if args.meteor_storm:
+        game.set_meteor_storm(True)
+    if args.dirty_rects:
+        game.dirty.enabled = True
+    if args.record:
+        game.recorder = Replay(game.seed)
+    if args.profile:
+        game.profiler.toggle()
+    
+    if args.headless:
+        stats = game.run_headless(args.ticks, render=args.render)
+        pygame.quit()
+        print(json.dumps(stats, indent=2))
+    else:
+        game.run()
+        if args.profile:
+            report = {"boot_ms": game.boot_times, "audio": game.audio.stats()}
+            if game.store is not None:
+                report["save"] = game.store.stats()
+            print(json.dumps(report, indent=2))
+    
+    if game.recorder is not None:
+        game.recorder.final_digest = game.simulation_digest()
+        game.recorder.save(args.record)
 
 
 if __name__ == "__main__":
-    game = Game()
-    game.run()
+    main()
@@ -0,0 +1,36 @@
+import copy
+
+import pygame
+import pytest
+
+import benchmark
+from main import Game
+
+
+@pytest.fixture(scope="module")
+def results():
+    game = Game(headless=True, seed=1234)
+    benchmark._finish_loading(game)
+    scenarios = {name: benchmark.run_repeated(game, name, 60, 10, 1234, 2)
+                 for name in ("menu_idle", "meteors_12")}
+    pygame.quit()
+    return {"scenarios": scenarios}
+
+
+def test_self_comparison_has_no_regressions(results):
+    assert benchmark.compare(results, results) == []
+    assert benchmark.compare(results, copy.deepcopy(results), tolerance=0.0) == []
+
+
+def test_changes_below_the_noise_floor_are_ignored(results):
+    current = copy.deepcopy(results)
+    for scenario in current["scenarios"].values():
+        scenario["frame_ms"]["p99"] += benchmark.NOISE_FLOORS["frame_ms.p99"] * 0.9
+    assert benchmark.compare(current, results, tolerance=0.0) == []
+
+
+def test_real_slowdown_is_flagged(results):
+    current = copy.deepcopy(results)
+    current["scenarios"]["meteors_12"]["ticks_per_sec"] *= 0.5
+    regressions = benchmark.compare(current, results)
+    assert [(r["scenario"], r["metric"]) for r in regressions] == [("meteors_12", "ticks_per_sec")]
@@ -0,0 +1,66 @@
+import random
+
+import pygame
+import pytest
+
+from main import MeteorField, SweepAndPrune
+
+
+class Box:
+    def __init__(self, rect):
+        self.rect = rect
+
+
+def random_rect(rng, max_size):
+    return pygame.Rect(rng.randint(-50, 1300), rng.randint(-50, 750),
+                       rng.randint(0, max_size), rng.randint(0, max_size))
+
+
+def brute_radius(entities, x, y, radius):
+    return [entity for entity in entities
+            if entity.rect.width > 0 and entity.rect.height > 0
+            and (entity.rect.centerx - x) ** 2 + (entity.rect.centery - y) ** 2 < radius * radius]
+
+
+@pytest.mark.parametrize("min_pairs", [SweepAndPrune.MIN_PAIRS, 0], ids=["scan", "sweep"])
+def test_queries_match_brute_force(monkeypatch, min_pairs):
+    monkeypatch.setattr(SweepAndPrune, "MIN_PAIRS", min_pairs)
+    rng = random.Random(1)
+    for _ in range(150):
+        boxes = [Box(random_rect(rng, 90)) for _ in range(rng.choice([0, 1, 5, 50, 300]))]
+        rects = [random_rect(rng, 200) for _ in range(rng.choice([1, 3, 40]))]
+        index = SweepAndPrune()
+        index.rebuild(boxes)
+        removed = [box for box in boxes if rng.random() < 0.1]
+        for box in removed:
+            index.remove(box)
+        kept = [box for box in boxes if box not in removed]
+
+        assert index.query_rects(rects) == [[box for box in kept if box.rect.colliderect(rect)]
+                                            for rect in rects]
+        assert index.query_rect(rects[0]) == [box for box in kept if box.rect.colliderect(rects[0])]
+        x, y, radius = rng.randint(0, 1280), rng.randint(0, 720), rng.choice([0, 1, 10, 150, 400])
+        assert index.query_radius(x, y, radius) == brute_radius(kept, x, y, radius)
+
+
+@pytest.mark.parametrize("min_pairs", [SweepAndPrune.MIN_PAIRS, 0], ids=["scan", "sweep"])
+def test_meteor_field_queries_match_brute_force(monkeypatch, min_pairs):
+    monkeypatch.setattr(SweepAndPrune, "MIN_PAIRS", min_pairs)
+    rng = random.Random(2)
+    field = MeteorField(capacity=1000, seed=5)
+    for _ in range(40):
+        field.spawn(rng.randint(0, 80), target_pos=(640, 600))
+        for _ in range(rng.randint(1, 10)):
+            field.update(1 / 120)
+        for meteor in list(field.active):
+            if rng.random() < 0.05:
+                field.kill(meteor)
+        if rng.random() < 0.3:
+            field.flush()
+        live = [meteor for meteor in field.active if meteor.alive]
+        rects = [random_rect(rng, 60) for _ in range(rng.choice([1, 5, 100]))]
+
+        assert field.query_rects(rects) == [[meteor for meteor in live if meteor.rect.colliderect(rect)]
+                                            for rect in rects]
+        x, y, radius = rng.randint(0, 1280), rng.randint(0, 720), rng.choice([50, 150, 500])
+        assert field.query_radius(x, y, radius) == brute_radius(live, x, y, radius)
@@ -0,0 +1,42 @@
+import pytest
+
+from main import ParticleSystem
+
+
+def test_burst_is_clamped_to_capacity():
+    particles = ParticleSystem(capacity=8, seed=1)
+    particles.emit_burst(0, 0, 5, (1, 2), (2, 3), [0])
+    particles.emit_burst(0, 0, 5, (1, 2), (2, 3), [1])
+    assert len(particles) == 8
+    assert particles.color[:8].tolist() == [0] * 5 + [1] * 3
+    particles.emit_burst(0, 0, 5, (1, 2), (2, 3), [2])  # Full: dropped
+    assert len(particles) == 8
+
+
+def test_update_moves_and_compacts_survivors():
+    particles = ParticleSystem(capacity=10, seed=1)
+    particles.emit_burst(0, 0, 4, (1, 1), (2, 2), [0], life=0.1)  # Gone within three ticks
+    particles.emit_burst(100, 50, 4, (2, 2), (5, 5), [3], life=1.0)
+    particles.emit_burst(200, 0, 5, (2, 2), (4, 4), [4], life=1.0)  # Only 2 fit
+    assert len(particles) == 10
+    start = [(float(particles.x[slot]), float(particles.y[slot]), float(particles.vx[slot]),
+              float(particles.vy[slot]), int(particles.size[slot]), int(particles.color[slot]))
+             for slot in range(4, 10)]
+
+    dt = 0.05  # Each tick moves by velocity * 3 and adds 2.5 to vy
+    for _ in range(3):
+        particles.update(dt)
+
+    assert len(particles) == 6
+    survivors = sorted(zip(particles.vx[:6].tolist(), particles.x[:6].tolist(), particles.y[:6].tolist(),
+                           particles.vy[:6].tolist(), particles.life[:6].tolist(),
+                           particles.size[:6].tolist(), particles.color[:6].tolist()))
+    expected = sorted((vx, x + 9 * vx, y + 9 * vy + 22.5, vy + 7.5, 0.85, size, color)
+                      for x, y, vx, vy, size, color in start)
+    for got, want in zip(survivors, expected):
+        assert got == pytest.approx(want, abs=1e-3)
+    assert sorted(particles.color[:6].tolist()) == [3, 3, 3, 3, 4, 4]
+
+    for _ in range(20):
+        particles.update(dt)
+    assert len(particles) == 0
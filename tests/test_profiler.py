@@ -0,0 +1,31 @@
+import time
+
+from main import FrameProfiler
+
+
+def test_toggle_mid_frame_waits_for_next_frame():
+    profiler = FrameProfiler()
+    profiler.begin_frame()  # Disabled: nothing is opened
+    profiler.toggle()  # F3 pressed while the frame is being handled
+    profiler.mark("events")
+    profiler.end_frame()
+    assert profiler.frames == 0
+
+    profiler.begin_frame()
+    profiler.mark("events")
+    profiler.end_frame()
+    assert profiler.frames == 1
+    assert profiler.summary()["events"]["mean"] < 1000.0
+
+
+def test_marks_accumulate_per_phase():
+    profiler = FrameProfiler()
+    profiler.toggle()
+    profiler.begin_frame()
+    time.sleep(0.002)
+    profiler.mark("events")
+    profiler.mark("player")
+    profiler.end_frame()
+    summary = profiler.summary()
+    assert summary["events"]["mean"] >= 2.0
+    assert summary["frame"]["mean"] >= summary["events"]["mean"]
@@ -0,0 +1,25 @@
+import pytest
+
+from main import Replay
+
+
+def test_round_trip():
+    replay = Replay(1234)
+    replay.frames.append((2, 0b101, ((Replay.EVENT_KEYDOWN, 32),)))
+    replay.final_digest = bytes(range(20))
+    loaded = Replay.from_bytes(replay.to_bytes())
+    assert (loaded.seed, loaded.frames, loaded.final_digest) == (1234, replay.frames, replay.final_digest)
+
+
+def test_older_version_is_rejected():
+    data = bytearray(Replay(1).to_bytes())
+    data[len(Replay.MAGIC)] = Replay.VERSION - 1
+    with pytest.raises(ValueError, match=f"version {Replay.VERSION - 1} is not supported"):
+        Replay.from_bytes(bytes(data))
+
+
+def test_foreign_file_is_rejected():
+    with pytest.raises(ValueError, match="Not a replay file"):
+        Replay.from_bytes(b"ORB")
+    with pytest.raises(ValueError, match="Not a replay file"):
+        Replay.from_bytes(b"PK\x03\x04" + bytes(Replay.HEADER.size))
@@ -0,0 +1,52 @@
+import time
+
+from main import RunHistory
+
+
+def insert_runs(history, runs):
+    """Rows for earlier days straight into the database, ids in order"""
+    connection = history.connect()
+    with connection:
+        connection.executemany(
+            "INSERT INTO runs (finished_at, day, score, duration, gold, loadout, seed) "
+            "VALUES (0, ?, ?, 30.0, 5, ?, 1)", runs)
+    connection.close()
+
+
+def scores(runs):
+    return [(run.id, run.score) for run in runs]
+
+
+def test_top_overall_per_day_and_per_loadout(tmp_path):
+    history = RunHistory(str(tmp_path / "runs.sqlite3"), board_size=3)
+    insert_runs(history, [("2026-01-01", 50, "none"), ("2026-01-01", 80, "magnet"),
+                          ("2026-01-02", 80, "none"), ("2026-01-02", 10, "magnet"),
+                          ("2026-01-03", 30, "magnet")])
+
+    # Best first, ties in insertion order
+    assert scores(history.top(3)) == [(2, 80), (3, 80), (1, 50)]
+    assert scores(history.top(10)) == [(2, 80), (3, 80), (1, 50), (5, 30), (4, 10)]
+    assert scores(history.top(day="2026-01-02")) == [(3, 80), (4, 10)]
+    assert scores(history.top(loadout="magnet")) == [(2, 80), (5, 30), (4, 10)]
+    assert scores(history.top(day="2026-01-01", loadout="none")) == [(1, 50)]
+    assert history.top(day="2025-12-31") == []
+
+
+def test_cached_board_follows_recorded_runs(tmp_path):
+    history = RunHistory(str(tmp_path / "runs.sqlite3"), board_size=3)
+    insert_runs(history, [("2026-01-01", 50, "none"), ("2026-01-01", 80, "magnet"),
+                          ("2026-01-02", 80, "none")])
+    history.start()
+    history.record(60, 12.5, 3, "shield", 7)  # Pushes the 50 off the board
+    history.record(5, 2.0, 0, "none", 8)  # Too low to change it
+    history.record(90, 40.0, 9, "shield", 9)
+    history.close()
+
+    assert history.errors == 0
+    assert history.last_run_id == 6
+    assert scores(history.top_runs) == [(6, 90), (2, 80), (3, 80)]
+    assert history.top_runs == tuple(history.top(3))  # The merged cache matches a fresh query
+    today = time.strftime("%Y-%m-%d")
+    assert scores(history.top(day=today)) == [(6, 90), (4, 60), (5, 5)]
+    shield_runs = history.top(loadout="shield")
+    assert [(run.loadout, run.seed) for run in shield_runs] == [("shield", 9), ("shield", 7)]
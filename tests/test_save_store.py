@@ -0,0 +1,62 @@
+import time
+
+import pytest
+
+from main import Config, SaveStore
+
+
+@pytest.fixture(autouse=True)
+def fast_writes(monkeypatch):
+    monkeypatch.setattr(Config, "SAVE_COALESCE_SECONDS", 0.0)
+    monkeypatch.setattr(Config, "SAVE_JOURNAL_LIMIT", 3)
+
+
+def wait_acknowledged(store):
+    deadline = time.monotonic() + 5.0
+    while store.acknowledged < store.serial:
+        assert time.monotonic() < deadline, "save was never acknowledged"
+        time.sleep(0.001)
+
+
+def test_acknowledged_states_survive_abandoned_store(tmp_path):
+    path = str(tmp_path / "save.json")
+    store = SaveStore(path)
+    assert store.load() is None
+    store.start()
+    for gold in range(8):  # Crosses two journal-to-snapshot folds
+        store.save({"gold": gold})
+        wait_acknowledged(store)
+        # The process could die right here: no close(), no final snapshot
+        assert SaveStore(path).load() == {"gold": gold}
+    assert store.errors == 0
+
+
+def test_torn_and_corrupt_trailing_records_are_skipped(tmp_path):
+    path = str(tmp_path / "save.json")
+    store = SaveStore(path)
+    store.load()
+    store.start()
+    for gold in (1, 2):
+        store.save({"gold": gold})
+        wait_acknowledged(store)
+
+    journal = path + ".journal"
+    intact = open(journal, encoding="utf-8").read()
+    torn = SaveStore.encode({"serial": 3, "state": {"gold": 3}})
+    with open(journal, "a", encoding="utf-8") as f:
+        f.write(torn[:len(torn) // 2])  # Power cut mid-append
+    reloaded = SaveStore(path)
+    assert reloaded.load() == {"gold": 2}
+    assert reloaded.journal_torn
+
+    # The next append starts on a fresh line instead of running on from the torn one
+    reloaded.start()
+    reloaded.save({"gold": 4})
+    wait_acknowledged(reloaded)
+    assert SaveStore(path).load() == {"gold": 4}
+
+    corrupt = SaveStore.encode({"serial": 5, "state": {"gold": 5}}).replace('"gold":5', '"gold":6')
+    with open(journal, "w", encoding="utf-8") as f:
+        f.write(intact + corrupt)  # Complete line, but its checksum no longer matches
+    assert SaveStore.decode(corrupt) is None
+    assert SaveStore(path).load() == {"gold": 2}